@@ -21,6 +21,8 @@ def main_with_args():
                         help='Force refresh of all data files')
     parser.add_argument('--verbose', action='store_true',
                         help='Enable verbose logging')
+    parser.add_argument('--full-resync', action='store_true',
+                        help='Refetch all open issues instead of syncing changes since the last run')
     args = parser.parse_args()
     
     # Set environment variables based on arguments
@@ -28,6 +30,10 @@ def main_with_args():
         print("Force refreshing all data")
         os.environ['FORCE_REFRESH'] = 'true'
     
+    if args.full_resync:
+        print("Forcing a full issue resync")
+        os.environ['FULL_RESYNC'] = 'true'
+
     if args.verbose:
         print("Enabling verbose logging")
         os.environ['VERBOSE'] = 'true'
@@ -14,6 +14,7 @@ from dotenv import load_dotenv
 import datetime
 # Import the label/text extractors AND the main bounty identification function
 from src.core.extractors import extract_from_labels, extract_from_text, is_bounty_issue
+from src.utils.rate_history import RateHistory, configured_history_path, format_erg_value_at
 from collections import Counter # Import Counter for statistics
 
 # --- Configuration ---
@@ -30,6 +31,7 @@ CONFIG_DIR = Path("src/config")
 TRACKED_ORGS_FILE = CONFIG_DIR / "tracked_orgs.json"
 TRACKED_REPOS_FILE = CONFIG_DIR / "tracked_repos.json"
 OUTPUT_FILE = Path("submissions/paid.md")
+RATE_HISTORY_FILE = configured_history_path() # Conversion rates recorded by the bounty finder
 HISTORICAL_HEADER = "## Closed Bounties" # Simplified header variable name
 
 # --- Helper Functions ---
@@ -152,13 +154,19 @@ def format_value(value, currency):
         val_str = str(value)
     return f"{val_str} {currency}" if currency else val_str
 
-def generate_markdown_table(submissions):
-    """Generates a Markdown table for a list of submissions (adapted for historical)."""
+def generate_markdown_table(submissions, rate_history=None):
+    """Generates a Markdown table for a list of submissions (adapted for historical).
+
+    With a rate history, an "ERG at Close" column values each bounty at the
+    conversion rates of its closed date.
+    """
     if not submissions:
         return "No closed bounties found.\n" # Updated message
 
     # Remove Contributor and Wallet Address headers
     headers = ["Work Title", "Value", "Reviewer", "Work Link", "Closed Date"]
+    if rate_history is not None:
+        headers.insert(2, "ERG at Close")
     table = "| " + " | ".join(headers) + " |\n"
     table += "| " + " | ".join(["---"] * len(headers)) + " |\n"
 
@@ -185,6 +193,8 @@ def generate_markdown_table(submissions):
             work_link_md,
             last_modified_date
         ]
+        if rate_history is not None:
+            row.insert(2, format_erg_value_at(value, currency, last_modified_date, rate_history))
         table += "| " + " | ".join(map(str, row)) + " |\n"
 
     return table
@@ -282,7 +292,9 @@ def main():
 
     # --- Generate Markdown Table ---
     # Pass all formatted issues, the writing logic handles replacement
-    historical_table = generate_markdown_table(formatted_issues)
+    historical_table = generate_markdown_table(
+        formatted_issues, RateHistory(RATE_HISTORY_FILE) if RATE_HISTORY_FILE else None
+    )
     # historical_content = f"\n{HISTORICAL_HEADER_NEW}\n\n{historical_table}\n" # Moved generation lower down
 
     try:
@@ -4,7 +4,8 @@ API Clients Package
 This package contains clients for various APIs used by the application:
 - GitHub API client for fetching repository and issue data
 - Currency API client for fetching exchange rates
+- Asyncio variants of both clients for concurrent scans
 """
 
-from .github_client import GitHubClient
-from .currency_client import CurrencyClient
+from .github_client import GitHubClient, AsyncGitHubClient
+from .currency_client import CurrencyClient, AsyncCurrencyClient
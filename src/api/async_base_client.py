@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Async Base API Client Module
+
+This module defines an asyncio variant of BaseClient. Requests run on a bounded
+thread pool that shares one keep-alive connection pool, so many requests can be
+in flight at once while the event loop stays free.
+
+Each request makes the same single attempts as BaseClient, but waits between
+retries and for rate limit resets with asyncio.sleep. Only the affected request
+waits; the rest of the scan carries on.
+"""
+
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Dict, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from src.api.base_client import DEFAULT_MAX_RETRY_DELAY, BaseClient, RetryRequest
+from src.api.host_health import HostHealth
+from src.api.http_cache import HttpCache
+from src.api.rate_limiter import RateLimiter
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_CONNECTIONS = 16
+
+
+class AsyncBaseClient(BaseClient):
+    """
+    Base class for asyncio API clients.
+    Shares session setup, caching and response handling with BaseClient.
+    """
+
+    def __init__(
+        self,
+        base_url: str = "",
+        timeout: int = 30,
+        max_retries: int = 3,
+        retry_delay: int = 5,
+        cache: Optional[HttpCache] = None,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        rate_limiter: Optional[RateLimiter] = None,
+        host_health: Optional[HostHealth] = None,
+        max_retry_delay: float = DEFAULT_MAX_RETRY_DELAY,
+    ):
+        """
+        Initialize the async API client.
+
+        Args:
+            base_url: Base URL for the API
+            timeout: Request timeout in seconds
+            max_retries: Maximum number of retries for failed requests
+            retry_delay: Base delay in seconds of the exponential backoff between retries
+            cache: Optional conditional-GET cache shared by JSON GET requests
+            max_connections: Maximum number of requests in flight and of pooled
+                keep-alive connections per host
+            rate_limiter: Optional scheduler that paces requests by the budget reported
+                in rate limit response headers; may be shared between clients
+            host_health: Optional per-host circuit breakers and histograms; may be
+                shared between clients (default: one per client)
+            max_retry_delay: Upper bound in seconds of the backoff between retries
+        """
+        super().__init__(
+            base_url=base_url,
+            timeout=timeout,
+            max_retries=max_retries,
+            retry_delay=retry_delay,
+            cache=cache,
+            rate_limiter=rate_limiter,
+            host_health=host_health,
+            max_retry_delay=max_retry_delay,
+        )
+        self.max_connections = max_connections
+        adapter = HTTPAdapter(pool_connections=max_connections, pool_maxsize=max_connections)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_connections, thread_name_prefix=type(self).__name__
+        )
+
+    async def _run(self, func, *args, **kwargs) -> Any:
+        """Run a blocking call on the client's request pool."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, partial(func, *args, **kwargs))
+
+    async def _make_json_request(
+        self,
+        url: str,
+        method: str = "GET",
+        headers: Optional[Dict[str, str]] = None,
+        data: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[Optional[BaseClient.JsonResponse], Optional[Dict[str, Dict[str, str]]]]:
+        """
+        Make a request to the API with retry logic and rate limit handling.
+
+        Args:
+            url: API endpoint URL
+            method: HTTP method (default: GET)
+            headers: Optional headers to include in the request
+            data: Optional data to send in the request body
+
+        Returns:
+            Tuple of (response JSON data, pagination links), as BaseClient._make_json_request
+        """
+        full_url, merged_headers, use_cache = self._prepare_request(url, method, headers)
+
+        for attempt in range(self.max_retries):
+            delay = self._acquire_slot(full_url)
+            if delay > 0:
+                logger.debug(f"Pacing request to {url}: waiting {delay:.1f} seconds")
+                await asyncio.sleep(delay)
+            try:
+                return await self._run(
+                    self._attempt_request, url, full_url, method, merged_headers, data, use_cache
+                )
+            except (RetryRequest, requests.exceptions.RequestException) as e:
+                wait = self._handle_failed_attempt(url, attempt, e)
+            if wait > 0:
+                await asyncio.sleep(wait)
+
+        return None, None
+
+    def close(self) -> None:
+        """Shut down the request pool and close pooled connections."""
+        self._executor.shutdown(wait=True)
+        self.session.close()
+
+    async def __aenter__(self) -> "AsyncBaseClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        self.close()
@@ -4,24 +4,63 @@ Base API Client Module
 
 This module defines a base class for API clients, providing common
 functionality such as session management, rate limiting, and error handling.
+
+Failed requests are retried only when a retry can succeed: connection errors,
+timeouts, 5xx replies and rate limits. Other 4xx replies fail immediately.
+Retries back off exponentially with full jitter, and a per-host circuit breaker
+fails requests fast once a host is clearly down.
 """
 
 import logging
+import random
 import time
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+from urllib.parse import urlparse
 
 import requests
 
+from src.api.host_health import CircuitOpenError, HostHealth
+from src.api.http_cache import HttpCache
+from src.api.rate_limiter import DEFAULT_RESOURCE, SECONDARY_LIMIT_DELAY, SECONDARY_LIMIT_MARKERS, RateLimiter
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
+class RetryRequest(Exception):
+    """Raised by a single request attempt that should be repeated after a delay."""
+
+    def __init__(self, delay: float, reason: str):
+        super().__init__(reason)
+        self.delay = delay
+
+
+class ClientError(requests.exceptions.HTTPError):
+    """Raised for a 4xx reply that cannot succeed when retried."""
+
+
+# 4xx replies worth retrying: request timeout and too many requests
+RETRYABLE_CLIENT_ERRORS = {408, 429}
+
+DEFAULT_MAX_RETRY_DELAY = 60
+
+
 class BaseClient:
     """
     Base class for API clients.
     Handles session management, rate limiting, and error handling.
     """
 
-    def __init__(self, base_url: str = "", timeout: int = 30, max_retries: int = 3, retry_delay: int = 5):
+    def __init__(
+        self,
+        base_url: str = "",
+        timeout: int = 30,
+        max_retries: int = 3,
+        retry_delay: int = 5,
+        cache: Optional[HttpCache] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        host_health: Optional[HostHealth] = None,
+        max_retry_delay: float = DEFAULT_MAX_RETRY_DELAY,
+    ):
         """
         Initialize the API client.
 
@@ -29,17 +68,238 @@ class BaseClient:
             base_url: Base URL for the API
             timeout: Request timeout in seconds
             max_retries: Maximum number of retries for failed requests
-            retry_delay: Delay in seconds between retries
+            retry_delay: Base delay in seconds of the exponential backoff between retries
+            cache: Optional conditional-GET cache shared by JSON GET requests
+            rate_limiter: Optional scheduler that paces requests by the budget reported
+                in rate limit response headers; may be shared between clients
+            host_health: Optional per-host circuit breakers and histograms; may be
+                shared between clients (default: one per client)
+            max_retry_delay: Upper bound in seconds of the backoff between retries
         """
         self.base_url = base_url
         self.timeout = timeout
         self.max_retries = max_retries
         self.retry_delay = retry_delay
+        self.max_retry_delay = max_retry_delay
+        self.cache = cache
+        self.rate_limiter = rate_limiter
+        self.host_health = host_health if host_health is not None else HostHealth()
         self.session = requests.Session()
         self.session.headers.update({"Content-Type": "application/json"})
 
     JsonResponse = Union[Dict[str, Any], List[Any]]
 
+    def _prepare_request(
+        self, url: str, method: str, headers: Optional[Dict[str, str]]
+    ) -> Tuple[str, Dict[str, str], bool]:
+        """
+        Resolve the request URL and headers shared by all attempts of a request.
+
+        Args:
+            url: API endpoint URL (absolute, or relative to base_url)
+            method: HTTP method
+            headers: Optional headers to include in the request
+
+        Returns:
+            Tuple of (full URL, request headers, whether the cache applies)
+        """
+        merged_headers = self.session.headers.copy()
+        if headers:
+            merged_headers.update(headers)
+
+        full_url = url if url.startswith("http") else self.base_url + url
+        use_cache = self.cache is not None and method.upper() == "GET"
+        if use_cache:
+            merged_headers.update(self.cache.conditional_headers(full_url))
+        return full_url, merged_headers, use_cache
+
+    def _rate_limit_resource(self, full_url: str) -> str:
+        """Name of the rate limit budget a request to full_url counts against."""
+        return DEFAULT_RESOURCE
+
+    def _acquire_slot(self, full_url: str) -> float:
+        """
+        Reserve a rate limiter slot for the next attempt.
+
+        Returns:
+            Seconds to wait before sending the attempt (0 without a rate limiter)
+        """
+        if self.rate_limiter is None:
+            return 0
+        return self.rate_limiter.acquire(self._rate_limit_resource(full_url))
+
+    def _backoff_delay(self, attempt: int) -> float:
+        """
+        Delay before retrying a failed attempt: exponential backoff with full jitter.
+
+        Args:
+            attempt: Zero-based number of the failed attempt
+
+        Returns:
+            Random delay between 0 and min(max_retry_delay, retry_delay * 2 ** attempt)
+        """
+        return random.uniform(0, min(self.max_retry_delay, self.retry_delay * 2 ** attempt))
+
+    def _send(self, full_url: str, send: Callable[[], requests.Response]) -> requests.Response:
+        """
+        Send a request through the circuit breaker of its host and record its outcome.
+
+        Args:
+            full_url: Request URL
+            send: Callable sending the request
+
+        Returns:
+            The response
+
+        Raises:
+            CircuitOpenError: The host's circuit is open; nothing was sent
+            requests.exceptions.RequestException: The request failed without a response
+        """
+        host = urlparse(full_url).netloc
+        self.host_health.before_request(host)
+        started = time.monotonic()
+        try:
+            response = send()
+        except requests.exceptions.RequestException as exc:
+            self.host_health.record_exception(host, exc, time.monotonic() - started)
+            raise
+        self.host_health.record_response(host, response.status_code, time.monotonic() - started)
+        return response
+
+    def _get(self, url: str, timeout: Optional[float] = None) -> requests.Response:
+        """
+        Send a single GET request for a non-JSON-API caller, with circuit breaking and metrics.
+
+        Args:
+            url: Absolute request URL
+            timeout: Request timeout in seconds (default: the client timeout)
+
+        Returns:
+            The response, whatever its status code
+        """
+        return self._send(url, lambda: self.session.get(url, timeout=timeout or self.timeout))
+
+    def _attempt_request(
+        self,
+        url: str,
+        full_url: str,
+        method: str,
+        headers: Dict[str, str],
+        data: Optional[Dict[str, Any]],
+        use_cache: bool,
+    ) -> Tuple[JsonResponse, Dict[str, Dict[str, str]]]:
+        """
+        Make a single request attempt without sleeping.
+
+        Args:
+            url: API endpoint URL as passed by the caller (for log messages)
+            full_url: Resolved request URL
+            method: HTTP method
+            headers: Request headers; conditional headers are dropped in place when
+                a 304 reply can no longer be served from the cache
+            data: Optional data to send in the request body
+            use_cache: Whether to serve 304 replies from and store responses in the cache
+
+        Returns:
+            Tuple of (response JSON data, pagination links)
+
+        Raises:
+            RetryRequest: The request should be repeated after RetryRequest.delay seconds
+            ClientError: The request was rejected with a 4xx reply that a retry cannot fix
+            CircuitOpenError: The host's circuit is open
+            requests.exceptions.RequestException: The attempt failed
+        """
+        response = self._send(full_url, lambda: self.session.request(
+            method=method,
+            url=full_url,
+            headers=headers,
+            json=data,
+            timeout=self.timeout
+        ))
+
+        # Check for rate limiting
+        if self.rate_limiter is not None:
+            body = response.text if response.status_code in (403, 429) else ""
+            if self.rate_limiter.update(
+                response.status_code, response.headers, self._rate_limit_resource(full_url), body
+            ) is not None:
+                # The wait is applied by the next acquire
+                raise RetryRequest(0, "Rate limit exceeded")
+        elif response.status_code in (403, 429):
+            remaining = response.headers.get('X-RateLimit-Remaining')
+            if remaining is not None and int(remaining) == 0:
+                reset_time = int(response.headers['X-RateLimit-Reset'])
+                raise RetryRequest(max(1, reset_time - time.time()), "Rate limit exceeded")
+            if 'Retry-After' in response.headers:
+                raise RetryRequest(float(response.headers['Retry-After']), "Rate limit exceeded")
+            if any(marker in response.text.lower() for marker in SECONDARY_LIMIT_MARKERS):
+                raise RetryRequest(SECONDARY_LIMIT_DELAY, "Secondary rate limit exceeded")
+
+        if use_cache and response.status_code == 304:
+            cached = self.cache.get(full_url)
+            if cached is not None:
+                logger.debug(f"Not modified, serving from cache: {full_url}")
+                return cached["body"], cached["links"]
+            # Entry was evicted after the validators were sent; refetch in full
+            headers.pop("If-None-Match", None)
+            headers.pop("If-Modified-Since", None)
+            raise RetryRequest(0, "Cache entry evicted")
+
+        if 400 <= response.status_code < 500 and response.status_code not in RETRYABLE_CLIENT_ERRORS:
+            raise ClientError(f"HTTP {response.status_code} for URL: {url}", response=response)
+        response.raise_for_status()
+        try:
+            payload = response.json()
+        except ValueError as exc:
+            logger.error("Expected JSON response from URL: %s", url)
+            raise requests.exceptions.RequestException(
+                f"Expected JSON response from URL: {url}"
+            ) from exc
+
+        if use_cache:
+            self.cache.store(
+                full_url,
+                payload,
+                response.links,
+                response.headers.get("ETag"),
+                response.headers.get("Last-Modified"),
+            )
+        return payload, response.links
+
+    def _handle_failed_attempt(self, url: str, attempt: int, error: Exception) -> float:
+        """
+        Decide how to continue after a failed request attempt.
+
+        Shared by the retry loops of BaseClient and AsyncBaseClient, which only
+        differ in how they wait.
+
+        Args:
+            url: API endpoint URL as passed by the caller (for log messages)
+            attempt: Zero-based number of the failed attempt
+            error: RetryRequest or RequestException raised by _attempt_request
+
+        Returns:
+            Seconds to wait before the next attempt
+
+        Raises:
+            ClientError, CircuitOpenError: The request cannot succeed when retried
+            requests.exceptions.RequestException: This was the last attempt
+        """
+        if isinstance(error, RetryRequest):
+            if error.delay > 0:
+                logger.warning(f"{error}. Waiting {error.delay} seconds before retrying {url}")
+            return error.delay
+
+        if isinstance(error, (ClientError, CircuitOpenError)):
+            logger.error(f"Request failed without retry: {error}")
+            raise error
+
+        logger.warning(f"Request failed (attempt {attempt+1}/{self.max_retries}): {error}")
+        if attempt < self.max_retries - 1:
+            return self._backoff_delay(attempt)
+        logger.error(f"Max retries exceeded for URL: {url}")
+        raise requests.exceptions.RequestException(f"Max retries exceeded for URL: {url}") from error
+
     def _make_json_request(
         self,
         url: str,
@@ -59,47 +319,21 @@ class BaseClient:
         Returns:
             Tuple of (response JSON data, pagination links). Non-JSON responses are
             treated as invalid API responses instead of being passed downstream as text.
+            When a cache is configured, GET requests are sent with the stored validators
+            and a 304 reply is served from the cache.
         """
-        merged_headers = self.session.headers.copy()
-        if headers:
-            merged_headers.update(headers)
+        full_url, merged_headers, use_cache = self._prepare_request(url, method, headers)
 
         for attempt in range(self.max_retries):
+            delay = self._acquire_slot(full_url)
+            if delay > 0:
+                logger.debug(f"Pacing request to {url}: sleeping for {delay:.1f} seconds")
+                time.sleep(delay)
             try:
-                full_url = url if url.startswith("http") else self.base_url + url
-                response = self.session.request(
-                    method=method,
-                    url=full_url,
-                    headers=merged_headers,
-                    json=data,
-                    timeout=self.timeout
-                )
-
-                # Check for rate limiting
-                if response.status_code in (403, 429) and 'X-RateLimit-Remaining' in response.headers:
-                    remaining = int(response.headers['X-RateLimit-Remaining'])
-                    if remaining == 0:
-                        reset_time = int(response.headers['X-RateLimit-Reset'])
-                        sleep_time = max(1, reset_time - time.time())
-                        logger.warning(f"Rate limit exceeded. Sleeping for {sleep_time} seconds")
-                        time.sleep(sleep_time)
-                        continue
-
-                response.raise_for_status()
-                try:
-                    return response.json(), response.links
-                except ValueError as exc:
-                    logger.error("Expected JSON response from URL: %s", url)
-                    raise requests.exceptions.RequestException(
-                        f"Expected JSON response from URL: {url}"
-                    ) from exc
-
-            except requests.exceptions.RequestException as e:
-                logger.warning(f"Request failed (attempt {attempt+1}/{self.max_retries}): {e}")
-                if attempt < self.max_retries - 1:
-                    time.sleep(self.retry_delay)
-                else:
-                    logger.error(f"Max retries exceeded for URL: {url}")
-                    raise requests.exceptions.RequestException(f"Max retries exceeded for URL: {url}")
+                return self._attempt_request(url, full_url, method, merged_headers, data, use_cache)
+            except (RetryRequest, requests.exceptions.RequestException) as e:
+                wait = self._handle_failed_attempt(url, attempt, e)
+            if wait > 0:
+                time.sleep(wait)
 
         return None, None
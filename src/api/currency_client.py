@@ -3,21 +3,99 @@
 Currency API Client Module
 
 This module handles fetching and processing of currency exchange rates from various sources:
-- Spectrum API for crypto tokens (SigUSD, GORT, RSN)
+- Spectrum API for crypto tokens (SigUSD, GORT, RSN and any configured token)
 - Ergo Explorer API for accessing the Gold/ERG oracle pool data
 
 It provides a consistent interface for getting up-to-date conversion rates that 
 are used throughout the application for calculating bounty values.
+
+With a rate cache, recently fetched rates are reused without calling the APIs, and a
+rate that cannot be fetched falls back to its last known good value before the
+hardcoded default. The source of every rate (live, cached or default) and its age
+are kept in ``rate_provenance``, and live rates can be appended to a RateHistory.
+
+Spectrum and the oracle pool are queried concurrently, and fetch_rates_in_background()
+lets callers start both fetches and only wait for them when a rate is first needed.
 """
 
+import asyncio
 import logging
-from typing import Dict, List, Any, Optional
+import os
+import time
+from collections.abc import Mapping
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Iterator, List, Any, Optional, Set, Tuple
 
+from src.api.async_base_client import AsyncBaseClient
 from src.api.base_client import BaseClient
+from src.api.rate_cache import RateCache
+from src.utils.rate_history import CONVERSION_MAP, RateHistory, convert_to_erg
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Tokens priced from their ERG market on Spectrum, unless configured otherwise
+DEFAULT_SPECTRUM_TOKENS = ("SigUSD", "GORT", "RSN")
+
+
+def _market_volume(market: Dict[str, Any]) -> float:
+    try:
+        return float(market.get("baseVolume", {}).get("value", 0))
+    except (AttributeError, TypeError, ValueError):
+        return 0.0
+
+
+def index_markets(markets: List[Dict[str, Any]]) -> Dict[Tuple[str, str], Dict[str, Any]]:
+    """
+    Index Spectrum markets by trading pair in a single pass.
+
+    Args:
+        markets: Decoded Spectrum markets response
+
+    Returns:
+        Dictionary mapping (baseSymbol, quoteSymbol) to the pair's market with the
+        highest base volume (the first listed market on ties)
+    """
+    best: Dict[Tuple[str, str], Dict[str, Any]] = {}
+    volumes: Dict[Tuple[str, str], float] = {}
+    for market in markets:
+        pair = (market.get("baseSymbol"), market.get("quoteSymbol"))
+        volume = _market_volume(market)
+        if pair not in best or volume > volumes[pair]:
+            best[pair] = market
+            volumes[pair] = volume
+    return best
+
+
+class PendingRates(Mapping):
+    """
+    Conversion rates fetched in the background.
+
+    Behaves like the read-only rates dictionary; the first lookup waits for the
+    fetch to finish.
+    """
+
+    def __init__(self, future: "Future[Dict[str, float]]"):
+        self._future = future
+
+    def result(self) -> Dict[str, float]:
+        """Wait for the fetch and return the rates."""
+        return self._future.result()
+
+    def __getitem__(self, currency: str) -> float:
+        return self.result()[currency]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.result())
+
+    def __len__(self) -> int:
+        return len(self.result())
+
+    def __repr__(self) -> str:
+        if not self._future.done():
+            return "PendingRates(<fetching>)"
+        return f"PendingRates({self.result()!r})"
+
 
 class CurrencyClient(BaseClient):
     """
@@ -36,15 +114,36 @@ class CurrencyClient(BaseClient):
     # Token identifiers
     XAU_ERG_ORACLE_NFT = "3c45f29a5165b030fdb5eaf5d81f8108f9d8f507b31487dd51f4ae08fe07cf4a"
 
-    def __init__(self, timeout: int = 30):
+    # Conversion logic per currency (shared with the payment status generator)
+    CONVERSION_MAP = CONVERSION_MAP
+
+    def __init__(
+        self,
+        timeout: int = 30,
+        rate_cache: Optional[RateCache] = None,
+        spectrum_tokens: Optional[List[str]] = None,
+        rate_history: Optional[RateHistory] = None,
+    ):
         """
         Initialize the currency client.
 
         Args:
             timeout: Request timeout in seconds
+            rate_cache: Optional persisted rates reused within their TTL and used as
+                last known good values when an API fails
+            spectrum_tokens: Tokens priced from their ERG market on Spectrum
+                (defaults to SigUSD, GORT and RSN)
+            rate_history: Optional time series every set of live rates is appended to
         """
         super().__init__(timeout=timeout)
         self.rates = {}
+        self.rate_cache = rate_cache
+        self.rate_history = rate_history
+        self.spectrum_tokens = tuple(spectrum_tokens or DEFAULT_SPECTRUM_TOKENS)
+        # Rates fetched from the APIs; BENE is derived from SigUSD
+        self.live_currencies = self.spectrum_tokens + ("gGOLD",)
+        self.rate_provenance: Dict[str, Dict[str, Any]] = {}
+        self._live: Set[str] = set()
 
     def get_all_rates(self) -> Dict[str, float]:
         """
@@ -53,8 +152,46 @@ class CurrencyClient(BaseClient):
         Returns:
             Dictionary mapping currency codes to their ERG exchange rate
         """
+        self._set_default_rates()
+        if self._cached_rates_are_fresh():
+            return self._finalize_rates()
+
+        # Get crypto token rates from Spectrum and the gold price from the oracle pool
+        # concurrently; each fetch falls back to defaults on its own failures
+        with ThreadPoolExecutor(max_workers=2, thread_name_prefix="rates") as executor:
+            fetches = [executor.submit(self._fetch_spectrum_rates), executor.submit(self._fetch_gold_price)]
+            for fetch in fetches:
+                fetch.result()
+
+        return self._finalize_rates()
+
+    def fetch_rates_in_background(self) -> PendingRates:
+        """
+        Start fetching all conversion rates without waiting for them.
+
+        Returns:
+            Rates that wait for the fetch to finish when first read
+        """
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="rates")
+        future = executor.submit(self.get_all_rates)
+        # The worker thread exits once the fetch is done
+        executor.shutdown(wait=False)
+        return PendingRates(future)
+
+    def _cached_rates_are_fresh(self) -> bool:
+        """Whether every rate can be taken from the rate cache without fetching."""
+        if self.rate_cache is None or os.environ.get("FORCE_REFRESH", "").lower() == "true":
+            return False
+        if not self.rate_cache.is_fresh(self.live_currencies):
+            return False
+        logger.info("Using cached conversion rates")
+        return True
+
+    def _set_default_rates(self) -> None:
+        """Reset the rates to the defaults used when API calls fail."""
         # Clear existing rates
         self.rates = {}
+        self._live = set()
 
         # Set initial default rates in case API calls fail
         self.rates["SigUSD"] = 0.819389
@@ -62,8 +199,28 @@ class CurrencyClient(BaseClient):
         self.rates["RSN"] = 18.563417
         self.rates["BENE"] = 0.819389
 
-        # Get crypto token rates from Spectrum
-        self._fetch_spectrum_rates()
+    def _set_live_rate(self, currency: str, rate: float) -> None:
+        """Record a rate fetched from an API."""
+        self.rates[currency] = rate
+        self._live.add(currency)
+
+    def _finalize_rates(self) -> Dict[str, float]:
+        """
+        Derive dependent rates and fill in defaults for rates that could not be fetched.
+
+        Returns:
+            Dictionary mapping currency codes to their ERG exchange rate
+        """
+        cached_at: Dict[str, float] = {}
+        if self.rate_cache is not None:
+            if self._live:
+                self.rate_cache.store({currency: self.rates[currency] for currency in self._live})
+                self.rate_cache.save()
+            # Last known good rates replace the hardcoded defaults
+            for currency, (rate, fetched_at) in self.rate_cache.entries().items():
+                if currency not in self._live:
+                    self.rates[currency] = rate
+                    cached_at[currency] = fetched_at
 
         # Set BENE rate (equivalent to $1 worth of ERG)
         if "SigUSD" in self.rates:
@@ -74,61 +231,77 @@ class CurrencyClient(BaseClient):
         else:
             logger.warning("SigUSD rate not available, using default for BENE")
 
-        # Get gold price from oracle pool
-        self._fetch_gold_price()
-
         # Set default gold price if fetching failed
         if "gGOLD" not in self.rates:
             self.rates["gGOLD"] = 84.032555
             logger.warning("Gold price not available from oracle, using default rate")
 
+        now = time.time()
+        self.rate_provenance = {}
+        for currency in self.rates:
+            # BENE is derived from SigUSD and shares its source
+            source = "SigUSD" if currency == "BENE" else currency
+            if source in self._live:
+                self.rate_provenance[currency] = {"source": "live", "age": 0.0}
+            elif source in cached_at:
+                self.rate_provenance[currency] = {"source": "cached", "age": max(0.0, now - cached_at[source])}
+            else:
+                self.rate_provenance[currency] = {"source": "default", "age": None}
+
+        if self.rate_history is not None:
+            self.rate_history.append({
+                currency: self.rates[currency]
+                for currency, provenance in self.rate_provenance.items()
+                if provenance["source"] == "live"
+            }, now=now)
+
         logger.info(f"Conversion rates: {self.rates}")
         return self.rates
 
     def _fetch_spectrum_rates(self) -> None:
         """
         Fetch crypto token rates from Spectrum API.
-        Updates the internal rates dictionary with SigUSD, GORT, and RSN rates.
+        Updates the internal rates dictionary with the configured token rates.
         """
         try:
             logger.info("Fetching market data from Spectrum API")
-            response = self.session.get(self.SPECTRUM_API_URL, timeout=self.timeout)
+            response = self._get(self.SPECTRUM_API_URL, timeout=self.timeout)
 
             if response.status_code != 200:
                 logger.error(f"Error fetching Spectrum API data: {response.status_code}")
                 return
 
-            markets = response.json()
+            self._apply_spectrum_markets(response.json())
+
+        except Exception as e:
+            logger.error(f"Error fetching or processing Spectrum rates: {e}")
+
+    def _apply_spectrum_markets(self, markets: List[Dict[str, Any]]) -> None:
+        """
+        Update the rates from Spectrum market data.
+
+        Args:
+            markets: Decoded Spectrum markets response
+        """
+        try:
             logger.debug(f"Spectrum API returned {len(markets)} markets")
+            by_pair = index_markets(markets)
 
-            # Target tokens to fetch from Spectrum
-            target_tokens = ["SigUSD", "GORT", "RSN"]
-
-            for token in target_tokens:
-                token_markets = [
-                    m for m in markets
-                    if m.get("quoteSymbol") == token and m.get("baseSymbol") == "ERG"
-                ]
-
-                if token_markets:
-                    # Special sorting for SigUSD by volume
-                    if token == "SigUSD" and "baseVolume" in token_markets[0]:
-                        token_markets.sort(
-                            key=lambda m: float(m.get("baseVolume", {}).get("value", 0)),
-                            reverse=True,
-                        )
-                    
-                    # Use the price from the first market (highest volume for SigUSD)
-                    try:
-                        self.rates[token] = float(token_markets[0].get("lastPrice"))
-                        logger.info(f"Found {token} rate: {self.rates[token]}")
-                    except (ValueError, TypeError, IndexError) as price_error:
-                         logger.error(f"Error processing price for {token} from market data {token_markets[0]}: {price_error}")
-                else:
+            for token in self.spectrum_tokens:
+                market = by_pair.get(("ERG", token))
+                if market is None:
                     logger.warning(f"No {token} markets found in API data")
+                    continue
+
+                # Use the price from the pair's highest volume market
+                try:
+                    self._set_live_rate(token, float(market.get("lastPrice")))
+                    logger.info(f"Found {token} rate: {self.rates[token]}")
+                except (ValueError, TypeError) as price_error:
+                    logger.error(f"Error processing price for {token} from market data {market}: {price_error}")
 
         except Exception as e:
-            logger.error(f"Error fetching or processing Spectrum rates: {e}")
+            logger.error(f"Error processing Spectrum rates: {e}")
 
     def _fetch_gold_price(self) -> None:
         """
@@ -141,13 +314,25 @@ class CurrencyClient(BaseClient):
             oracle_url = (
                 f"{self.ERGO_EXPLORER_API}/boxes/unspent/byTokenId/{self.XAU_ERG_ORACLE_NFT}"
             )
-            response = self.session.get(oracle_url, timeout=60)  # Higher timeout for Explorer API
+            response = self._get(oracle_url, timeout=60)  # Higher timeout for Explorer API
 
             if response.status_code != 200:
                 logger.error(f"Oracle API returned status code {response.status_code}")
                 return
 
-            oracle_data = response.json()
+            self._apply_oracle_data(response.json())
+
+        except Exception as e:
+            logger.error(f"Error fetching gold price: {e}")
+
+    def _apply_oracle_data(self, oracle_data: Dict[str, Any]) -> None:
+        """
+        Update the gold price from XAU/ERG oracle pool boxes.
+
+        Args:
+            oracle_data: Decoded Explorer unspent boxes response
+        """
+        try:
             if not oracle_data.get("items") or len(oracle_data["items"]) == 0:
                 logger.error("No oracle pool boxes found")
                 return
@@ -182,10 +367,10 @@ class CurrencyClient(BaseClient):
             gold_price_per_gram_erg = (10**18) / (r4_value * 100)
 
             logger.info(f"Gold price from oracle: {gold_price_per_gram_erg:.6f} ERG per gram")
-            self.rates["gGOLD"] = gold_price_per_gram_erg
+            self._set_live_rate("gGOLD", gold_price_per_gram_erg)
 
         except Exception as e:
-            logger.error(f"Error fetching gold price: {e}")
+            logger.error(f"Error processing gold price: {e}")
 
     def calculate_erg_value(
         self,
@@ -228,34 +413,123 @@ class CurrencyClient(BaseClient):
         Returns:
             ERG equivalent amount as a float, or 0 if conversion not possible
         """
+        return convert_to_erg(amount, currency, rates)
+
+
+class AsyncCurrencyClient(CurrencyClient, AsyncBaseClient):
+    """
+    Asyncio variant of CurrencyClient.
+    Fetches the Spectrum markets and the gold oracle concurrently.
+    """
+
+    async def get_all_rates(self) -> Dict[str, float]:
+        """
+        Get conversion rates for all supported currencies.
+
+        Returns:
+            Dictionary mapping currency codes to their ERG exchange rate
+        """
+        self._set_default_rates()
+        if not self._cached_rates_are_fresh():
+            await asyncio.gather(self._fetch_spectrum_rates(), self._fetch_gold_price())
+        return self._finalize_rates()
+
+    async def _fetch_spectrum_rates(self) -> None:
+        """
+        Fetch crypto token rates from Spectrum API.
+        Updates the internal rates dictionary with the configured token rates.
+        """
         try:
-            amount_float = float(amount)
-            if currency == "ERG":
-                return amount_float
-
-            # Define conversion logic: rate key and operation (divide or multiply)
-            conversion_map = {
-                "SigUSD": ("SigUSD", "divide"),
-                "GORT": ("GORT", "divide"),
-                "RSN": ("RSN", "divide"),
-                "BENE": ("BENE", "divide"),
-                "g GOLD": ("gGOLD", "multiply"),
-            }
-
-            if currency in conversion_map:
-                rate_key, operation = conversion_map[currency]
-                if rate_key in rates:
-                    rate = rates[rate_key]
-                    if operation == "divide":
-                        return amount_float / rate if rate != 0 else 0.0
-                    elif operation == "multiply":
-                        return amount_float * rate
-                else:
-                    logger.warning(f"Missing conversion rate for {rate_key} used by {currency}")
-                    return 0.0
-            else:
-                logger.warning(f"Unknown currency: {currency}")
-                return 0.0
-        except (ValueError, TypeError) as e:
-            logger.error(f"Error converting {amount} {currency} to ERG: {e}")
-            return 0.0
+            logger.info("Fetching market data from Spectrum API")
+            response = await self._run(self._get, self.SPECTRUM_API_URL, timeout=self.timeout)
+
+            if response.status_code != 200:
+                logger.error(f"Error fetching Spectrum API data: {response.status_code}")
+                return
+
+            self._apply_spectrum_markets(response.json())
+
+        except Exception as e:
+            logger.error(f"Error fetching or processing Spectrum rates: {e}")
+
+    async def _fetch_gold_price(self) -> None:
+        """
+        Fetch gold price from the XAU/ERG oracle pool.
+        Updates the internal rates dictionary with gold price.
+        """
+        try:
+            logger.info("Getting gold price from XAU/ERG oracle pool")
+
+            oracle_url = (
+                f"{self.ERGO_EXPLORER_API}/boxes/unspent/byTokenId/{self.XAU_ERG_ORACLE_NFT}"
+            )
+            response = await self._run(self._get, oracle_url, timeout=60)  # Higher timeout for Explorer API
+
+            if response.status_code != 200:
+                logger.error(f"Oracle API returned status code {response.status_code}")
+                return
+
+            self._apply_oracle_data(response.json())
+
+        except Exception as e:
+            logger.error(f"Error fetching gold price: {e}")
+
+
+class ErgValuation:
+    """
+    ERG values of a list of bounties, computed once in a single pass.
+
+    Generators share one instance per run instead of converting the same bounty
+    again for every sort, row, total and page. Values are memoized per
+    (amount, currency) pair, so repeated amounts are converted only once.
+    """
+
+    def __init__(
+        self,
+        bounty_data: List[Dict[str, Any]],
+        conversion_rates: Dict[str, float],
+    ):
+        """
+        Compute the ERG value of every bounty.
+
+        Args:
+            bounty_data: List of bounty records or dictionaries
+            conversion_rates: Dictionary of currency conversion rates
+        """
+        self._currency_client = CurrencyClient()
+        self._currency_client.rates = conversion_rates
+        self._by_pair: Dict[Tuple[str, str], float] = {}
+        # Keep the list alive so the object ids used as keys stay unique
+        self._bounty_data = bounty_data
+        self.values = [self._pair_value(b["amount"], b["currency"]) for b in bounty_data]
+        self._by_id = {id(bounty): value for bounty, value in zip(bounty_data, self.values, strict=True)}
+
+        # Bounty records cache their value, so it travels with them
+        from src.core.bounty import Bounty
+        for bounty, value in zip(bounty_data, self.values, strict=True):
+            if isinstance(bounty, Bounty):
+                bounty.erg_value = value
+
+    def _pair_value(self, amount: str, currency: str) -> float:
+        key = (amount, currency)
+        value = self._by_pair.get(key)
+        if value is None:
+            value = self._currency_client.calculate_erg_value(amount, currency)
+            self._by_pair[key] = value
+        return value
+
+    def value(self, bounty: Dict[str, Any]) -> float:
+        """
+        Get the ERG value of a bounty.
+
+        Args:
+            bounty: Bounty data dictionary (bounties outside the original list are
+                converted on demand)
+
+        Returns:
+            ERG value as a float, or 0 if conversion not possible
+        """
+        value = self._by_id.get(id(bounty))
+        if value is None:
+            value = self._pair_value(bounty["amount"], bounty["currency"])
+        return value
@@ -10,16 +10,167 @@ Primary interactions:
 - Fetching organization repositories
 - Fetching repository language information
 - Fetching issues from repositories
+- Searching open issues across repositories and organizations
+
+With read-ahead enabled, paginated listings fetch the next page in the background
+while the caller handles the current one; when GitHub reports the last page, the
+remaining pages are fetched in parallel (bounded by the read-ahead pool).
 """
 
 import logging
-from typing import List, Dict, Any, Optional, Tuple
+import re
+from urllib.parse import quote
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Deque, List, Dict, Any, Iterator, Optional, Tuple
 
+from src.api.async_base_client import DEFAULT_MAX_CONNECTIONS, AsyncBaseClient
 from src.api.base_client import BaseClient
+from src.api.http_cache import HttpCache
+from src.api.rate_limiter import DEFAULT_RESOURCE, RateLimiter
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+GITHUB_API_URL = "https://api.github.com"
+
+PAGE_PARAM_PATTERN = re.compile(r"([?&]page=)(\d+)")
+
+# GitHub rejects search queries longer than 256 characters
+SEARCH_QUERY_MAX_LENGTH = 256
+# The search API returns at most this many results per query
+SEARCH_RESULT_LIMIT = 1000
+
+
+class IncompleteListingError(Exception):
+    """Raised when a paginated listing that must be complete stops before its last page."""
+
+
+def _page_items(data: Any, url: str, items_key: Optional[str] = None) -> Optional[List[Dict[str, Any]]]:
+    """
+    Validate one page of a paginated listing.
+
+    Args:
+        data: Decoded JSON body of the page
+        url: URL of the page (for logging)
+        items_key: Key of the item list when the page is an object (search results)
+
+    Returns:
+        The items of the page, or None when pagination should stop
+    """
+    if data is None: # Check for None explicitly, as empty list is valid
+        logger.warning(f"Request failed or returned no data for {url}")
+        return None # Stop pagination if request fails
+
+    if items_key is not None and isinstance(data, dict):
+        if data.get("incomplete_results") or data.get("total_count", 0) > SEARCH_RESULT_LIMIT:
+            logger.warning(f"Search results are incomplete for {url}; narrow the query to see every match")
+        data = data.get(items_key)
+
+    # Ensure data is a list before using it
+    if not isinstance(data, list):
+        logger.error(f"Expected a list but got {type(data)} for {url}")
+        return None # Stop if the data format is unexpected
+
+    return data
+
+
+def _next_page_url(links: Optional[Dict[str, Dict[str, str]]]) -> Optional[str]:
+    """Get the URL of the next page from the pagination links of a page."""
+    return links.get("next", {}).get("url") if links else None
+
+
+def _remaining_page_urls(links: Optional[Dict[str, Dict[str, str]]]) -> Optional[List[str]]:
+    """
+    Build the URLs of all remaining pages from the "next" and "last" links of a page.
+
+    Returns:
+        Page URLs from the next page through the last page, or None when the links
+        do not name both pages by number
+    """
+    if not links or "next" not in links or "last" not in links:
+        return None
+    next_match = PAGE_PARAM_PATTERN.search(links["next"].get("url", ""))
+    last_url = links["last"].get("url", "")
+    last_match = PAGE_PARAM_PATTERN.search(last_url)
+    if not next_match or not last_match:
+        return None
+    first, last = int(next_match.group(2)), int(last_match.group(2))
+    return [
+        PAGE_PARAM_PATTERN.sub(rf"\g<1>{page}", last_url, count=1)
+        for page in range(first, last + 1)
+    ]
+
+
+def build_search_queries(
+    base_query: str, qualifiers: List[str], max_length: int = SEARCH_QUERY_MAX_LENGTH
+) -> List[str]:
+    """
+    Split qualifiers such as ``org:name`` or ``repo:owner/name`` over as few search
+    queries as possible, each no longer than max_length.
+
+    Args:
+        base_query: Query terms every query starts with
+        qualifiers: Qualifiers matched by any one of them (GitHub ORs repeated qualifiers)
+        max_length: Maximum query length in characters
+
+    Returns:
+        Search queries covering every qualifier
+    """
+    queries: List[str] = []
+    current = base_query
+    for qualifier in qualifiers:
+        if current != base_query and len(current) + 1 + len(qualifier) > max_length:
+            queries.append(current)
+            current = base_query
+        current = f"{current} {qualifier}"
+    if current != base_query:
+        queries.append(current)
+    return queries
+
+
+def _top_languages(data: Any, owner: str, repo: str) -> List[str]:
+    """
+    Get the top 2 languages from a /languages response.
+
+    Args:
+        data: Decoded JSON body mapping language names to bytes of code
+        owner: Repository owner (for logging)
+        repo: Repository name (for logging)
+
+    Returns:
+        List of languages (top 2 by usage)
+    """
+    if not data:
+        return []
+    if not isinstance(data, dict):
+        logger.error("Expected language mapping but got %s for %s/%s", type(data), owner, repo)
+        return []
+    # Sort languages by bytes of code and get top 2 (or all if fewer than 2)
+    sorted_languages = sorted(data.items(), key=lambda x: x[1], reverse=True)[:2]
+    result = [lang[0] for lang in sorted_languages]
+
+    logger.debug(f"Languages for {owner}/{repo}: {result}")
+    return result
+
+
+def _github_resource(full_url: str) -> str:
+    """Name of the GitHub rate limit budget a request URL counts against."""
+    path = full_url[len(GITHUB_API_URL):] if full_url.startswith(GITHUB_API_URL) else full_url
+    if path.startswith("/search/"):
+        return "search"
+    if path.startswith("/graphql"):
+        return "graphql"
+    return DEFAULT_RESOURCE
+
+
+def _issues_url(owner: str, repo: str, state: str, since: Optional[str]) -> str:
+    """Build the first page URL of a repository issue listing."""
+    url = f"/repos/{owner}/{repo}/issues?state={state}&per_page=100"
+    if since:
+        url += f"&since={since}"
+    return url
+
 
 class GitHubClient(BaseClient):
     """
@@ -27,7 +178,15 @@ class GitHubClient(BaseClient):
     Handles authentication, rate limiting, and provides methods for common API operations.
     """
 
-    def __init__(self, token: str, max_retries: int = 3, retry_delay: int = 5):
+    def __init__(
+        self,
+        token: str,
+        max_retries: int = 3,
+        retry_delay: int = 5,
+        cache: Optional[HttpCache] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        read_ahead_workers: int = 0,
+    ):
         """
         Initialize the GitHub API client.
 
@@ -35,53 +194,167 @@ class GitHubClient(BaseClient):
             token: GitHub API token for authentication
             max_retries: Maximum number of retries for failed requests
             retry_delay: Delay in seconds between retries
+            cache: Optional conditional-GET cache for issue, language and repository listings
+            rate_limiter: Optional scheduler shared by all clients using the same token
+            read_ahead_workers: Pages of paginated listings fetched in the background at
+                once, shared by all listings of the client (0 disables read-ahead)
         """
         super().__init__(
-            base_url="https://api.github.com",
+            base_url=GITHUB_API_URL,
             timeout=30,
             max_retries=max_retries,
             retry_delay=retry_delay,
+            cache=cache,
+            rate_limiter=rate_limiter,
         )
         self.token = token
         self.session.headers.update({"Authorization": f"token {token}"})
+        self.read_ahead_workers = max(0, int(read_ahead_workers))
+        self._read_ahead_pool: Optional[ThreadPoolExecutor] = None
+        if self.read_ahead_workers:
+            self._read_ahead_pool = ThreadPoolExecutor(
+                max_workers=self.read_ahead_workers, thread_name_prefix="github-read-ahead"
+            )
 
-    def _fetch_paginated_data(self, url: str, item_type: str = "items") -> List[Dict[str, Any]]:
+    def _rate_limit_resource(self, full_url: str) -> str:
+        return _github_resource(full_url)
+
+    def iter_paginated_data(
+        self,
+        url: str,
+        item_type: str = "items",
+        items_key: Optional[str] = None,
+        require_complete: bool = False,
+    ) -> Iterator[Dict[str, Any]]:
         """
-        Helper method to fetch data from paginated GitHub API endpoints.
+        Yield the items of a paginated GitHub API endpoint page by page.
+
+        Without read-ahead the next page is only requested once the items of the current
+        page have been consumed, so callers can filter items as they arrive instead of
+        holding every page in memory. With read-ahead, see _iter_read_ahead.
 
         Args:
             url: The initial API endpoint URL.
             item_type: A descriptive name for the items being fetched (for logging).
+            items_key: Key of the item list when pages are objects (search results)
+            require_complete: Raise instead of stopping quietly when a page fails
 
-        Returns:
-            A list containing all items fetched across all pages.
+        Yields:
+            The items of every page, in API order.
+
+        Raises:
+            IncompleteListingError: A page failed and require_complete is set
         """
-        all_items = []
+        if self._read_ahead_pool is not None:
+            yield from self._iter_read_ahead(url, item_type, items_key, require_complete)
+            return
+
         current_url: Optional[str] = url
         page_num = 1
+        total = 0
 
         logger.debug(f"Fetching paginated {item_type} starting with URL: {current_url}")
 
         while current_url:
             data, links = self._make_json_request(current_url)
-            if data is None: # Check for None explicitly, as empty list is valid
-                logger.warning(f"Request failed or returned no data for {current_url}")
-                break # Stop pagination if request fails
-
-            # Ensure data is a list before extending
-            if isinstance(data, list):
-                all_items.extend(data)
-                logger.debug(f"Page {page_num}: Fetched {len(data)} {item_type}, total: {len(all_items)}")
-            else:
-                 logger.error(f"Expected a list but got {type(data)} for {current_url}")
-                 break # Stop if the data format is unexpected
-
-            # Get the URL for the next page
-            current_url = links.get("next", {}).get("url") if links else None
+            items = _page_items(data, current_url, items_key)
+            if items is None:
+                if require_complete:
+                    raise IncompleteListingError(f"Listing of {item_type} stopped at page {page_num}: {current_url}")
+                break
+            total += len(items)
+            logger.debug(f"Page {page_num}: Fetched {len(items)} {item_type}, total: {total}")
+            current_url = _next_page_url(links)
             page_num += 1
+            yield from items
 
-        logger.info(f"Finished fetching paginated {item_type}. Total items: {len(all_items)}")
-        return all_items
+        logger.info(f"Finished fetching paginated {item_type}. Total items: {total}")
+
+    def _iter_read_ahead(
+        self, url: str, item_type: str, items_key: Optional[str] = None, require_complete: bool = False
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Yield the items of a paginated endpoint while later pages are fetched in the background.
+
+        The next page is requested as soon as its link arrives. When the first page also
+        links the last page, all remaining pages are requested in parallel, keeping at
+        most ``read_ahead_workers`` pages in flight or waiting to be consumed. Items are
+        still yielded in API order; pagination stops at the first failed page.
+
+        Args:
+            url: The initial API endpoint URL.
+            item_type: A descriptive name for the items being fetched (for logging).
+            items_key: Key of the item list when pages are objects (search results)
+            require_complete: Raise instead of stopping quietly when a page fails
+
+        Yields:
+            The items of every page, in API order.
+
+        Raises:
+            IncompleteListingError: A page failed and require_complete is set
+        """
+        ahead: Deque[Tuple[str, "Future[Any]"]] = deque()
+        fan_out: Optional[Iterator[str]] = None
+        current_url = url
+        response = self._make_json_request(url)
+        page_num = 1
+        total = 0
+
+        try:
+            while True:
+                data, links = response
+                items = _page_items(data, current_url, items_key)
+                if items is None:
+                    if require_complete:
+                        raise IncompleteListingError(
+                            f"Listing of {item_type} stopped at page {page_num}: {current_url}"
+                        )
+                    break
+                total += len(items)
+                logger.debug(f"Page {page_num}: Fetched {len(items)} {item_type}, total: {total}")
+
+                if page_num == 1:
+                    remaining = _remaining_page_urls(links)
+                    if remaining is not None:
+                        logger.debug(f"Fetching {len(remaining)} remaining pages of {item_type} in parallel")
+                        fan_out = iter(remaining)
+                if fan_out is not None:
+                    while len(ahead) < self.read_ahead_workers:
+                        page_url = next(fan_out, None)
+                        if page_url is None:
+                            break
+                        ahead.append((page_url, self._read_ahead_pool.submit(self._make_json_request, page_url)))
+                else:
+                    next_url = _next_page_url(links)
+                    if next_url:
+                        ahead.append((next_url, self._read_ahead_pool.submit(self._make_json_request, next_url)))
+
+                yield from items
+
+                if not ahead:
+                    break
+                current_url, future = ahead.popleft()
+                response = future.result()
+                page_num += 1
+        finally:
+            # The caller stopped early or a page failed; drop pages not yet started
+            for _, future in ahead:
+                future.cancel()
+
+        logger.info(f"Finished fetching paginated {item_type}. Total items: {total}")
+
+    def _fetch_paginated_data(self, url: str, item_type: str = "items") -> List[Dict[str, Any]]:
+        """
+        Helper method to fetch data from paginated GitHub API endpoints.
+
+        Args:
+            url: The initial API endpoint URL.
+            item_type: A descriptive name for the items being fetched (for logging).
+
+        Returns:
+            A list containing all items fetched across all pages.
+        """
+        return list(self.iter_paginated_data(url, item_type=item_type))
 
     def get_organization_repos(self, org: str) -> List[Dict[str, Any]]:
         """
@@ -112,20 +385,171 @@ class GitHubClient(BaseClient):
         logger.debug(f"Fetching languages for repository: {owner}/{repo}")
 
         data, _ = self._make_json_request(url)
-        if not data:
-            return []
-        if not isinstance(data, dict):
-            logger.error("Expected language mapping but got %s for %s/%s", type(data), owner, repo)
-            return []
-        # Sort languages by bytes of code and get top 2 (or all if fewer than 2)
-        sorted_languages = sorted(data.items(), key=lambda x: x[1], reverse=True)[:2]
-        result = [lang[0] for lang in sorted_languages]
-
-        logger.debug(f"Languages for {owner}/{repo}: {result}")
-        return result
+        return _top_languages(data, owner, repo)
 
     def get_repository_issues(
-        self, owner: str, repo: str, state: str = "open"
+        self, owner: str, repo: str, state: str = "open", since: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Get issues from a repository.
+
+        Args:
+            owner: Repository owner
+            repo: Repository name
+            state: Issue state (open, closed, all)
+            since: Optional ISO 8601 timestamp; only issues updated at or after it are returned
+
+        Returns:
+            List of issue objects
+        """
+        return list(self.iter_repository_issues(owner, repo, state=state, since=since))
+
+    def iter_repository_issues(
+        self,
+        owner: str,
+        repo: str,
+        state: str = "open",
+        since: Optional[str] = None,
+        require_complete: bool = False,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Yield issues from a repository page by page.
+
+        Args:
+            owner: Repository owner
+            repo: Repository name
+            state: Issue state (open, closed, all)
+            since: Optional ISO 8601 timestamp; only issues updated at or after it are returned
+            require_complete: Raise IncompleteListingError when a page fails instead
+                of ending the listing early
+
+        Returns:
+            Iterator over issue objects, fetched one page at a time
+        """
+        initial_url = _issues_url(owner, repo, state, since)
+        return self.iter_paginated_data(
+            initial_url, item_type=f"{state} issues", require_complete=require_complete
+        )
+
+    def iter_search_issues(self, query: str) -> Iterator[Dict[str, Any]]:
+        """
+        Yield the issues and pull requests matching a search query page by page.
+
+        Args:
+            query: GitHub search query, e.g. ``label:bounty state:open org:ergoplatform``
+
+        Returns:
+            Iterator over issue objects shaped like repository issues, plus the
+            ``repository_url`` of their repository
+        """
+        url = f"/search/issues?q={quote(query)}&per_page=100"
+        return self.iter_paginated_data(url, item_type="search results", items_key="items")
+
+
+class AsyncGitHubClient(AsyncBaseClient):
+    """
+    Asyncio client for the GitHub API with the list methods of GitHubClient:
+    get_organization_repos, get_repository_languages and get_repository_issues.
+    Each method is a coroutine; many repositories can be fetched concurrently
+    with asyncio.gather.
+
+    The streaming and search methods of GitHubClient (iter_paginated_data with
+    read-ahead and require_complete, iter_repository_issues, iter_search_issues)
+    are not implemented; get_repository_issues follows the "next" links one page
+    at a time.
+    """
+
+    def __init__(
+        self,
+        token: str,
+        max_retries: int = 3,
+        retry_delay: int = 5,
+        cache: Optional[HttpCache] = None,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        rate_limiter: Optional[RateLimiter] = None,
+    ):
+        """
+        Initialize the async GitHub API client.
+
+        Args:
+            token: GitHub API token for authentication
+            max_retries: Maximum number of retries for failed requests
+            retry_delay: Delay in seconds between retries
+            cache: Optional conditional-GET cache for issue, language and repository listings
+            max_connections: Maximum number of requests in flight
+            rate_limiter: Optional scheduler shared by all clients using the same token
+        """
+        super().__init__(
+            base_url=GITHUB_API_URL,
+            timeout=30,
+            max_retries=max_retries,
+            retry_delay=retry_delay,
+            cache=cache,
+            max_connections=max_connections,
+            rate_limiter=rate_limiter,
+        )
+        self.token = token
+        self.session.headers.update({"Authorization": f"token {token}"})
+
+    def _rate_limit_resource(self, full_url: str) -> str:
+        return _github_resource(full_url)
+
+    async def _fetch_paginated_data(self, url: str, item_type: str = "items") -> List[Dict[str, Any]]:
+        """
+        Helper method to fetch data from paginated GitHub API endpoints.
+
+        Args:
+            url: The initial API endpoint URL.
+            item_type: A descriptive name for the items being fetched (for logging).
+
+        Returns:
+            A list containing all items fetched across all pages.
+        """
+        all_items: List[Dict[str, Any]] = []
+        current_url: Optional[str] = url
+        page_num = 1
+
+        while current_url:
+            data, links = await self._make_json_request(current_url)
+            items = _page_items(data, current_url)
+            if items is None:
+                break
+            all_items.extend(items)
+            logger.debug(f"Page {page_num}: Fetched {len(items)} {item_type}, total: {len(all_items)}")
+            current_url = _next_page_url(links)
+            page_num += 1
+
+        logger.info(f"Finished fetching paginated {item_type}. Total items: {len(all_items)}")
+        return all_items
+
+    async def get_organization_repos(self, org: str) -> List[Dict[str, Any]]:
+        """
+        Get all repositories for an organization.
+
+        Args:
+            org: Organization name
+
+        Returns:
+            List of repository objects
+        """
+        return await self._fetch_paginated_data(f"/orgs/{org}/repos?per_page=100", item_type="repositories")
+
+    async def get_repository_languages(self, owner: str, repo: str) -> List[str]:
+        """
+        Get languages used in a repository, sorted by usage.
+
+        Args:
+            owner: Repository owner
+            repo: Repository name
+
+        Returns:
+            List of languages (top 2 by usage)
+        """
+        data, _ = await self._make_json_request(f"/repos/{owner}/{repo}/languages")
+        return _top_languages(data, owner, repo)
+
+    async def get_repository_issues(
+        self, owner: str, repo: str, state: str = "open", since: Optional[str] = None
     ) -> List[Dict[str, Any]]:
         """
         Get issues from a repository.
@@ -134,9 +558,11 @@ class GitHubClient(BaseClient):
             owner: Repository owner
             repo: Repository name
             state: Issue state (open, closed, all)
+            since: Optional ISO 8601 timestamp; only issues updated at or after it are returned
 
         Returns:
             List of issue objects
         """
-        initial_url = f"/repos/{owner}/{repo}/issues?state={state}&per_page=100"
-        return self._fetch_paginated_data(initial_url, item_type=f"{state} issues")
+        return await self._fetch_paginated_data(
+            _issues_url(owner, repo, state, since), item_type=f"{state} issues"
+        )
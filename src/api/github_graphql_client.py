@@ -0,0 +1,337 @@
+#!/usr/bin/env python3
+"""
+GitHub GraphQL Client Module
+
+This module provides an alternative GitHub backend that uses the GraphQL API to
+fetch many repositories per round trip. A single query returns, for every
+repository in the batch, its top languages together with its open issues and
+pull requests (labels, body, author, assignees and comment counts).
+
+Issues are converted to the shape returned by the REST ``/issues`` endpoint so the
+bounty processor produces identical bounty records for both backends. Repositories
+the GraphQL reply cannot fully describe are fetched through the REST API instead:
+those named by a GraphQL error (other than "not found"), those returned as null
+without one, and those with an issue carrying more labels or assignees than one
+query returns (``NESTED_PAGE_SIZE``).
+"""
+
+import logging
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from src.api.github_client import GitHubClient
+from src.api.http_cache import HttpCache
+from src.api.rate_limiter import RateLimiter
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+GRAPHQL_URL = "https://api.github.com/graphql"
+
+# The REST /issues endpoint lists pull requests as issues, so both are fetched
+CONNECTIONS = ("issues", "pullRequests")
+
+# Labels and assignees returned per issue (the GraphQL maximum); repositories with
+# an issue exceeding it are fetched through REST
+NESTED_PAGE_SIZE = 100
+
+PAGE_FRAGMENTS = f"""
+fragment IssuePage on IssueConnection {{
+  pageInfo {{ hasNextPage endCursor }}
+  nodes {{
+    number title state url body createdAt updatedAt
+    author {{ login }}
+    comments {{ totalCount }}
+    assignees(first: {NESTED_PAGE_SIZE}) {{ totalCount nodes {{ login }} }}
+    labels(first: {NESTED_PAGE_SIZE}) {{ totalCount nodes {{ name }} }}
+  }}
+}}
+fragment PullRequestPage on PullRequestConnection {{
+  pageInfo {{ hasNextPage endCursor }}
+  nodes {{
+    number title state url body createdAt updatedAt
+    author {{ login }}
+    comments {{ totalCount }}
+    assignees(first: {NESTED_PAGE_SIZE}) {{ totalCount nodes {{ login }} }}
+    labels(first: {NESTED_PAGE_SIZE}) {{ totalCount nodes {{ name }} }}
+  }}
+}}
+"""
+
+FRAGMENT_NAMES = {"issues": "IssuePage", "pullRequests": "PullRequestPage"}
+
+
+def _connection_field(connection: str, with_cursor: Optional[str] = None) -> str:
+    after = f", after: ${with_cursor}" if with_cursor else ""
+    return (
+        f"{connection}(first: $first{after}, states: OPEN, "
+        f"orderBy: {{field: CREATED_AT, direction: DESC}}) {{ ...{FRAGMENT_NAMES[connection]} }}"
+    )
+
+
+def _is_truncated(node: Dict[str, Any]) -> bool:
+    """Whether an issue node has more labels or assignees than the query returned."""
+    return any(
+        (node.get(field) or {}).get("totalCount", 0) > len((node.get(field) or {}).get("nodes", []))
+        for field in ("labels", "assignees")
+    )
+
+
+def _failed_aliases(errors: List[Dict[str, Any]]) -> Tuple[Optional[Set[str]], Set[str]]:
+    """
+    Find the repository aliases (``r0``, ``r1``, ...) affected by GraphQL errors.
+
+    Args:
+        errors: The "errors" list of a GraphQL response
+
+    Returns:
+        Tuple of (aliases with a failed field, or None when an error names no
+        path and the whole reply is suspect; aliases reported as not found)
+    """
+    failed: Set[str] = set()
+    not_found: Set[str] = set()
+    for error in errors:
+        path = error.get("path") or []
+        if not path:
+            return None, not_found
+        if error.get("type") == "NOT_FOUND" and len(path) == 1:
+            not_found.add(str(path[0]))
+        else:
+            failed.add(str(path[0]))
+    return failed, not_found
+
+
+def _to_rest_issue(node: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert a GraphQL issue or pull request node to the REST issue shape."""
+    author = node.get("author") or {}
+    return {
+        "number": node["number"],
+        "title": node.get("title", ""),
+        "state": str(node.get("state", "")).lower(),
+        "labels": [{"name": label["name"]} for label in (node.get("labels") or {}).get("nodes", [])],
+        "html_url": node.get("url", ""),
+        "body": node.get("body") or "",
+        "user": {"login": author.get("login", "ghost")},
+        "created_at": node.get("createdAt", ""),
+        "updated_at": node.get("updatedAt", ""),
+        "comments": (node.get("comments") or {}).get("totalCount", 0),
+        "assignees": [{"login": a["login"]} for a in (node.get("assignees") or {}).get("nodes", [])],
+    }
+
+
+class GitHubGraphQLClient(GitHubClient):
+    """
+    GitHub client that fetches languages and open issues for batches of
+    repositories through the GraphQL API.
+    """
+
+    def __init__(
+        self,
+        token: str,
+        max_retries: int = 3,
+        retry_delay: int = 5,
+        cache: Optional[HttpCache] = None,
+        graphql_url: str = GRAPHQL_URL,
+        page_size: int = 100,
+        rate_limiter: Optional[RateLimiter] = None,
+        read_ahead_workers: int = 0,
+    ):
+        """
+        Initialize the GitHub GraphQL client.
+
+        Args:
+            token: GitHub API token for authentication
+            max_retries: Maximum number of retries for failed requests
+            retry_delay: Delay in seconds between retries
+            cache: Optional conditional-GET cache for the inherited REST methods
+            graphql_url: GraphQL endpoint URL
+            page_size: Issues and pull requests requested per connection page (max 100)
+            rate_limiter: Optional scheduler shared by all clients using the same token
+            read_ahead_workers: Background page fetches of the inherited REST listings
+        """
+        super().__init__(
+            token,
+            max_retries=max_retries,
+            retry_delay=retry_delay,
+            cache=cache,
+            rate_limiter=rate_limiter,
+            read_ahead_workers=read_ahead_workers,
+        )
+        self.graphql_url = graphql_url
+        self.page_size = page_size
+
+    def _graphql(self, query: str, variables: Dict[str, Any]) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+        """
+        Run a GraphQL query.
+
+        Args:
+            query: GraphQL query document
+            variables: Query variables
+
+        Returns:
+            Tuple of (the "data" object of the response, the "errors" list); a reply
+            that is not a JSON object counts as one error without a path
+        """
+        data, _ = self._make_json_request(
+            self.graphql_url,
+            method="POST",
+            data={"query": query, "variables": variables},
+        )
+        if not isinstance(data, dict):
+            logger.error(f"Unexpected GraphQL response type: {type(data)}")
+            return {}, [{"message": "Unexpected GraphQL response"}]
+        errors = data.get("errors") or []
+        for error in errors:
+            logger.warning(f"GraphQL error: {error.get('message', error)}")
+        return data.get("data") or {}, errors
+
+    def _fetch_rest(self, repo: Dict[str, str]) -> Tuple[List[str], List[Dict[str, Any]]]:
+        """
+        Fetch the languages and open issues of a repository through the REST API.
+
+        Args:
+            repo: Repository object with 'owner' and 'repo' keys
+
+        Returns:
+            Tuple of (languages, issues sorted newest first)
+
+        Raises:
+            IncompleteListingError: The issue listing stopped before its last page
+        """
+        owner, name = repo["owner"], repo["repo"]
+        logger.info(f"Fetching {owner}/{name} through REST after an incomplete GraphQL reply")
+        languages = self.get_repository_languages(owner, name)
+        issues = list(self.iter_repository_issues(owner, name, require_complete=True))
+        issues.sort(key=lambda issue: issue["number"], reverse=True)
+        return languages, issues
+
+    def fetch_repositories(
+        self, repos: List[Dict[str, str]]
+    ) -> List[Tuple[List[str], List[Dict[str, Any]]]]:
+        """
+        Fetch languages and open issues for a batch of repositories.
+
+        Args:
+            repos: List of repository objects with 'owner' and 'repo' keys
+
+        Returns:
+            List of (languages, issues) tuples in the same order as repos. Issues are
+            shaped like REST issues and sorted newest first; repositories GitHub
+            reports as not found yield ([], []), and repositories the GraphQL
+            reply does not fully describe are fetched through REST.
+        """
+        if not repos:
+            return []
+
+        declarations = ["$first: Int!"]
+        fields = []
+        variables: Dict[str, Any] = {"first": self.page_size}
+        for i, repo in enumerate(repos):
+            declarations.append(f"$o{i}: String!, $n{i}: String!")
+            variables[f"o{i}"] = repo["owner"]
+            variables[f"n{i}"] = repo["repo"]
+            connections = "\n    ".join(_connection_field(c) for c in CONNECTIONS)
+            fields.append(
+                f"  r{i}: repository(owner: $o{i}, name: $n{i}) {{\n"
+                f"    languages(first: 2, orderBy: {{field: SIZE, direction: DESC}}) {{ nodes {{ name }} }}\n"
+                f"    {connections}\n"
+                f"  }}"
+            )
+        query = f"query({', '.join(declarations)}) {{\n" + "\n".join(fields) + "\n}\n" + PAGE_FRAGMENTS
+
+        logger.debug(f"Fetching {len(repos)} repositories via GraphQL")
+        data, errors = self._graphql(query, variables)
+        failed, not_found = _failed_aliases(errors)
+
+        results: List[Tuple[List[str], List[Dict[str, Any]]]] = []
+        pending: List[Tuple[int, str, str]] = []
+        nodes_by_repo: List[List[Dict[str, Any]]] = []
+        # Repositories to fetch through REST
+        fallback: Set[int] = set()
+        for i, repo in enumerate(repos):
+            alias = f"r{i}"
+            repo_data = data.get(alias)
+            if alias in not_found and not repo_data:
+                logger.warning(f"Repository not found via GraphQL: {repo['owner']}/{repo['repo']}")
+                results.append(([], []))
+                nodes_by_repo.append([])
+                continue
+            if failed is None or alias in failed or not repo_data:
+                fallback.add(i)
+                results.append(([], []))
+                nodes_by_repo.append([])
+                continue
+            languages = [node["name"] for node in repo_data["languages"]["nodes"]]
+            nodes: List[Dict[str, Any]] = []
+            for connection in CONNECTIONS:
+                page = repo_data[connection]
+                nodes.extend(page["nodes"])
+                if page["pageInfo"]["hasNextPage"]:
+                    pending.append((i, connection, page["pageInfo"]["endCursor"]))
+            results.append((languages, []))
+            nodes_by_repo.append(nodes)
+
+        while pending:
+            pending = self._fetch_next_pages(repos, pending, nodes_by_repo, fallback)
+
+        for i, nodes in enumerate(nodes_by_repo):
+            if i not in fallback and any(_is_truncated(node) for node in nodes):
+                fallback.add(i)
+            if i in fallback:
+                results[i] = self._fetch_rest(repos[i])
+                continue
+            issues = sorted((_to_rest_issue(node) for node in nodes), key=lambda issue: issue["number"], reverse=True)
+            results[i] = (results[i][0], issues)
+        return results
+
+    def _fetch_next_pages(
+        self,
+        repos: List[Dict[str, str]],
+        pending: List[Tuple[int, str, str]],
+        nodes_by_repo: List[List[Dict[str, Any]]],
+        fallback: Set[int],
+    ) -> List[Tuple[int, str, str]]:
+        """
+        Fetch the next page of every unfinished issue or pull request connection.
+
+        Args:
+            repos: Repository objects of the batch
+            pending: (repo index, connection name, cursor) of unfinished connections
+            nodes_by_repo: Collected nodes per repository, extended in place
+            fallback: Indexes of repositories to fetch through REST, extended in
+                place with repositories whose next page failed
+
+        Returns:
+            Connections that still have further pages
+        """
+        declarations = ["$first: Int!"]
+        fields = []
+        variables: Dict[str, Any] = {"first": self.page_size}
+        for k, (i, connection, cursor) in enumerate(pending):
+            declarations.append(f"$o{k}: String!, $n{k}: String!, $c{k}: String")
+            variables[f"o{k}"] = repos[i]["owner"]
+            variables[f"n{k}"] = repos[i]["repo"]
+            variables[f"c{k}"] = cursor
+            fields.append(
+                f"  r{k}: repository(owner: $o{k}, name: $n{k}) {{\n"
+                f"    {_connection_field(connection, with_cursor=f'c{k}')}\n"
+                f"  }}"
+            )
+        query = f"query({', '.join(declarations)}) {{\n" + "\n".join(fields) + "\n}\n" + PAGE_FRAGMENTS
+        data, errors = self._graphql(query, variables)
+        failed, _ = _failed_aliases(errors)
+
+        still_pending = []
+        for k, (i, connection, _) in enumerate(pending):
+            alias = f"r{k}"
+            repo_data = data.get(alias)
+            if failed is None or alias in failed or not repo_data:
+                logger.warning(
+                    f"Stopping {connection} pagination for {repos[i]['owner']}/{repos[i]['repo']}: no data returned"
+                )
+                fallback.add(i)
+                continue
+            page = repo_data[connection]
+            nodes_by_repo[i].extend(page["nodes"])
+            if page["pageInfo"]["hasNextPage"]:
+                still_pending.append((i, connection, page["pageInfo"]["endCursor"]))
+        return still_pending
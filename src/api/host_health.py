@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Host Health Module
+
+This module tracks the health of every API host a client talks to
+(api.github.com, api.spectrum.fi, api.ergoplatform.com):
+
+- A circuit breaker per host opens after consecutive failures (connection errors,
+  timeouts and 5xx replies) and fails requests fast instead of retrying against a
+  host that is clearly down. After a cool-down one trial request is let through;
+  it closes the circuit again on success.
+- Latency and error histograms per host are exposed through metrics().
+
+Client errors (4xx) and rate limit replies show the host is up and never open the circuit.
+"""
+
+import threading
+import time
+from bisect import bisect_left
+from typing import Any, Callable, Dict, List
+
+import requests
+
+DEFAULT_FAILURE_THRESHOLD = 5
+DEFAULT_RESET_TIMEOUT = 60.0
+
+# Upper bounds in seconds of the latency histogram buckets; slower requests land in "+Inf"
+LATENCY_BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half-open"
+
+
+class CircuitOpenError(requests.exceptions.RequestException):
+    """Raised instead of sending a request to a host whose circuit is open."""
+
+
+class _HostState:
+    """Circuit breaker state and histograms of one host."""
+
+    __slots__ = ("state", "consecutive_failures", "opened_at", "trial_in_flight", "requests", "latency", "errors")
+
+    def __init__(self) -> None:
+        self.state = CLOSED
+        self.consecutive_failures = 0
+        self.opened_at = 0.0
+        self.trial_in_flight = False
+        self.requests = 0
+        self.latency: List[int] = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.errors: Dict[str, int] = {}
+
+
+class HostHealth:
+    """
+    Per-host circuit breakers and request histograms.
+    Safe to share between threads and clients.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+        reset_timeout: float = DEFAULT_RESET_TIMEOUT,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize the tracker.
+
+        Args:
+            failure_threshold: Consecutive failures that open a host's circuit
+            reset_timeout: Seconds an open circuit fails fast before a trial request
+            clock: Monotonic clock in seconds
+        """
+        self.failure_threshold = max(1, int(failure_threshold))
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._hosts: Dict[str, _HostState] = {}
+
+    def before_request(self, host: str) -> None:
+        """
+        Check that a request may be sent to a host.
+
+        Args:
+            host: Host name of the request URL
+
+        Raises:
+            CircuitOpenError: The host's circuit is open
+        """
+        with self._lock:
+            state = self._hosts.setdefault(host, _HostState())
+            if state.state == CLOSED:
+                return
+            if state.state == OPEN and self._clock() - state.opened_at >= self.reset_timeout:
+                state.state = HALF_OPEN
+                state.trial_in_flight = False
+            if state.state == HALF_OPEN and not state.trial_in_flight:
+                state.trial_in_flight = True
+                return
+            state.errors["circuit_open"] = state.errors.get("circuit_open", 0) + 1
+        raise CircuitOpenError(f"Circuit open for {host}: failing fast after repeated failures")
+
+    def record_response(self, host: str, status_code: int, elapsed: float) -> None:
+        """
+        Record a response received from a host.
+
+        Args:
+            host: Host name of the request URL
+            status_code: HTTP status code of the response
+            elapsed: Request latency in seconds
+        """
+        if status_code >= 500:
+            self._record(host, elapsed, "5xx", failed=True)
+        elif status_code == 429:
+            self._record(host, elapsed, "429", failed=False)
+        elif status_code >= 400:
+            self._record(host, elapsed, "4xx", failed=False)
+        else:
+            self._record(host, elapsed, None, failed=False)
+
+    def record_exception(self, host: str, exc: Exception, elapsed: float) -> None:
+        """
+        Record a request to a host that failed without a response.
+
+        Args:
+            host: Host name of the request URL
+            exc: Exception raised by the request
+            elapsed: Time until the failure in seconds
+        """
+        if isinstance(exc, requests.exceptions.Timeout):
+            kind = "timeout"
+        elif isinstance(exc, requests.exceptions.ConnectionError):
+            kind = "connection"
+        else:
+            kind = "other"
+        self._record(host, elapsed, kind, failed=True)
+
+    def _record(self, host: str, elapsed: float, error: Any, failed: bool) -> None:
+        with self._lock:
+            state = self._hosts.setdefault(host, _HostState())
+            state.requests += 1
+            state.latency[bisect_left(LATENCY_BUCKETS, elapsed)] += 1
+            if error is not None:
+                state.errors[error] = state.errors.get(error, 0) + 1
+
+            state.trial_in_flight = False
+            if not failed:
+                state.consecutive_failures = 0
+                state.state = CLOSED
+                return
+            state.consecutive_failures += 1
+            if state.state == HALF_OPEN or state.consecutive_failures >= self.failure_threshold:
+                state.state = OPEN
+                state.opened_at = self._clock()
+
+    def state(self, host: str) -> str:
+        """Get the circuit state ("closed", "open" or "half-open") of a host."""
+        with self._lock:
+            state = self._hosts.get(host)
+            return state.state if state else CLOSED
+
+    def metrics(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get the circuit state and histograms of every host.
+
+        Returns:
+            Dictionary mapping host names to their circuit state, request count,
+            latency histogram (bucket upper bound -> count) and error counts by kind
+        """
+        labels = [f"<={bound}s" for bound in LATENCY_BUCKETS] + ["+Inf"]
+        with self._lock:
+            return {
+                host: {
+                    "state": state.state,
+                    "requests": state.requests,
+                    "latency": dict(zip(labels, state.latency, strict=True)),
+                    "errors": dict(state.errors),
+                }
+                for host, state in self._hosts.items()
+            }
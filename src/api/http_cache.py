@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+HTTP Cache Module
+
+This module provides a persistent, size-capped cache for conditional GET requests.
+For every cached URL it stores the ETag and Last-Modified validators together with
+the decoded JSON body and pagination links, so that a 304 Not Modified reply can be
+served from disk. GitHub does not count 304 replies against the rate limit.
+
+The cache is kept in least-recently-used order and evicts the oldest entries once
+the configured number of entries is exceeded.
+"""
+
+import logging
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+from src.utils.common import load_json_file, save_json_file
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ENTRIES = 5000
+
+
+class HttpCache:
+    """
+    Persistent ETag / Last-Modified cache with LRU eviction.
+    Safe to share between threads.
+    """
+
+    def __init__(self, path: Union[str, Path], max_entries: int = DEFAULT_MAX_ENTRIES):
+        """
+        Initialize the cache and load any entries persisted by a previous run.
+
+        Args:
+            path: JSON file used to persist the cache
+            max_entries: Maximum number of URLs kept before evicting the least recently used
+        """
+        self.path = Path(path)
+        self.max_entries = max(1, int(max_entries))
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._load()
+
+    def _load(self) -> None:
+        """Load persisted entries, ignoring a missing or unreadable cache file."""
+        data = load_json_file(self.path, "HTTP cache")
+        if data is None:
+            return
+        for item in data.get("entries", []):
+            if isinstance(item, list) and len(item) == 2 and isinstance(item[1], dict):
+                self._entries[item[0]] = item[1]
+        self._evict()
+        logger.info(f"Loaded {len(self._entries)} HTTP cache entries from {self.path}")
+
+    def save(self) -> None:
+        """Persist the cache atomically, oldest entries first."""
+        with self._lock:
+            payload = {"entries": [[url, entry] for url, entry in self._entries.items()]}
+        if save_json_file(self.path, payload, "HTTP cache"):
+            logger.info(f"Saved {len(payload['entries'])} HTTP cache entries to {self.path}")
+
+    def conditional_headers(self, url: str) -> Dict[str, str]:
+        """
+        Get the validator headers to send for a URL.
+
+        Args:
+            url: Full request URL
+
+        Returns:
+            If-None-Match / If-Modified-Since headers, or an empty dict if the URL is not cached
+        """
+        with self._lock:
+            entry = self._entries.get(url)
+        if not entry:
+            return {}
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def get(self, url: str) -> Optional[Dict[str, Any]]:
+        """
+        Serve a 304 reply from the cache and count it as a hit.
+
+        Args:
+            url: Full request URL
+
+        Returns:
+            Cached entry with "body" and "links" keys, or None if the URL is not cached
+        """
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry is None:
+                return None
+            self._entries.move_to_end(url)
+            self.hits += 1
+            return entry
+
+    def store(
+        self,
+        url: str,
+        body: Any,
+        links: Optional[Dict[str, Dict[str, str]]],
+        etag: Optional[str],
+        last_modified: Optional[str],
+    ) -> None:
+        """
+        Record a full response and count it as a miss.
+        Responses without validators are counted but not stored.
+
+        Args:
+            url: Full request URL
+            body: Decoded JSON body
+            links: Pagination links parsed from the Link header
+            etag: ETag response header
+            last_modified: Last-Modified response header
+        """
+        with self._lock:
+            self.misses += 1
+            if not etag and not last_modified:
+                self._entries.pop(url, None)
+                return
+            self._entries[url] = {
+                "etag": etag,
+                "last_modified": last_modified,
+                "body": body,
+                "links": links or {},
+            }
+            self._entries.move_to_end(url)
+            self._evict()
+
+    def _evict(self) -> None:
+        """Drop least recently used entries above the size cap. Caller holds the lock."""
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get cache counters.
+
+        Returns:
+            Dictionary with hits, misses, evictions and current entry count
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+            }
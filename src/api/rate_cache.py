@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Rate Cache Module
+
+This module persists the last successfully fetched conversion rate of every currency
+together with the time it was fetched. CurrencyClient uses it in two ways:
+
+- While every rate is younger than the TTL, the rates are reused without calling
+  the Spectrum and Explorer APIs at all.
+- When an API is slow or down, the last known good rate is used before falling back
+  to the hardcoded defaults.
+"""
+
+import logging
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Tuple, Union
+
+from src.utils.common import load_json_file, save_json_file
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+CACHE_VERSION = 1
+DEFAULT_TTL_MINUTES = 60
+
+
+class RateCache:
+    """
+    Persisted conversion rates with their fetch times.
+    Safe to share between threads.
+    """
+
+    def __init__(self, path: Union[str, Path], ttl_minutes: float = DEFAULT_TTL_MINUTES):
+        """
+        Initialize the cache and load the rates persisted by a previous run.
+
+        Args:
+            path: JSON file used to persist the rates
+            ttl_minutes: Minutes cached rates are reused without fetching live rates
+        """
+        self.path = Path(path)
+        self.ttl = ttl_minutes * 60
+        self._rates: Dict[str, Dict[str, float]] = {}
+        self._lock = threading.Lock()
+        self._load()
+
+    def _load(self) -> None:
+        """Load the rates, ignoring a missing, unreadable or outdated file."""
+        data = load_json_file(self.path, "rate cache", CACHE_VERSION)
+        if data is None:
+            return
+        self._rates = {
+            currency: entry for currency, entry in data.get("rates", {}).items()
+            if isinstance(entry, dict) and isinstance(entry.get("rate"), (int, float))
+        }
+        logger.info(f"Loaded {len(self._rates)} cached rates from {self.path}")
+
+    def save(self) -> None:
+        """Persist the rates atomically."""
+        with self._lock:
+            save_json_file(self.path, {"version": CACHE_VERSION, "rates": self._rates}, "rate cache", indent=2)
+
+    def is_fresh(self, currencies: Iterable[str], now: Optional[float] = None) -> bool:
+        """
+        Check whether every given currency has a cached rate younger than the TTL.
+
+        Args:
+            currencies: Currencies that must be cached
+            now: Current epoch time
+
+        Returns:
+            True if the cached rates can be used without fetching
+        """
+        now = now or time.time()
+        with self._lock:
+            return all(
+                currency in self._rates and now - self._rates[currency]["fetched_at"] < self.ttl
+                for currency in currencies
+            )
+
+    def entries(self) -> Dict[str, Tuple[float, float]]:
+        """
+        Get every cached rate.
+
+        Returns:
+            Dictionary mapping currencies to (rate, epoch time it was fetched)
+        """
+        with self._lock:
+            return {currency: (entry["rate"], entry["fetched_at"]) for currency, entry in self._rates.items()}
+
+    def store(self, rates: Dict[str, float], now: Optional[float] = None) -> None:
+        """
+        Record freshly fetched rates.
+
+        Args:
+            rates: Live rates by currency
+            now: Current epoch time
+        """
+        fetched_at = int(now or time.time())
+        with self._lock:
+            for currency, rate in rates.items():
+                self._rates[currency] = {"rate": rate, "fetched_at": fetched_at}
@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+"""
+Rate Limiter Module
+
+This module provides a token-bucket scheduler shared by every request a client makes.
+It reads the budget headers of every response (X-RateLimit-Remaining, X-RateLimit-Reset,
+X-RateLimit-Resource and Retry-After) instead of waiting for the budget to run out:
+
+- While the pending work fits into the remaining budget, requests are not delayed.
+- When more requests are pending than the budget allows, requests are spaced evenly
+  until the reset time, so a large scan keeps making progress instead of stalling
+  for the rest of the hour once the budget is spent.
+- GitHub secondary (abuse) limits and Retry-After replies pause all requests.
+
+The scheduler never sleeps itself; it returns how long the caller should wait, so the
+same instance serves blocking and asyncio clients.
+"""
+
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, Mapping, Optional
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+DEFAULT_RESOURCE = "core"
+
+# GitHub asks clients hitting a secondary limit without Retry-After to wait at least a minute
+SECONDARY_LIMIT_DELAY = 60.0
+MAX_SECONDARY_LIMIT_DELAY = 15 * 60.0
+
+SECONDARY_LIMIT_MARKERS = ("secondary rate limit", "abuse detection")
+
+
+class _Budget:
+    """Last known budget of one rate limit resource."""
+
+    __slots__ = ("limit", "remaining", "reset", "next_slot")
+
+    def __init__(self) -> None:
+        self.limit: Optional[int] = None
+        self.remaining: Optional[int] = None
+        self.reset: Optional[float] = None
+        self.next_slot = 0.0
+
+
+def _parse_number(value: Optional[str]) -> Optional[float]:
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class RateLimiter:
+    """
+    Token-bucket request scheduler driven by rate limit response headers.
+    Safe to share between threads.
+    """
+
+    def __init__(
+        self,
+        reserve: int = 0,
+        secondary_limit_delay: float = SECONDARY_LIMIT_DELAY,
+        clock: Callable[[], float] = time.time,
+    ):
+        """
+        Initialize the scheduler.
+
+        Args:
+            reserve: Requests of each budget left unused for other clients of the same token
+            secondary_limit_delay: Pause after a secondary limit reply without Retry-After;
+                doubled for every consecutive secondary limit reply
+            clock: Wall clock returning epoch seconds (X-RateLimit-Reset is an epoch time)
+        """
+        self.reserve = max(0, int(reserve))
+        self.secondary_limit_delay = secondary_limit_delay
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._budgets: Dict[str, _Budget] = {}
+        self._pending: Optional[int] = None
+        self._blocked_until = 0.0
+        self._consecutive_secondary = 0
+
+        # Counters exposed through metrics()
+        self.requests = 0
+        self.delayed_requests = 0
+        self.total_wait = 0.0
+        self.rate_limited_responses = 0
+        self.secondary_limit_hits = 0
+
+    def set_pending(self, requests: Optional[int]) -> None:
+        """
+        Set the number of requests still expected, used to spread the remaining budget.
+
+        Args:
+            requests: Expected number of further requests, or None if unknown
+        """
+        with self._lock:
+            self._pending = None if requests is None else max(0, int(requests))
+
+    def acquire(self, resource: str = DEFAULT_RESOURCE) -> float:
+        """
+        Reserve a slot for the next request.
+
+        Args:
+            resource: Rate limit resource the request counts against
+
+        Returns:
+            Seconds the caller should wait before sending the request
+        """
+        with self._lock:
+            now = self._clock()
+            budget = self._budgets.setdefault(resource, _Budget())
+            start = max(now, self._blocked_until)
+
+            if budget.reset is not None and budget.reset <= now:
+                # A new window started; the budget is unknown until the next response
+                budget.remaining = None
+                budget.reset = None
+
+            if budget.remaining is not None and budget.reset is not None:
+                available = budget.remaining - self.reserve
+                if available <= 0:
+                    start = max(start, budget.reset + 1)
+                elif self._pending is not None and self._pending > available:
+                    # Spread what is left evenly over the time until the reset
+                    interval = (budget.reset - now) / available
+                    start = max(start, budget.next_slot)
+                    budget.next_slot = start + interval
+                # Count the request before its response reports the new budget
+                budget.remaining -= 1
+
+            if self._pending:
+                self._pending -= 1
+            self.requests += 1
+            delay = start - now
+            if delay > 0:
+                self.delayed_requests += 1
+                self.total_wait += delay
+            return delay
+
+    def update(
+        self,
+        status_code: int,
+        headers: Mapping[str, str],
+        resource: str = DEFAULT_RESOURCE,
+        body: str = "",
+    ) -> Optional[float]:
+        """
+        Record the budget reported by a response.
+
+        Args:
+            status_code: HTTP status code of the response
+            headers: Response headers
+            resource: Rate limit resource the request counted against (overridden by
+                the X-RateLimit-Resource header)
+            body: Response body, only inspected for 403/429 replies
+
+        Returns:
+            Seconds to wait before retrying if the response was rejected by a rate limit,
+            otherwise None. The wait is also applied to later acquire() calls.
+        """
+        resource = headers.get("X-RateLimit-Resource", resource)
+        remaining = _parse_number(headers.get("X-RateLimit-Remaining"))
+        reset = _parse_number(headers.get("X-RateLimit-Reset"))
+        limit = _parse_number(headers.get("X-RateLimit-Limit"))
+        retry_after = _parse_number(headers.get("Retry-After"))
+
+        with self._lock:
+            now = self._clock()
+            budget = self._budgets.setdefault(resource, _Budget())
+            if remaining is not None:
+                budget.remaining = int(remaining)
+                if reset is not None:
+                    budget.reset = reset
+            if limit is not None:
+                budget.limit = int(limit)
+
+            delay = None
+            if status_code >= 400 and retry_after is not None:
+                delay = max(0.0, retry_after)
+                if status_code in (403, 429) and remaining != 0:
+                    self.secondary_limit_hits += 1
+                self._blocked_until = max(self._blocked_until, now + delay)
+            elif status_code in (403, 429):
+                if remaining == 0:
+                    delay = max(1.0, (budget.reset or now) - now)
+                elif any(marker in body.lower() for marker in SECONDARY_LIMIT_MARKERS):
+                    self._consecutive_secondary += 1
+                    self.secondary_limit_hits += 1
+                    delay = min(
+                        self.secondary_limit_delay * 2 ** (self._consecutive_secondary - 1),
+                        MAX_SECONDARY_LIMIT_DELAY,
+                    )
+                    self._blocked_until = max(self._blocked_until, now + delay)
+            elif status_code < 400:
+                self._consecutive_secondary = 0
+
+            if delay is not None:
+                self.rate_limited_responses += 1
+                logger.warning(f"Rate limited ({resource}, HTTP {status_code}); pausing for {delay:.0f} seconds")
+            return delay
+
+    def metrics(self) -> Dict[str, Any]:
+        """
+        Get the live budget and scheduler counters.
+
+        Returns:
+            Dictionary with the per-resource budget (limit, remaining, seconds until reset)
+            and request, delay and rate limit counters
+        """
+        with self._lock:
+            now = self._clock()
+            return {
+                "resources": {
+                    name: {
+                        "limit": budget.limit,
+                        "remaining": budget.remaining,
+                        "reset_in": None if budget.reset is None else max(0.0, budget.reset - now),
+                    }
+                    for name, budget in self._budgets.items()
+                },
+                "pending": self._pending,
+                "paused_for": max(0.0, self._blocked_until - now),
+                "requests": self.requests,
+                "delayed_requests": self.delayed_requests,
+                "total_wait": round(self.total_wait, 3),
+                "rate_limited_responses": self.rate_limited_responses,
+                "secondary_limit_hits": self.secondary_limit_hits,
+            }
@@ -26,9 +26,16 @@ logger = logging.getLogger('bounty_finder')
 
 # Import modules
 from src.core.config import BountyConfig
-from src.api.currency_client import CurrencyClient
+from src.api.currency_client import CurrencyClient, ErgValuation
+from src.api.rate_cache import RateCache
+from src.api.http_cache import HttpCache
+from src.api.rate_limiter import RateLimiter
 from src.core.processor import BountyProcessor
+from src.core.issue_store import IssueStore
+from src.core.metadata_cache import MetadataCache
 from src.utils.common import ensure_directory
+from src.utils.rate_history import DEFAULT_RATE_HISTORY_PATH, RateHistory
+from src.utils.submissions_index import DEFAULT_INDEX_PATH, DEFAULT_SUBMISSIONS_DIR, SubmissionsIndex
 from src.generators.main import (
     generate_language_files,
     generate_organization_files,
@@ -43,7 +50,7 @@ from src.generators.main import (
     generate_high_value_bounties_file,
     # Import moved functions needed for badge update
     find_high_value_bounties,
-    group_by_language
+    BountyIndex
 )
 
 def main():
@@ -66,13 +73,83 @@ def main():
     repos_to_query = config.load_tracked_repos()
     orgs_to_query = config.load_tracked_orgs()
     
-    # Fetch conversion rates
+    # Fetch conversion rates in the background while GitHub is scanned; the
+    # rates are joined when the first bounty is valued
     logger.info("Fetching conversion rates")
-    currency_client = CurrencyClient()
-    conversion_rates = currency_client.get_all_rates()
+    rate_cache = None
+    rate_cache_path = config.get_scan_setting("rate_cache_path", "")
+    if rate_cache_path:
+        rate_cache = RateCache(
+            rate_cache_path,
+            ttl_minutes=config.get_scan_setting("rate_cache_ttl_minutes", 60)
+        )
+    rate_history_path = config.get_scan_setting("rate_history_path", DEFAULT_RATE_HISTORY_PATH)
+    currency_client = CurrencyClient(
+        rate_cache=rate_cache,
+        spectrum_tokens=config.constants.get("spectrum_tokens"),
+        rate_history=RateHistory(rate_history_path) if rate_history_path else None
+    )
+    pending_rates = currency_client.fetch_rates_in_background()
     
+    # Load the conditional-GET cache (an empty path disables it)
+    http_cache = None
+    http_cache_path = config.get_scan_setting("http_cache_path", "")
+    if http_cache_path:
+        http_cache = HttpCache(
+            http_cache_path,
+            max_entries=config.get_scan_setting("http_cache_max_entries", 5000)
+        )
+
+    # Load the issue store used for incremental issue sync (an empty path disables it)
+    issue_store = None
+    issue_store_path = config.get_scan_setting("issue_store_path", "")
+    if issue_store_path:
+        issue_store = IssueStore(
+            issue_store_path,
+            full_resync_days=config.get_scan_setting("full_resync_days", 7)
+        )
+    full_resync = os.environ.get("FULL_RESYNC", "").lower() == "true"
+    if full_resync:
+        logger.info("Full resync requested, ignoring stored issue sync times")
+
+    # Load the repository metadata cache (an empty path disables it; --refresh bypasses it)
+    metadata_cache = None
+    metadata_cache_path = config.get_scan_setting("metadata_cache_path", "")
+    if metadata_cache_path:
+        metadata_cache = MetadataCache(
+            metadata_cache_path,
+            org_ttl_hours=config.get_scan_setting("metadata_org_ttl_hours", 24),
+            languages_ttl_hours=config.get_scan_setting("metadata_languages_ttl_hours", 168),
+            refresh=os.environ.get("FORCE_REFRESH", "").lower() == "true"
+        )
+
+    # Submission files parsed by earlier runs are reused until they change
+    submissions_index = SubmissionsIndex(
+        DEFAULT_SUBMISSIONS_DIR,
+        config.get_scan_setting("submissions_index_path", DEFAULT_INDEX_PATH) or None
+    )
+
+    # One scheduler paces every GitHub request made with the token
+    rate_limiter = RateLimiter(reserve=config.get_scan_setting("rate_limit_reserve", 0))
+
     # Initialize processor
-    processor = BountyProcessor(config.github_token, conversion_rates)
+    processor = BountyProcessor(
+        config.github_token,
+        pending_rates,
+        max_workers=config.get_scan_setting("max_workers", 8),
+        http_cache=http_cache,
+        issue_store=issue_store,
+        full_resync=full_resync,
+        github_backend=config.get_scan_setting("github_backend", "rest"),
+        graphql_batch_size=config.get_scan_setting("graphql_batch_size", 10),
+        rate_limiter=rate_limiter,
+        read_ahead_workers=config.get_scan_setting("read_ahead_workers", 0),
+        discovery_mode=config.get_scan_setting("discovery_mode", "issues"),
+        metadata_cache=metadata_cache,
+        submissions_index=submissions_index
+    )
+    logger.info(f"Submissions index stats: {submissions_index.stats()}")
+    submissions_index.save()
     
     # Process organizations to find repositories
     repos_to_query = processor.process_organizations(orgs_to_query, repos_to_query)
@@ -80,7 +157,19 @@ def main():
     # Process repositories to find bounties
     logger.info(f"Processing {len(repos_to_query)} repositories")
     processor.process_repositories(repos_to_query)
+    logger.info(f"GitHub rate limit: {rate_limiter.metrics()}")
+    logger.info(f"GitHub API health: {processor.github_client.host_health.metrics()}")
     
+    if http_cache is not None:
+        logger.info(f"HTTP cache stats: {http_cache.stats()}")
+        http_cache.save()
+    if issue_store is not None:
+        issue_store.retain(repos_to_query)
+        issue_store.save()
+    if metadata_cache is not None:
+        logger.info(f"Metadata cache stats: {metadata_cache.stats()}")
+        metadata_cache.save()
+
     # Load and add extra bounties from extra_bounties.json
     logger.info("Loading extra bounties")
     extra_bounties = config.load_extra_bounties()
@@ -88,12 +177,24 @@ def main():
         logger.info(f"Adding {len(extra_bounties)} extra bounties")
         processor.add_extra_bounties(extra_bounties)
     
+    # Persist the canonical snapshot and the changes since the previous run (an empty path disables it)
+    snapshot_path = config.get_scan_setting("snapshot_path", "")
+    if snapshot_path:
+        processor.write_snapshot(snapshot_path, config.get_scan_setting("snapshot_diff_path", "") or None)
+
     # Get processed data
     bounty_data = processor.get_bounty_data()
     project_totals = processor.get_project_totals()
     total_bounties, total_value = processor.get_total_stats()
     
-    # No need to group data here anymore, generators handle it
+    conversion_rates = pending_rates.result()
+    logger.info(f"Currency API health: {currency_client.host_health.metrics()}")
+
+    # Convert every bounty to ERG once; all generators share these values
+    valuation = ErgValuation(bounty_data, conversion_rates)
+    # Group bounties once; all generators share the groupings and navigation counts.
+    # Organizations keep the casing of their project totals
+    index = BountyIndex(bounty_data, org_names=processor.project_names)
     
     # Generate output files
     logger.info("Generating output files")
@@ -103,7 +204,9 @@ def main():
         bounty_data,
         conversion_rates,
         total_bounties,
-        bounties_dir
+        bounties_dir,
+        valuation=valuation,
+        index=index
     )
 
     # Generate organization-specific files
@@ -111,7 +214,9 @@ def main():
         bounty_data,
         conversion_rates,
         total_bounties,
-        bounties_dir
+        bounties_dir,
+        valuation=valuation,
+        index=index
     )
 
     # Generate currency-specific files
@@ -119,7 +224,9 @@ def main():
         bounty_data,
         conversion_rates,
         total_bounties,
-        bounties_dir
+        bounties_dir,
+        valuation=valuation,
+        index=index
     )
 
     # Generate currency price table
@@ -127,7 +234,9 @@ def main():
         bounty_data, # Pass bounty_data now
         conversion_rates,
         total_bounties,
-        bounties_dir
+        bounties_dir,
+        index=index,
+        rate_provenance=currency_client.rate_provenance
     )
 
     # Generate main file
@@ -135,14 +244,17 @@ def main():
         bounty_data,
         conversion_rates,
         total_bounties,
-        bounties_dir
+        bounties_dir,
+        valuation=valuation,
+        index=index
     )
 
     # Update ongoing programs table
     update_ongoing_programs_table(
         bounty_data,
         conversion_rates,
-        bounties_dir
+        bounties_dir,
+        valuation=valuation
     )
 
     # Generate summary file
@@ -152,7 +264,9 @@ def main():
         conversion_rates,
         total_bounties,
         total_value,
-        bounties_dir
+        bounties_dir,
+        valuation=valuation,
+        index=index
     )
 
     # Generate featured bounties file
@@ -165,7 +279,9 @@ def main():
         # languages_dict, # Not needed directly by this generator anymore
         # currencies_dict, # Not needed directly by this generator anymore
         # orgs_dict, # Not needed directly by this generator anymore
-        bounties_dir
+        bounties_dir,
+        valuation=valuation,
+        index=index
     )
 
     # Generate high-value bounties file
@@ -178,20 +294,26 @@ def main():
         # currencies_dict, # Removed
         # orgs, # Removed
         bounties_dir,
-        high_value_threshold=1000
+        high_value_threshold=1000,
+        valuation=valuation,
+        index=index
     )
 
     generate_bounty_discovery_files(
         bounty_data,
         conversion_rates,
         total_bounties,
-        bounties_dir
+        bounties_dir,
+        valuation=valuation,
+        index=index
     )
 
     # Update the README.md badges with the latest bounty counts and values
     # Need to get high_value_bounties count and languages dict now
-    high_value_bounties_list = find_high_value_bounties(bounty_data, conversion_rates, threshold=1000)
-    languages_dict = group_by_language(bounty_data)
+    high_value_bounties_list = find_high_value_bounties(
+        bounty_data, conversion_rates, threshold=1000, valuation=valuation
+    )
+    languages_dict = index.languages
     update_readme_badges(
         total_bounties,
         total_value,
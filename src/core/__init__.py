@@ -7,6 +7,7 @@ This package contains the core functionality of the application:
 - Data aggregation and organization
 """
 
+from .bounty import Bounty
 from .config import BountyConfig
 from .processor import BountyProcessor
 # from .extractors import BountyExtractor # Removed as it no longer exists
@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+Bounty Module
+
+This module defines the record every bounty flows through the pipeline as. It is a
+slotted dataclass instead of a per-issue dictionary:
+
+- Owner, repository, language, currency, status and label strings are interned, so
+  the thousands of bounties of a scan share one copy of each repeated string.
+- The amount is parsed once into ``numeric_amount``, and the GitHub ``created_at``
+  and ``updated_at`` strings once into datetimes with their age in whole days
+  relative to the run's reference time, so views never reparse them.
+- ``erg_value`` caches the ERG value computed by ErgValuation, so generators do
+  not copy bounties to attach their value.
+
+The record also answers the dictionary accessors used by existing code
+(``bounty["owner"]``, ``bounty.get("status")``, ``"description" in bounty``,
+``keys()``, ``items()``), and ``to_dict()`` returns the plain dictionary form.
+"""
+
+import sys
+from dataclasses import InitVar, dataclass, field, fields
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Tuple, Union
+
+# Keys of the dictionary form; the remaining attributes are derived values
+_INTERNAL_FIELDS = (
+    "extra", "numeric_amount", "erg_value", "created", "updated", "age_days", "updated_days",
+)
+
+
+def _intern(value: Any) -> Any:
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def _parse_amount(amount: Any) -> Optional[float]:
+    """Parse a bounty amount, returning None for "Not specified", "Ongoing" and the like."""
+    try:
+        return float(amount)
+    except (TypeError, ValueError):
+        return None
+
+
+def parse_github_timestamp(value: Optional[str]) -> Optional[datetime]:
+    """Parse a GitHub ISO 8601 timestamp ("2025-01-01T00:00:00Z"), or None if missing or invalid."""
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except (AttributeError, ValueError):
+        return None
+
+
+def _days_since(moment: Optional[datetime], now: datetime) -> Optional[int]:
+    return None if moment is None else max((now - moment).days, 0)
+
+
+@dataclass(slots=True, eq=False)
+class Bounty:
+    """A bounty found on GitHub or added through extra_bounties.json."""
+
+    owner: str
+    repo: str
+    title: str = ""
+    url: str = ""
+    amount: str = "Not specified"
+    currency: str = "Not specified"
+    primary_lang: str = "Unknown"
+    secondary_lang: str = "None"
+    labels: List[str] = field(default_factory=list)
+    issue_number: Union[int, str] = ""
+    creator: str = ""
+    status: str = ""
+    timestamp: str = ""
+    created_at: str = ""
+    updated_at: str = ""
+    comments: int = 0
+    assignees: List[str] = field(default_factory=list)
+    description: Optional[str] = None
+    # Keys of extra_bounties.json entries that are not fields
+    extra: Dict[str, Any] = field(default_factory=dict)
+    numeric_amount: Optional[float] = field(init=False, default=None)
+    erg_value: Optional[float] = field(init=False, default=None)
+    created: Optional[datetime] = field(init=False, default=None)
+    updated: Optional[datetime] = field(init=False, default=None)
+    # Whole days from created/updated to the run's reference time
+    age_days: Optional[int] = field(init=False, default=None)
+    updated_days: Optional[int] = field(init=False, default=None)
+    # Reference time of the run (defaults to the current time)
+    now: InitVar[Optional[datetime]] = None
+
+    def __post_init__(self, now: Optional[datetime]) -> None:
+        self.owner = _intern(self.owner)
+        self.repo = _intern(self.repo)
+        self.currency = _intern(self.currency)
+        self.primary_lang = _intern(self.primary_lang)
+        self.secondary_lang = _intern(self.secondary_lang)
+        self.creator = _intern(self.creator)
+        self.status = _intern(self.status)
+        self.labels = [_intern(label) for label in self.labels]
+        self.numeric_amount = _parse_amount(self.amount)
+
+        now = now or datetime.now(timezone.utc)
+        self.created = parse_github_timestamp(self.created_at)
+        self.updated = parse_github_timestamp(self.updated_at)
+        self.age_days = _days_since(self.created, now)
+        self.updated_days = _days_since(self.updated, now)
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any], now: Optional[datetime] = None) -> "Bounty":
+        """
+        Build a bounty from its dictionary form.
+
+        Args:
+            data: Bounty dictionary, e.g. an extra_bounties.json entry
+            now: Reference time of the run (defaults to the current time)
+
+        Returns:
+            Bounty record; keys that are not fields are kept in ``extra``
+        """
+        values = {key: value for key, value in data.items() if key in _KEY_FIELDS}
+        extra = {key: value for key, value in data.items() if key not in _KEY_FIELDS}
+        return cls(**values, extra=extra, now=now)
+
+    def keys(self) -> List[str]:
+        """Get the keys of the dictionary form."""
+        keys = [name for name in _KEY_ORDER if name != "description" or self.description is not None]
+        keys.extend(self.extra)
+        return keys
+
+    def items(self) -> List[Tuple[str, Any]]:
+        """Get the (key, value) pairs of the dictionary form."""
+        return [(key, self[key]) for key in self.keys()]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Get the dictionary form."""
+        return {key: self[key] for key in self.keys()}
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Get a key of the dictionary form, or default when missing."""
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __getitem__(self, key: str) -> Any:
+        if key in _KEY_FIELDS:
+            value = getattr(self, key)
+            if value is not None:
+                return value
+        elif key in self.extra:
+            return self.extra[key]
+        raise KeyError(key)
+
+    def __contains__(self, key: object) -> bool:
+        if key in _KEY_FIELDS:
+            return getattr(self, key) is not None
+        return key in self.extra
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.keys())
+
+
+_KEY_ORDER = tuple(f.name for f in fields(Bounty) if f.name not in _INTERNAL_FIELDS)
+_KEY_FIELDS = frozenset(_KEY_ORDER)
+
+
+def created_time(bounty: Mapping[str, Any]) -> Optional[datetime]:
+    """Get when a bounty (record or dictionary) was created."""
+    if isinstance(bounty, Bounty):
+        return bounty.created
+    return parse_github_timestamp(bounty.get("created_at"))
+
+
+def updated_time(bounty: Mapping[str, Any]) -> Optional[datetime]:
+    """Get when a bounty (record or dictionary) was last updated."""
+    if isinstance(bounty, Bounty):
+        return bounty.updated
+    return parse_github_timestamp(bounty.get("updated_at"))
+
+
+def age_in_days(bounty: Mapping[str, Any], now: datetime) -> Optional[int]:
+    """Get the whole days since a bounty was created; records use their precomputed age."""
+    if isinstance(bounty, Bounty):
+        return bounty.age_days
+    return _days_since(created_time(bounty), now)
+
+
+def updated_in_days(bounty: Mapping[str, Any], now: datetime) -> Optional[int]:
+    """Get the whole days since a bounty was last updated; records use their precomputed value."""
+    if isinstance(bounty, Bounty):
+        return bounty.updated_days
+    return _days_since(updated_time(bounty), now)
@@ -77,6 +77,22 @@ class BountyConfig:
             logger.warning(f"Error loading constants from {constants_path}: {e}")
             return {}
 
+    def get_scan_setting(self, name: str, default: Any = None) -> Any:
+        """
+        Get a repository scanning setting from the "scan" section of constants.json.
+
+        Args:
+            name: Setting name
+            default: Value returned when the setting is not configured
+
+        Returns:
+            The configured value, or default
+        """
+        scan_settings = self.constants.get("scan", {})
+        if not isinstance(scan_settings, dict):
+            return default
+        return scan_settings.get(name, default)
+
     def _load_json_config(self, filename: str, data_key: str = "items") -> List[Any]:
         """
         Helper to load JSON configuration files with fallback path logic.
@@ -10,6 +10,12 @@ GitHub issues, including:
 
 It provides a consistent interface for identifying and normalizing bounty data
 across different formats and sources.
+
+All patterns are compiled once at import. Every pattern contains one of a small
+set of keyword tokens, so text without any of them is skipped before any regex
+runs. Lowercased ASCII text is matched with case-sensitive copies of the patterns,
+which lets the regex engine use its fast literal-prefix search; other text falls
+back to the original case-insensitive patterns, so results are unchanged.
 """
 
 import re
@@ -43,6 +49,69 @@ UNIT_MAPPINGS = {
     'ounce': 'oz',
 }
 
+PRECIOUS_METALS = ('gold', 'silver', 'platinum')
+
+# Define regex patterns for different bounty formats in labels, in priority order
+LABEL_PATTERNS = [
+    # Cryptocurrency patterns
+    r'bounty\s*-?\s*(\d+(?:\.\d+)?)\s*(sigusd|rsn|bene|erg|gort)',
+    r'b-(\d+(?:\.\d+)?)\s*(sigusd|rsn|bene|erg|gort)',
+    r'(\d+(?:\.\d+)?)\s*(sigusd|rsn|bene|erg|gort)\s*bounty',
+    # Precious metals patterns
+    r'bounty\s*-?\s*(\d+(?:\.\d+)?)\s*(gram|g|oz|ounce)s?\s+(?:of\s+)?(gold|silver|platinum)',
+    r'(\d+(?:\.\d+)?)\s*(gram|g|oz|ounce)s?\s+(?:of\s+)?(gold|silver|platinum)\s*bounty'
+]
+
+# Define regex patterns for different bounty formats in text, in priority order
+TEXT_PATTERNS = [
+    r'bounty:?\s*[\$€£]?\s*(\d+(?:,\d{3})*(?:\.\d{2})?)\s*(sigusd|gort|rsn|bene|erg|usd|ergos?|dollars?|€|£|\$)?',
+    r'[\$€£]\s*(\d+(?:,\d{3})*(?:\.\d{2})?)\s*(?:sigusd|gort|rsn|bene|erg|usd|ergos?|bounty)',
+    r'(\d+(?:,\d{3})*(?:\.\d{2})?)\s*(sigusd|gort|rsn|bene|erg|usd|ergos?)\s*bounty',
+    r'bounty:?\s*(\d+(?:\.\d+)?)\s*(gram|g|oz|ounce)s?\s+(?:of\s+)?(gold|silver|platinum)',
+    r'(\d+(?:\.\d+)?)\s*(gram|g|oz|ounce)s?\s+(?:of\s+)?(gold|silver|platinum)\s*bounty',
+    r'bounty\s+(?:of|is|:)?\s*(\d+(?:,\d{3})*(?:\.\d{2})?)\s*(sigusd|gort|rsn|bene|erg|usd|ergos?|dollars?|€|£|\$)?',
+    # Patterns specifically looking for "Amount: ..."
+    r'amount:?\s*(\d+(?:\.\d+)?)\s*(erg|sigusd|rsn|bene|gort|usd|dollars?)',
+    r'amount:?\s*(\d+(?:\.\d+)?)\s*(gram|g|oz|ounce)s?\s+(?:of\s+)?(gold|silver|platinum)'
+]
+
+# Every label pattern contains one of these tokens, and every text pattern one of the others
+LABEL_KEYWORDS = ('bounty', 'b-')
+TEXT_KEYWORDS = ('bounty', 'amount', '$', '€', '£')
+
+
+class _CompiledPatterns:
+    """A pattern list compiled for lowercased ASCII text and for any other text."""
+
+    def __init__(self, patterns: List[str]):
+        self.ascii = [re.compile(pattern) for pattern in patterns]
+        self.unicode = [re.compile(pattern, re.IGNORECASE) for pattern in patterns]
+
+    def search(self, text: str) -> Optional[re.Match]:
+        """
+        Find the first match of the highest-priority pattern that matches.
+
+        Args:
+            text: Lowercased text to search
+
+        Returns:
+            The match, or None if no pattern matches
+        """
+        compiled = self.ascii if text.isascii() else self.unicode
+        for regex in compiled:
+            match = regex.search(text)
+            if match:
+                return match
+        return None
+
+
+_LABEL_REGEXES = _CompiledPatterns(LABEL_PATTERNS)
+_TEXT_REGEXES = _CompiledPatterns(TEXT_PATTERNS)
+
+
+def _contains_keyword(text: str, keywords: Tuple[str, ...]) -> bool:
+    return any(keyword in text for keyword in keywords)
+
 
 def is_bounty_issue(title: str, labels: List[Dict[str, Any]]) -> bool:
     """
@@ -56,7 +125,8 @@ def is_bounty_issue(title: str, labels: List[Dict[str, Any]]) -> bool:
         True if the issue appears to be a bounty
     """
     # Check if the title contains "bounty" or "b-" prefix
-    if "bounty" in title.lower() or title.lower().startswith("b-"):
+    lowered_title = title.lower()
+    if "bounty" in lowered_title or lowered_title.startswith("b-"):
         return True
 
     # Check if any label contains 'bounty' or 'b-'
@@ -94,40 +164,31 @@ def extract_from_labels(labels: List[Dict[str, Any]]) -> Tuple[Optional[str], Op
         - "b-50sigusd" -> ("50", "SigUSD")
         - "bounty-2g gold" -> ("2", "g GOLD")
     """
-    # Define regex patterns for different bounty formats
-    label_patterns = [
-        # Cryptocurrency patterns
-        r'bounty\s*-?\s*(\d+(?:\.\d+)?)\s*(sigusd|rsn|bene|erg|gort)',
-        r'b-(\d+(?:\.\d+)?)\s*(sigusd|rsn|bene|erg|gort)',
-        r'(\d+(?:\.\d+)?)\s*(sigusd|rsn|bene|erg|gort)\s*bounty',
-        # Precious metals patterns
-        r'bounty\s*-?\s*(\d+(?:\.\d+)?)\s*(gram|g|oz|ounce)s?\s+(?:of\s+)?(gold|silver|platinum)',
-        r'(\d+(?:\.\d+)?)\s*(gram|g|oz|ounce)s?\s+(?:of\s+)?(gold|silver|platinum)\s*bounty'
-    ]
-
     for label in labels:
         label_name = label['name'].lower()
-        logger.debug(f"Checking label: {label_name}")
+        logger.debug("Checking label: %s", label_name)
 
-        for pattern in label_patterns:
-            match = re.search(pattern, label_name, re.IGNORECASE)
-            if match:
-                if len(match.groups()) == 3 and match.group(3) in ['gold', 'silver', 'platinum']:
-                    # Handle precious metals format
-                    amount = match.group(1)
-                    unit = UNIT_MAPPINGS.get(match.group(2).lower(), match.group(2).lower())
-                    metal = match.group(3).upper()
-
-                    logger.info(f"Found bounty in label: {amount} {unit} {metal}")
-                    return amount, f"{unit} {metal}"
-                else:
-                    # Handle cryptocurrency format
-                    amount = match.group(1)
-                    currency = match.group(2).upper()
-                    currency = CURRENCY_MAPPINGS.get(currency.lower(), currency)
-
-                    logger.info(f"Found bounty in label: {amount} {currency}")
-                    return amount, currency
+        if not _contains_keyword(label_name, LABEL_KEYWORDS):
+            continue
+
+        match = _LABEL_REGEXES.search(label_name)
+        if match:
+            if len(match.groups()) == 3 and match.group(3) in PRECIOUS_METALS:
+                # Handle precious metals format
+                amount = match.group(1)
+                unit = UNIT_MAPPINGS.get(match.group(2).lower(), match.group(2).lower())
+                metal = match.group(3).upper()
+
+                logger.info(f"Found bounty in label: {amount} {unit} {metal}")
+                return amount, f"{unit} {metal}"
+            else:
+                # Handle cryptocurrency format
+                amount = match.group(1)
+                currency = match.group(2).upper()
+                currency = CURRENCY_MAPPINGS.get(currency.lower(), currency)
+
+                logger.info(f"Found bounty in label: {amount} {currency}")
+                return amount, currency
 
     logger.debug("No bounty found in labels")
     return None, None
@@ -149,44 +210,34 @@ def extract_from_text(title: str, body: str) -> Tuple[Optional[str], Optional[st
         - "50 ERG bounty" -> ("50", "ERG")
         - "Bounty: 2g of GOLD" -> ("2", "g GOLD")
     """
-    # Define regex patterns for different bounty formats in text
-    patterns = [
-        r'bounty:?\s*[\$€£]?\s*(\d+(?:,\d{3})*(?:\.\d{2})?)\s*(sigusd|gort|rsn|bene|erg|usd|ergos?|dollars?|€|£|\$)?',
-        r'[\$€£]\s*(\d+(?:,\d{3})*(?:\.\d{2})?)\s*(?:sigusd|gort|rsn|bene|erg|usd|ergos?|bounty)',
-        r'(\d+(?:,\d{3})*(?:\.\d{2})?)\s*(sigusd|gort|rsn|bene|erg|usd|ergos?)\s*bounty',
-        r'bounty:?\s*(\d+(?:\.\d+)?)\s*(gram|g|oz|ounce)s?\s+(?:of\s+)?(gold|silver|platinum)',
-        r'(\d+(?:\.\d+)?)\s*(gram|g|oz|ounce)s?\s+(?:of\s+)?(gold|silver|platinum)\s*bounty',
-        r'bounty\s+(?:of|is|:)?\s*(\d+(?:,\d{3})*(?:\.\d{2})?)\s*(sigusd|gort|rsn|bene|erg|usd|ergos?|dollars?|€|£|\$)?',
-        # Patterns specifically looking for "Amount: ..."
-        r'amount:?\s*(\d+(?:\.\d+)?)\s*(erg|sigusd|rsn|bene|gort|usd|dollars?)',
-        r'amount:?\s*(\d+(?:\.\d+)?)\s*(gram|g|oz|ounce)s?\s+(?:of\s+)?(gold|silver|platinum)'
-    ]
-
     # Combine title and body for searching
     text = f"{title} {body}".lower() if body else title.lower()
-    logger.debug(f"Searching for bounty in text (length: {len(text)})")
-
-    for pattern in patterns:
-        matches = re.finditer(pattern, text, re.IGNORECASE)
-        for match in matches:
-            if len(match.groups()) == 3 and match.group(3) in ['gold', 'silver', 'platinum']:
-                # Handle precious metals format
-                amount = match.group(1).replace(',', '')
-                unit = UNIT_MAPPINGS.get(match.group(2).lower(), match.group(2).lower())
-                metal = match.group(3).upper()
-
-                logger.info(f"Found bounty in text: {amount} {unit} {metal}")
-                return amount, f"{unit} {metal}"
-            else:
-                # Handle cryptocurrency/fiat format
-                amount = match.group(1).replace(',', '')
-                currency = match.group(2) if len(match.groups()) > 1 and match.group(2) else 'USD'
-
-                # Normalize currency names
-                currency = CURRENCY_MAPPINGS.get(currency.lower(), currency.upper())
-
-                logger.info(f"Found bounty in text: {amount} {currency}")
-                return amount, currency
+    logger.debug("Searching for bounty in text (length: %d)", len(text))
+
+    if not _contains_keyword(text, TEXT_KEYWORDS):
+        logger.debug("No bounty keywords in text")
+        return None, None
+
+    match = _TEXT_REGEXES.search(text)
+    if match:
+        if len(match.groups()) == 3 and match.group(3) in PRECIOUS_METALS:
+            # Handle precious metals format
+            amount = match.group(1).replace(',', '')
+            unit = UNIT_MAPPINGS.get(match.group(2).lower(), match.group(2).lower())
+            metal = match.group(3).upper()
+
+            logger.info(f"Found bounty in text: {amount} {unit} {metal}")
+            return amount, f"{unit} {metal}"
+        else:
+            # Handle cryptocurrency/fiat format
+            amount = match.group(1).replace(',', '')
+            currency = match.group(2) if len(match.groups()) > 1 and match.group(2) else 'USD'
+
+            # Normalize currency names
+            currency = CURRENCY_MAPPINGS.get(currency.lower(), currency.upper())
+
+            logger.info(f"Found bounty in text: {amount} {currency}")
+            return amount, currency
 
     logger.debug("No bounty found in text")
     return None, None
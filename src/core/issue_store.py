@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+Issue Store Module
+
+This module persists the open issues of every scanned repository between runs so
+that the processor only has to ask GitHub for issues that changed since the last
+sync (``/issues?since=...&state=all``). Changes are merged into the store:
+closed issues are dropped, new and edited issues replace their stored copy.
+
+Only the issue fields used by the bounty processor are kept, which keeps the
+store small compared to the raw API payloads.
+"""
+
+import logging
+import threading
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Union
+
+from ..utils.common import load_json_file, save_json_file
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+STORE_VERSION = 1
+
+
+def trim_issue(issue: Dict[str, Any]) -> Dict[str, Any]:
+    """Keep only the issue fields consumed by BountyProcessor._process_issue."""
+    return {
+        "number": issue["number"],
+        "title": issue.get("title", ""),
+        "state": issue.get("state", ""),
+        "labels": [{"name": label.get("name", "")} for label in issue.get("labels", [])],
+        "html_url": issue.get("html_url", ""),
+        "body": issue.get("body") or "",
+        "user": {"login": (issue.get("user") or {}).get("login", "")},
+        "created_at": issue.get("created_at", ""),
+        "updated_at": issue.get("updated_at", ""),
+        "comments": issue.get("comments", 0),
+        "assignees": [{"login": a.get("login", "")} for a in issue.get("assignees", [])],
+    }
+
+
+def format_sync_time(value: datetime) -> str:
+    """Format a datetime the way GitHub expects for the since= parameter."""
+    return value.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _parse_sync_time(value: Optional[str]) -> Optional[datetime]:
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+
+
+class IssueStore:
+    """
+    Persisted per-repository store of open issues with their last sync time.
+    Safe to share between threads.
+    """
+
+    def __init__(self, path: Union[str, Path], full_resync_days: int = 7):
+        """
+        Initialize the store and load the issues persisted by a previous run.
+
+        Args:
+            path: JSON file used to persist the store
+            full_resync_days: Age in days after which a repository is fully refetched
+                to drop issues that were deleted or transferred
+        """
+        self.path = Path(path)
+        self.full_resync_age = timedelta(days=full_resync_days)
+        self._repos: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self._load()
+
+    @staticmethod
+    def _key(owner: str, repo: str) -> str:
+        return f"{owner}/{repo}".lower()
+
+    def _load(self) -> None:
+        """Load the store, ignoring a missing, unreadable or outdated file."""
+        data = load_json_file(self.path, "issue store", STORE_VERSION)
+        if data is None:
+            return
+        self._repos = data.get("repos", {})
+        logger.info(f"Loaded stored issues for {len(self._repos)} repositories from {self.path}")
+
+    def save(self) -> None:
+        """Persist the store atomically."""
+        with self._lock:
+            saved = save_json_file(self.path, {"version": STORE_VERSION, "repos": self._repos}, "issue store")
+            repos = len(self._repos)
+        if saved:
+            logger.info(f"Saved stored issues for {repos} repositories to {self.path}")
+
+    def last_sync(self, owner: str, repo: str, now: Optional[datetime] = None) -> Optional[str]:
+        """
+        Get the time of the last sync for a repository.
+
+        Args:
+            owner: Repository owner
+            repo: Repository name
+            now: Current time, used to expire repositories due for a full resync
+
+        Returns:
+            ISO timestamp to pass as since=, or None if the repository needs a full sync
+        """
+        with self._lock:
+            entry = self._repos.get(self._key(owner, repo))
+        if not entry:
+            return None
+        full_sync = _parse_sync_time(entry.get("full_sync_at"))
+        now = now or datetime.now(timezone.utc)
+        if full_sync is None or now - full_sync >= self.full_resync_age:
+            return None
+        return entry.get("last_sync")
+
+    def replace(
+        self,
+        owner: str,
+        repo: str,
+        issues: Iterable[Dict[str, Any]],
+        synced_at: str,
+        keep: Optional[Callable[[Dict[str, Any]], bool]] = None,
+    ) -> None:
+        """
+        Replace the stored issues of a repository after a full sync.
+
+        Args:
+            owner: Repository owner
+            repo: Repository name
+            issues: All open issues of the repository; if iterating them raises, the
+                stored issues are left unchanged
+            synced_at: Time the sync started
+            keep: Optional predicate selecting which open issues to store
+        """
+        stored = {
+            str(issue["number"]): trim_issue(issue)
+            for issue in issues
+            if issue.get("state") == "open" and (keep is None or keep(issue))
+        }
+        with self._lock:
+            self._repos[self._key(owner, repo)] = {
+                "last_sync": synced_at,
+                "full_sync_at": synced_at,
+                "issues": stored,
+            }
+
+    def merge(
+        self,
+        owner: str,
+        repo: str,
+        changed_issues: Iterable[Dict[str, Any]],
+        synced_at: str,
+        keep: Optional[Callable[[Dict[str, Any]], bool]] = None,
+    ) -> int:
+        """
+        Merge issues changed since the last sync into the store.
+
+        Args:
+            owner: Repository owner
+            repo: Repository name
+            changed_issues: Issues of any state updated since the last sync; if
+                iterating them raises, the store and last sync time are left unchanged
+            synced_at: Time the sync started
+            keep: Optional predicate selecting which open issues to store
+
+        Returns:
+            Number of changed issues merged
+        """
+        key = self._key(owner, repo)
+        # Consume the (possibly streamed) issues before taking the lock
+        updates = [
+            (
+                str(issue["number"]),
+                trim_issue(issue) if issue.get("state") == "open" and (keep is None or keep(issue)) else None,
+            )
+            for issue in changed_issues
+        ]
+        with self._lock:
+            entry = self._repos.setdefault(key, {"full_sync_at": synced_at, "issues": {}})
+            stored = entry["issues"]
+            for number, issue in updates:
+                if issue is not None:
+                    stored[number] = issue
+                else:
+                    stored.pop(number, None)
+            entry["last_sync"] = synced_at
+        return len(updates)
+
+    def open_issues(self, owner: str, repo: str) -> List[Dict[str, Any]]:
+        """
+        Get copies of the stored open issues of a repository, newest first.
+
+        Args:
+            owner: Repository owner
+            repo: Repository name
+
+        Returns:
+            List of issue objects shaped like GitHub API issues
+        """
+        with self._lock:
+            entry = self._repos.get(self._key(owner, repo), {})
+            issues = [dict(issue) for issue in entry.get("issues", {}).values()]
+        issues.sort(key=lambda issue: issue["number"], reverse=True)
+        return issues
+
+    def retain(self, repos: Iterable[Dict[str, str]]) -> None:
+        """
+        Drop repositories that are no longer scanned.
+
+        Args:
+            repos: Repository objects with 'owner' and 'repo' keys still being scanned
+        """
+        keep = {self._key(repo["owner"], repo["repo"]) for repo in repos}
+        with self._lock:
+            for key in [key for key in self._repos if key not in keep]:
+                del self._repos[key]
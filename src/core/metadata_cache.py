@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Metadata Cache Module
+
+This module persists repository metadata that rarely changes between runs, so the
+processor does not have to ask GitHub for it every time:
+
+- Repository languages, reused until the repository's ``pushed_at`` moves (taken
+  from the organization listing), or for a TTL when ``pushed_at`` is unknown.
+- Organization repository listings, reused for a TTL.
+
+With ``refresh`` set (``python run.py --refresh``) cached entries are ignored and
+replaced by freshly fetched ones.
+"""
+
+import logging
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+from ..utils.common import load_json_file, save_json_file
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+CACHE_VERSION = 1
+DEFAULT_ORG_TTL_HOURS = 24
+DEFAULT_LANGUAGES_TTL_HOURS = 168
+
+# Organization repository fields used by BountyProcessor.process_organizations
+ORG_REPO_FIELDS = ("name", "archived", "fork", "has_issues", "pushed_at")
+
+
+class MetadataCache:
+    """
+    Persisted TTL cache of repository languages and organization listings.
+    Safe to share between threads.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        org_ttl_hours: float = DEFAULT_ORG_TTL_HOURS,
+        languages_ttl_hours: float = DEFAULT_LANGUAGES_TTL_HOURS,
+        refresh: bool = False,
+    ):
+        """
+        Initialize the cache and load the metadata persisted by a previous run.
+
+        Args:
+            path: JSON file used to persist the cache
+            org_ttl_hours: Hours an organization listing is reused
+            languages_ttl_hours: Hours repository languages are reused when the
+                repository's pushed_at is unknown
+            refresh: Ignore cached entries (they are still replaced and saved)
+        """
+        self.path = Path(path)
+        self.org_ttl = org_ttl_hours * 3600
+        self.languages_ttl = languages_ttl_hours * 3600
+        self.refresh = refresh
+        self.hits = 0
+        self.misses = 0
+        self._languages: Dict[str, Dict[str, Any]] = {}
+        self._orgs: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self._load()
+
+    @staticmethod
+    def _key(*parts: str) -> str:
+        return "/".join(parts).lower()
+
+    def _load(self) -> None:
+        """Load the cache, ignoring a missing, unreadable or outdated file."""
+        data = load_json_file(self.path, "metadata cache", CACHE_VERSION)
+        if data is None:
+            return
+        self._languages = data.get("languages", {})
+        self._orgs = data.get("orgs", {})
+        logger.info(
+            f"Loaded metadata for {len(self._languages)} repositories and "
+            f"{len(self._orgs)} organizations from {self.path}"
+        )
+
+    def save(self) -> None:
+        """Persist the cache atomically."""
+        with self._lock:
+            payload = {"version": CACHE_VERSION, "languages": self._languages, "orgs": self._orgs}
+            saved = save_json_file(self.path, payload, "metadata cache")
+        if saved:
+            logger.info(f"Saved metadata cache to {self.path}")
+
+    def _count(self, hit: bool) -> None:
+        if hit:
+            self.hits += 1
+        else:
+            self.misses += 1
+
+    def get_languages(
+        self, owner: str, repo: str, pushed_at: Optional[str] = None, now: Optional[float] = None
+    ) -> Optional[List[str]]:
+        """
+        Get the cached languages of a repository.
+
+        Args:
+            owner: Repository owner
+            repo: Repository name
+            pushed_at: The repository's current pushed_at, if known
+            now: Current epoch time
+
+        Returns:
+            Cached languages, or None if they must be fetched
+        """
+        with self._lock:
+            entry = None if self.refresh else self._languages.get(self._key(owner, repo))
+            if entry is None:
+                valid = False
+            elif pushed_at:
+                valid = entry.get("pushed_at") == pushed_at
+            else:
+                valid = (now or time.time()) - entry.get("fetched_at", 0) < self.languages_ttl
+            self._count(valid)
+            return list(entry["languages"]) if valid else None
+
+    def set_languages(
+        self,
+        owner: str,
+        repo: str,
+        languages: List[str],
+        pushed_at: Optional[str] = None,
+        now: Optional[float] = None,
+    ) -> None:
+        """
+        Store freshly fetched languages of a repository.
+
+        Args:
+            owner: Repository owner
+            repo: Repository name
+            languages: Languages returned by GitHub
+            pushed_at: The repository's pushed_at, if known
+            now: Current epoch time
+        """
+        with self._lock:
+            self._languages[self._key(owner, repo)] = {
+                "languages": list(languages),
+                "pushed_at": pushed_at,
+                "fetched_at": int(now or time.time()),
+            }
+
+    def get_org_repos(self, org: str, now: Optional[float] = None) -> Optional[List[Dict[str, Any]]]:
+        """
+        Get the cached repository listing of an organization.
+
+        Args:
+            org: Organization name
+            now: Current epoch time
+
+        Returns:
+            Cached repository objects, or None if the listing must be fetched
+        """
+        with self._lock:
+            entry = None if self.refresh else self._orgs.get(self._key(org))
+            valid = entry is not None and (now or time.time()) - entry.get("fetched_at", 0) < self.org_ttl
+            self._count(valid)
+            return [dict(repo) for repo in entry["repos"]] if valid else None
+
+    def set_org_repos(self, org: str, repos: List[Dict[str, Any]], now: Optional[float] = None) -> None:
+        """
+        Store a freshly fetched organization listing, keeping only the fields used.
+
+        Args:
+            org: Organization name
+            repos: Repository objects returned by GitHub
+            now: Current epoch time
+        """
+        trimmed = [{field: repo.get(field) for field in ORG_REPO_FIELDS} for repo in repos]
+        with self._lock:
+            self._orgs[self._key(org)] = {"repos": trimmed, "fetched_at": int(now or time.time())}
+
+    def stats(self) -> Dict[str, int]:
+        """Get cache hit and miss counts."""
+        return {"hits": self.hits, "misses": self.misses}
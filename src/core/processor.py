@@ -13,21 +13,38 @@ the generators that create the output markdown files.
 """
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
-from typing import Dict, List, Any, Tuple, Optional, Set
+from typing import Dict, List, Any, Mapping, Tuple, Optional, Set
 
-from ..api.github_client import GitHubClient
+from ..api.github_client import GitHubClient, IncompleteListingError, build_search_queries
+from ..api.github_graphql_client import GitHubGraphQLClient
+from ..api.http_cache import HttpCache
+from ..api.rate_limiter import RateLimiter
 from ..api.currency_client import CurrencyClient
+from .bounty import Bounty
 from .extractors import is_bounty_issue, extract_bounty_info
+from .issue_store import IssueStore, format_sync_time, trim_issue
+from .metadata_cache import MetadataCache
+from .snapshot import write_snapshot
+from ..utils.submissions_index import DEFAULT_SUBMISSIONS_DIR, SubmissionsIndex
 
-import json
-import os # Added for os.listdir and os.path.isdir
 import re # Added for regex in submission parsing
 from urllib.parse import urlparse
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+DEFAULT_MAX_WORKERS = 8
+DEFAULT_GRAPHQL_BATCH_SIZE = 10
+GITHUB_BACKENDS = {"rest", "graphql"}
+DISCOVERY_MODES = {"issues", "search"}
+# Searches for candidate bounty issues; every result still goes through is_bounty_issue.
+# GitHub search matches whole labels and title words only, so issues found by
+# is_bounty_issue through a label merely containing "bounty" or "b-" (e.g.
+# "b-wallet", "bounty-2g gold") or a title starting with "b-" are missed unless
+# the title also has the word "bounty"; the "issues" discovery mode finds them.
+BOUNTY_SEARCH_QUERIES = ("label:bounty state:open", "bounty in:title state:open")
 ACTIVE_SUBMISSION_STATUSES = {"in-progress", "awaiting-review", "reviewed"}
 PLACEHOLDERS = {"", "YOUR_GITHUB_USERNAME", "YOUR_WALLET_ADDRESS", "YOUR_CONTACT_INFO", "YYYY-MM-DD"}
 
@@ -56,10 +73,9 @@ def _issue_bounty_id(owner: str, repo: str, issue_number: Any) -> str:
     return f"{owner.lower()}/{repo.lower()}#{issue_number}"
 
 
-def _case_insensitive_key(mapping: Dict[str, Any], key: str) -> str:
-    """Return the existing key matching key case-insensitively, or key."""
-    lowered = key.lower()
-    return next((existing for existing in mapping if existing.lower() == lowered), key)
+def _is_bounty_candidate(issue: Dict[str, Any]) -> bool:
+    """Whether an issue may become a bounty record (open and marked as a bounty)."""
+    return issue.get("state") == "open" and is_bounty_issue(issue.get("title", ""), issue.get("labels", []))
 
 
 class BountyProcessor:
@@ -68,88 +84,347 @@ class BountyProcessor:
     Handles fetching and processing bounty information from GitHub.
     """
 
-    def __init__(self, github_token: str, rates: Dict[str, float]):
+    def __init__(
+        self,
+        github_token: str,
+        rates: Mapping[str, float],
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        http_cache: Optional[HttpCache] = None,
+        issue_store: Optional[IssueStore] = None,
+        full_resync: bool = False,
+        github_backend: str = "rest",
+        graphql_batch_size: int = DEFAULT_GRAPHQL_BATCH_SIZE,
+        rate_limiter: Optional[RateLimiter] = None,
+        read_ahead_workers: int = 0,
+        discovery_mode: str = "issues",
+        metadata_cache: Optional[MetadataCache] = None,
+        submissions_index: Optional[SubmissionsIndex] = None,
+    ):
         """
         Initialize the bounty processor.
 
         Args:
             github_token: GitHub API token
-            rates: Dictionary of currency conversion rates
+            rates: Currency conversion rates (PendingRates are joined when the first
+                bounty is valued)
+            max_workers: Maximum number of repositories fetched concurrently
+            http_cache: Optional conditional-GET cache used by the GitHub client
+            issue_store: Optional persisted issue store enabling incremental issue sync
+            full_resync: Refetch all open issues even when the issue store has a last sync time
+            github_backend: "rest" to fetch each repository through the REST API, or
+                "graphql" to fetch batches of repositories per GraphQL query
+            graphql_batch_size: Repositories per GraphQL query
+            rate_limiter: Optional scheduler pacing GitHub requests by the remaining budget
+            read_ahead_workers: Issue pages fetched in the background while earlier pages
+                are filtered (0 fetches pages one after another)
+            discovery_mode: "issues" to list every open issue of every repository, or
+                "search" to fetch only candidate bounty issues through the search API
+            metadata_cache: Optional persisted cache of repository languages and
+                organization listings
+            submissions_index: Optional cached index of the submission files used to
+                find reserved bounties (defaults to parsing submissions/ afresh)
         """
-        self.github_client = GitHubClient(github_token)
+        if github_backend not in GITHUB_BACKENDS:
+            raise ValueError(f"Unknown GitHub backend: {github_backend}")
+        if discovery_mode not in DISCOVERY_MODES:
+            raise ValueError(f"Unknown discovery mode: {discovery_mode}")
+        self.discovery_mode = discovery_mode
+        if discovery_mode == "search" and issue_store is not None:
+            logger.info("Search discovery fetches only open bounty candidates; incremental issue sync is disabled")
+            issue_store = None
+        self.github_backend = github_backend
+        self.graphql_batch_size = max(1, int(graphql_batch_size))
+        if github_backend == "graphql":
+            self.github_client = GitHubGraphQLClient(
+                github_token, cache=http_cache, rate_limiter=rate_limiter, read_ahead_workers=read_ahead_workers
+            )
+            if issue_store is not None:
+                logger.info("GraphQL backend fetches all open issues per query; incremental issue sync is disabled")
+                issue_store = None
+        else:
+            self.github_client = GitHubClient(
+                github_token, cache=http_cache, rate_limiter=rate_limiter, read_ahead_workers=read_ahead_workers
+            )
+        self.rate_limiter = rate_limiter
         self.currency_client = CurrencyClient()
         self.currency_client.rates = rates  # Use provided rates
-        self.bounty_data = []
+        self.max_workers = max(1, int(max_workers))
+        self.issue_store = issue_store
+        self.full_resync = full_resync
+        self.metadata_cache = metadata_cache
+        self.bounty_data: List[Bounty] = []
+        # Reference time of the run: bounty timestamps and ages are relative to it
+        self.now = datetime.now(timezone.utc)
+        self._timestamp = self.now.strftime("%Y-%m-%d %H:%M:%S")
         self.project_totals = {}
+        # Case-folded owner -> project_totals key (the first casing seen for that owner)
+        self.project_names: Dict[str, str] = {}
+        self.tracked_orgs: Set[str] = set()
         self.reserved_count = 0
+        self.submissions_index = submissions_index
         self.reserved_bounty_ids = self._get_reserved_bounty_ids()
 
     def _get_reserved_bounty_ids(self) -> Set[str]:
         """
         Scans active submissions and returns normalized owner/repo#number IDs.
         """
-        submission_path = "submissions"
+        index = self.submissions_index or SubmissionsIndex(DEFAULT_SUBMISSIONS_DIR)
         bounty_ids = set()
-        if os.path.isdir(submission_path):
-            logger.info(f"Scanning {submission_path} for reserved bounty IDs...")
-            for filename in os.listdir(submission_path):
-                if filename.endswith(".json"):
-                    try:
-                        with open(os.path.join(submission_path, filename), "r", encoding="utf-8") as f:
-                            submission = json.load(f)
-                    except (OSError, json.JSONDecodeError):
-                        continue
-
-                    status = str(submission.get("status", "")).strip().lower()
-                    wallet = str(submission.get("wallet_address", "")).strip()
-                    contributor = str(submission.get("contributor", "")).strip()
-                    if (
-                        status not in ACTIVE_SUBMISSION_STATUSES
-                        or wallet in PLACEHOLDERS
-                        or contributor in PLACEHOLDERS
-                    ):
-                        continue
-
-                    bounty_id = _normalize_bounty_id(submission.get("bounty_id", ""))
-                    if not bounty_id:
-                        bounty_id = _normalize_bounty_id(submission.get("original_issue_link", ""))
-                    if bounty_id:
-                        bounty_ids.add(bounty_id)
+        if index.directory.is_dir():
+            logger.info(f"Scanning {index.directory} for reserved bounty IDs...")
+            for submission in index.submissions():
+                status = str(submission.get("status", "")).strip().lower()
+                wallet = str(submission.get("wallet_address", "")).strip()
+                contributor = str(submission.get("contributor", "")).strip()
+                if (
+                    status not in ACTIVE_SUBMISSION_STATUSES
+                    or wallet in PLACEHOLDERS
+                    or contributor in PLACEHOLDERS
+                ):
+                    continue
+
+                bounty_id = _normalize_bounty_id(submission.get("bounty_id", ""))
+                if not bounty_id:
+                    bounty_id = _normalize_bounty_id(submission.get("original_issue_link", ""))
+                if bounty_id:
+                    bounty_ids.add(bounty_id)
             logger.info(f"Found {len(bounty_ids)} reserved bounty IDs.")
         else:
-            logger.warning(f"Submissions directory not found: {submission_path}")
+            logger.warning(f"Submissions directory not found: {index.directory}")
         return bounty_ids
 
     def process_repositories(self, repos_to_query: List[Dict[str, str]]) -> None:
         """
         Process repositories to find bounties.
 
+        Languages and issues are fetched for up to ``max_workers`` repositories (or
+        GraphQL batches, or search queries) at once; the results are processed in input
+        order so ``bounty_data`` and ``project_totals`` match a sequential scan.
+
         Args:
             repos_to_query: List of repository objects with 'owner' and 'repo' keys
         """
-        for repo in repos_to_query:
-            owner = repo['owner']
-            repo_name = repo['repo']
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            if self.discovery_mode == "search":
+                results = self._search_repositories(executor, repos_to_query)
+            elif self.github_backend == "graphql":
+                batches = [
+                    repos_to_query[i:i + self.graphql_batch_size]
+                    for i in range(0, len(repos_to_query), self.graphql_batch_size)
+                ]
+                self._set_pending_requests(len(batches))
+                batch_results = executor.map(self._fetch_repository_batch, batches)
+                results = (result for batch in batch_results for result in batch)
+            else:
+                # At least one languages and one issues request per repository
+                self._set_pending_requests(2 * len(repos_to_query))
+                results = executor.map(self._fetch_repository, repos_to_query)
+
+            for repo, (languages, issues) in zip(repos_to_query, results, strict=True):
+                owner = repo['owner']
+                repo_name = repo['repo']
+
+                primary_lang = languages[0] if languages else "Unknown"
+                secondary_lang = languages[1] if len(languages) > 1 else "None"
+
+                # Initialize project counter if not exists
+                self._project_totals_for(owner)
+
+                # Process each issue
+                for issue in issues:
+                    self._process_issue(issue, owner, repo_name, primary_lang, secondary_lang)
+        logger.info(f"Reserved bounties: {self.reserved_count}")
 
-            logger.info(f"Processing {owner}/{repo_name}...")
+    def _search_repositories(
+        self, executor: ThreadPoolExecutor, repos_to_query: List[Dict[str, str]]
+    ) -> List[Tuple[List[str], List[Dict[str, Any]]]]:
+        """
+        Find the open bounty candidates of the repositories through the search API.
 
-            # Get repository languages
-            languages = self.github_client.get_repository_languages(owner, repo_name)
-            primary_lang = languages[0] if languages else "Unknown"
-            secondary_lang = languages[1] if len(languages) > 1 else "None"
+        Repositories of organizations passed to process_organizations are searched
+        with one ``org:`` qualifier, the others with ``repo:`` qualifiers, batched into
+        as few queries as the query length allows. Languages are only fetched for
+        repositories with at least one candidate.
 
-            # Initialize project counter if not exists
-            project_key = _case_insensitive_key(self.project_totals, owner)
-            if project_key not in self.project_totals:
-                self.project_totals[project_key] = {"count": 0, "value": 0.0}
+        Args:
+            executor: Pool running the searches and language requests
+            repos_to_query: List of repository objects with 'owner' and 'repo' keys
 
-            # Get issues
-            issues = self.github_client.get_repository_issues(owner, repo_name)
+        Returns:
+            List of (languages, issues) tuples in the same order as repos_to_query
+        """
+        orgs = sorted(self.tracked_orgs)
+        org_keys = {org.lower() for org in orgs}
+        qualifiers = [f"org:{org}" for org in orgs] + [
+            f"repo:{repo['owner']}/{repo['repo']}" for repo in repos_to_query
+            if repo['owner'].lower() not in org_keys
+        ]
+        queries = [query for base in BOUNTY_SEARCH_QUERIES for query in build_search_queries(base, qualifiers)]
+        self._set_pending_requests(len(queries))
+        logger.info(f"Searching bounty candidates with {len(queries)} queries")
+
+        # Org qualifiers also match repositories skipped by process_organizations
+        wanted = {f"{repo['owner']}/{repo['repo']}".lower() for repo in repos_to_query}
+        found: Dict[str, Dict[int, Dict[str, Any]]] = {}
+        for matches in executor.map(self._search_bounty_candidates, queries):
+            for repo_key, issue in matches:
+                if repo_key in wanted:
+                    # The label and title searches overlap; keep one copy of each issue
+                    found.setdefault(repo_key, {})[issue["number"]] = issue
+
+        keys = [f"{repo['owner']}/{repo['repo']}".lower() for repo in repos_to_query]
+        self._set_pending_requests(sum(1 for key in keys if key in found))
+
+        def languages(repo: Dict[str, str], key: str) -> List[str]:
+            return self._repository_languages(repo) if key in found else []
+
+        return [
+            (repo_languages, sorted(found.get(key, {}).values(), key=lambda issue: issue["number"], reverse=True))
+            for key, repo_languages in zip(keys, executor.map(languages, repos_to_query, keys), strict=True)
+        ]
+
+    def _search_bounty_candidates(self, query: str) -> List[Tuple[str, Dict[str, Any]]]:
+        """
+        Run one bounty search on a worker thread.
 
-            # Process each issue
-            for issue in issues:
-                self._process_issue(issue, owner, repo_name, primary_lang, secondary_lang)
-        logger.info(f"Reserved bounties: {self.reserved_count}")
+        Args:
+            query: GitHub search query
+
+        Returns:
+            List of (lowercased owner/repo, trimmed issue) of open bounty candidates
+        """
+        matches = []
+        for issue in self.github_client.iter_search_issues(query):
+            if _is_bounty_candidate(issue):
+                repo_key = "/".join(issue.get("repository_url", "").split("/")[-2:]).lower()
+                matches.append((repo_key, trim_issue(issue)))
+        return matches
+
+    def _set_pending_requests(self, requests: int) -> None:
+        """Tell the rate limiter how many GitHub requests the scan still needs."""
+        if self.rate_limiter is not None:
+            self.rate_limiter.set_pending(requests)
+
+    def _fetch_repository(self, repo: Dict[str, str]) -> Tuple[List[str], List[Dict[str, Any]]]:
+        """
+        Fetch the languages and open issues of a single repository.
+
+        Runs on a worker thread, so it must not touch the processor's accumulated state.
+
+        Args:
+            repo: Repository object with 'owner' and 'repo' keys
+
+        Returns:
+            Tuple of (languages, open bounty candidate issues)
+        """
+        owner = repo['owner']
+        repo_name = repo['repo']
+
+        logger.info(f"Processing {owner}/{repo_name}...")
+
+        languages = self._repository_languages(repo)
+        if self.issue_store is None:
+            # Filter while pages arrive so raw non-bounty issues are dropped right away
+            issues = [
+                trim_issue(issue)
+                for issue in self.github_client.iter_repository_issues(owner, repo_name)
+                if _is_bounty_candidate(issue)
+            ]
+        else:
+            issues = self._sync_repository_issues(owner, repo_name)
+        return languages, issues
+
+    def _repository_languages(self, repo: Dict[str, str]) -> List[str]:
+        """
+        Get the languages of a repository from the metadata cache, or fetch them.
+
+        Args:
+            repo: Repository object with 'owner' and 'repo' keys, and 'pushed_at' when
+                it came from an organization listing
+
+        Returns:
+            List of languages (top 2 by usage)
+        """
+        owner, repo_name, pushed_at = repo['owner'], repo['repo'], repo.get('pushed_at')
+        if self.metadata_cache is not None:
+            cached = self.metadata_cache.get_languages(owner, repo_name, pushed_at)
+            if cached is not None:
+                return cached
+        languages = self.github_client.get_repository_languages(owner, repo_name)
+        # Empty results may come from a failed request; fetch those again next run
+        if self.metadata_cache is not None and languages:
+            self.metadata_cache.set_languages(owner, repo_name, languages, pushed_at)
+        return languages
+
+    def _organization_repos(self, org: str) -> List[Dict[str, Any]]:
+        """
+        Get the repositories of an organization from the metadata cache, or fetch them.
+
+        Args:
+            org: Organization name
+
+        Returns:
+            List of repository objects
+        """
+        if self.metadata_cache is not None:
+            cached = self.metadata_cache.get_org_repos(org)
+            if cached is not None:
+                logger.debug(f"Using cached repository listing for organization: {org}")
+                return cached
+        org_repos = self.github_client.get_organization_repos(org)
+        if self.metadata_cache is not None and org_repos:
+            self.metadata_cache.set_org_repos(org, org_repos)
+        return org_repos
+
+    def _fetch_repository_batch(self, repos: List[Dict[str, str]]) -> List[Tuple[List[str], List[Dict[str, Any]]]]:
+        """
+        Fetch the languages and open issues of a batch of repositories with one GraphQL query.
+
+        Args:
+            repos: Repository objects with 'owner' and 'repo' keys
+
+        Returns:
+            List of (languages, issues) tuples in the same order as repos
+        """
+        logger.info(f"Processing {', '.join(repo['owner'] + '/' + repo['repo'] for repo in repos)}...")
+        return self.github_client.fetch_repositories(repos)
+
+    def _sync_repository_issues(self, owner: str, repo_name: str) -> List[Dict[str, Any]]:
+        """
+        Bring the issue store up to date for a repository and return its open issues.
+
+        Only issues changed since the last sync are requested (including closures);
+        repositories without a usable last sync time, or all repositories when
+        ``full_resync`` is set, are refetched in full. When the listing stops early,
+        the stored issues and last sync time are kept, so the next run asks again.
+
+        Args:
+            owner: Repository owner
+            repo_name: Repository name
+
+        Returns:
+            List of stored open bounty issues, newest first
+        """
+        synced_at = format_sync_time(datetime.now(timezone.utc))
+        since = None if self.full_resync else self.issue_store.last_sync(owner, repo_name)
+
+        def keep(issue: Dict[str, Any]) -> bool:
+            return is_bounty_issue(issue.get("title", ""), issue.get("labels", []))
+
+        # replace() and merge() consume the whole listing before touching the store
+        try:
+            if since is None:
+                issues = self.github_client.iter_repository_issues(owner, repo_name, require_complete=True)
+                self.issue_store.replace(owner, repo_name, issues, synced_at, keep=keep)
+            else:
+                changed = self.github_client.iter_repository_issues(
+                    owner, repo_name, state="all", since=since, require_complete=True
+                )
+                merged = self.issue_store.merge(owner, repo_name, changed, synced_at, keep=keep)
+                logger.debug(f"Merged {merged} changed issues for {owner}/{repo_name} since {since}")
+        except IncompleteListingError as e:
+            logger.warning(f"Keeping stored issues of {owner}/{repo_name}: {e}")
+        return self.issue_store.open_issues(owner, repo_name)
 
     def process_organizations(self, orgs_to_query: List[Dict[str, str]], repos_to_query: List[Dict[str, str]]) -> List[Dict[str, str]]:
         """
@@ -164,12 +439,14 @@ class BountyProcessor:
         """
         updated_repos = repos_to_query.copy()
         processed_repos = {f"{repo['owner']}/{repo['repo']}".lower() for repo in repos_to_query}
+        self._set_pending_requests(len(orgs_to_query))
 
         for org_entry in orgs_to_query:
             org = org_entry['org']
+            self.tracked_orgs.add(org)
             logger.info(f"Fetching repositories for organization: {org}")
 
-            org_repos = self.github_client.get_organization_repos(org)
+            org_repos = self._organization_repos(org)
             for repo in org_repos:
                 # Skip archived repositories
                 if repo.get('archived', False):
@@ -187,6 +464,9 @@ class BountyProcessor:
                 if repo_key not in processed_repos:
                     logger.info(f"Adding repository from organization: {repo_id}")
                     repo_entry = {"owner": org, "repo": repo['name']}
+                    if repo.get('pushed_at'):
+                        # Lets the metadata cache tell whether the languages can have changed
+                        repo_entry['pushed_at'] = repo['pushed_at']
                     updated_repos.append(repo_entry)
                     processed_repos.add(repo_key)
 
@@ -222,42 +502,53 @@ class BountyProcessor:
                 amount, currency = extract_bounty_info(issue)
 
                 # Store the bounty information
-                bounty_info = {
-                    "timestamp": datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S"),
-                    "owner": owner,
-                    "repo": repo_name,
-                    "title": title,
-                    "url": issue['html_url'],
-                    "amount": amount,
-                    "currency": currency,
-                    "primary_lang": primary_lang,
-                    "secondary_lang": secondary_lang,
-                    "labels": [label['name'] for label in labels],
-                    "issue_number": issue['number'],
-                    "creator": issue['user']['login'],  # GitHub username of the issue creator
-                    "status": issue['state'],  # Add status
-                    "created_at": issue.get("created_at", ""),
-                    "updated_at": issue.get("updated_at", ""),
-                    "comments": issue.get("comments", 0),
-                    "assignees": [assignee.get("login", "") for assignee in issue.get("assignees", [])],
-                }
+                bounty_info = Bounty(
+                    timestamp=self._timestamp,
+                    owner=owner,
+                    repo=repo_name,
+                    title=title,
+                    url=issue['html_url'],
+                    amount=amount,
+                    currency=currency,
+                    primary_lang=primary_lang,
+                    secondary_lang=secondary_lang,
+                    labels=[label['name'] for label in labels],
+                    issue_number=issue['number'],
+                    creator=issue['user']['login'],  # GitHub username of the issue creator
+                    status=issue['state'],  # Add status
+                    created_at=issue.get("created_at", ""),
+                    updated_at=issue.get("updated_at", ""),
+                    comments=issue.get("comments", 0),
+                    assignees=[assignee.get("login", "") for assignee in issue.get("assignees", [])],
+                    now=self.now,
+                )
 
                 self.bounty_data.append(bounty_info)
 
                 # Update project totals
-                project_key = _case_insensitive_key(self.project_totals, owner)
-                self.project_totals[project_key]["count"] += 1
+                totals = self._project_totals_for(owner)
+                totals["count"] += 1
 
                 # Calculate ERG value for totals
                 erg_value = self.currency_client.calculate_erg_value(amount, currency)
-                self.project_totals[project_key]["value"] += erg_value
+                totals["value"] += erg_value
+
+    def _project_totals_for(self, owner: str) -> Dict[str, Any]:
+        """
+        Get the project totals of an owner, ignoring case, creating them if missing.
+
+        This is the only place totals are added, so project_names always indexes
+        every key of project_totals.
+        """
+        project_key = self.project_names.setdefault(owner.casefold(), owner)
+        return self.project_totals.setdefault(project_key, {"count": 0, "value": 0.0})
 
-    def get_bounty_data(self) -> List[Dict[str, Any]]:
+    def get_bounty_data(self) -> List[Bounty]:
         """
         Get the processed bounty data.
 
         Returns:
-            List of bounty information dictionaries
+            List of bounty records
         """
         return self.bounty_data
 
@@ -277,23 +568,33 @@ class BountyProcessor:
         Args:
             extra_bounties: List of bounty objects with all required fields
         """
-        for bounty in extra_bounties:
+        for entry in extra_bounties:
             # Add the bounty to the bounty data
+            bounty = entry if isinstance(entry, Bounty) else Bounty.from_dict(entry, now=self.now)
             self.bounty_data.append(bounty)
 
             # Update project totals
-            owner = bounty["owner"]
-            project_key = _case_insensitive_key(self.project_totals, owner)
-            if project_key not in self.project_totals:
-                self.project_totals[project_key] = {"count": 0, "value": 0.0}
-
-            self.project_totals[project_key]["count"] += 1
+            totals = self._project_totals_for(bounty["owner"])
+            totals["count"] += 1
 
             # Calculate ERG value for totals
-            amount = bounty.get("amount", "Not specified")
-            currency = bounty.get("currency", "Not specified")
+            amount = bounty.amount
+            currency = bounty.currency
             erg_value = self.currency_client.calculate_erg_value(amount, currency)
-            self.project_totals[project_key]["value"] += erg_value
+            totals["value"] += erg_value
+
+    def write_snapshot(self, path: str, diff_path: Optional[str] = None) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Persist the processed bounties as a JSON Lines snapshot keyed by owner/repo#number.
+
+        Args:
+            path: Snapshot file, also holding the previous run's snapshot
+            diff_path: File the changes since the previous snapshot are written to
+
+        Returns:
+            Added, removed, value-changed and status-changed bounties
+        """
+        return write_snapshot(self.bounty_data, path, diff_path)
 
     def get_total_stats(self) -> Tuple[int, float]:
         """
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Bounty Snapshot Module
+
+This module persists every bounty of a run as a canonical JSON Lines file, one
+compact object per line sorted by the normalized ``owner/repo#number`` key:
+
+    {"amount":"150","currency":"SigUSD","key":"ergoplatform/sigma-rust#7",...}
+
+The snapshot is machine readable, so dashboards and notifications do not have to
+parse the generated markdown. Each run also compares the new bounties with the
+previous snapshot and writes the differences as JSON:
+
+- ``added`` / ``removed``: bounties that appeared or disappeared
+- ``value_changed``: bounties whose amount or currency changed
+- ``status_changed``: bounties whose status changed (e.g. open to Reserved)
+
+The run's generation timestamp is left out of the records, so an unchanged set of
+bounties produces a byte-identical snapshot and the file is not rewritten.
+"""
+
+import json
+import logging
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Mapping, Union
+
+from ..utils.common import write_text_if_changed
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Bounty keys left out of snapshot records (the run's generation time)
+EXCLUDED_FIELDS = {"timestamp"}
+VALUE_FIELDS = ("amount", "currency")
+STATUS_FIELDS = ("status",)
+
+
+def bounty_key(bounty: Mapping[str, Any]) -> str:
+    """Get the normalized ``owner/repo#number`` key of a bounty."""
+    return f"{bounty.get('owner', '')}/{bounty.get('repo', '')}#{bounty.get('issue_number', '')}".strip().lower()
+
+
+def snapshot_records(bounties: Iterable[Mapping[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """
+    Build the snapshot records of a run's bounties.
+
+    Args:
+        bounties: Bounty records or dictionaries
+
+    Returns:
+        Dictionary mapping bounty keys to their records, sorted by key; when two
+        bounties share a key the last one wins
+    """
+    records = {}
+    for bounty in bounties:
+        record = {key: value for key, value in bounty.items() if key not in EXCLUDED_FIELDS}
+        record["key"] = bounty_key(bounty)
+        if record["key"] in records:
+            logger.warning(f"Duplicate bounty key in snapshot: {record['key']}")
+        records[record["key"]] = record
+    return dict(sorted(records.items()))
+
+
+def load_snapshot(path: Union[str, Path]) -> Dict[str, Dict[str, Any]]:
+    """
+    Load a snapshot written by a previous run.
+
+    Args:
+        path: JSON Lines snapshot file
+
+    Returns:
+        Dictionary mapping bounty keys to their records (empty if the file is
+        missing or unreadable); malformed lines are skipped
+    """
+    path = Path(path)
+    records: Dict[str, Dict[str, Any]] = {}
+    if not path.exists():
+        return records
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if isinstance(record, dict) and "key" in record:
+                    records[record["key"]] = record
+    except (OSError, UnicodeDecodeError) as e:
+        logger.warning(f"Ignoring unreadable bounty snapshot {path}: {e}")
+        return {}
+    return records
+
+
+def _changes(
+    previous: Dict[str, Dict[str, Any]], current: Dict[str, Dict[str, Any]], fields: Iterable[str]
+) -> List[Dict[str, Any]]:
+    fields = tuple(fields)
+    changes = []
+    for key in sorted(previous.keys() & current.keys()):
+        before = {field: previous[key].get(field) for field in fields}
+        after = {field: current[key].get(field) for field in fields}
+        if before != after:
+            changes.append({
+                "key": key,
+                "title": current[key].get("title"),
+                "url": current[key].get("url"),
+                "before": before,
+                "after": after,
+            })
+    return changes
+
+
+def diff_snapshots(
+    previous: Dict[str, Dict[str, Any]], current: Dict[str, Dict[str, Any]]
+) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Compare two snapshots.
+
+    Args:
+        previous: Records of the previous run by key
+        current: Records of this run by key
+
+    Returns:
+        Dictionary with ``added`` and ``removed`` records, and ``value_changed``
+        and ``status_changed`` entries holding the key, title, URL and the
+        changed fields before and after; every list is sorted by key
+    """
+    return {
+        "added": [current[key] for key in sorted(current.keys() - previous.keys())],
+        "removed": [previous[key] for key in sorted(previous.keys() - current.keys())],
+        "value_changed": _changes(previous, current, VALUE_FIELDS),
+        "status_changed": _changes(previous, current, STATUS_FIELDS),
+    }
+
+
+def write_snapshot(
+    bounties: Iterable[Mapping[str, Any]],
+    path: Union[str, Path],
+    diff_path: Union[str, Path, None] = None,
+) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Replace the snapshot with this run's bounties and record the differences.
+
+    Args:
+        bounties: Bounty records or dictionaries of this run
+        path: JSON Lines snapshot file
+        diff_path: JSON file the differences to the previous snapshot are written
+            to (None only returns them)
+
+    Returns:
+        The differences, as returned by diff_snapshots
+    """
+    current = snapshot_records(bounties)
+    diff = diff_snapshots(load_snapshot(path), current)
+
+    lines = [json.dumps(record, sort_keys=True, separators=(",", ":"), ensure_ascii=False) for record in current.values()]
+    write_text_if_changed(path, "".join(f"{line}\n" for line in lines))
+    if diff_path:
+        write_text_if_changed(diff_path, json.dumps(diff, indent=2, ensure_ascii=False) + "\n")
+
+    logger.info(
+        f"Bounty snapshot: {len(diff['added'])} added, {len(diff['removed'])} removed, "
+        f"{len(diff['value_changed'])} value changed, {len(diff['status_changed'])} status changed"
+    )
+    return diff
@@ -15,16 +15,21 @@ Each generator function follows a similar pattern: it takes input data, processe
 formats markdown content, and writes output files.
 """
 
+import hashlib
 import logging
+import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
-from typing import Dict, List, Any
+from typing import Callable, Dict, List, Any, Iterable, Mapping, Optional, Union
 from pathlib import Path
 import os
+from functools import partial
 import json # Added json import for CONSTANTS loading
 
 # Import from sibling modules and parent packages
 from ..utils.common import (
     ensure_directory,
+    write_text_if_changed,
     get_current_timestamp,
     create_claim_url,
     get_currency_filename,
@@ -46,7 +51,8 @@ from ..utils.markdown import (
     format_organization_link,
     format_language_link
 )
-from ..api.currency_client import CurrencyClient
+from ..api.currency_client import ErgValuation
+from ..core.bounty import age_in_days
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -62,6 +68,17 @@ except Exception as e:
     logger.warning(f"Could not load constants from {CONSTANTS_PATH} for generators: {e}")
 # --- End Load Constants ---
 
+# Number of pages rendered and written concurrently
+RENDER_WORKERS = 8
+
+# Open bounties created at least this many days ago are listed as stale
+STALE_BOUNTY_DAYS = 180
+
+# Lines that only carry the generation time and are ignored when comparing pages
+TIMESTAMP_LINE_PATTERN = re.compile(
+    r"^(?:<!-- Generated on: .* -->|\*Report generated: .* UTC\*)$", re.MULTILINE
+)
+
 
 # --- Grouping and Filtering Functions (Moved from BountyProcessor) ---
 
@@ -93,20 +110,27 @@ def group_by_language(bounty_data: List[Dict[str, Any]]) -> Dict[str, List[Dict[
     return languages
 
 
-def group_by_organization(bounty_data: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+def group_by_organization(
+    bounty_data: List[Dict[str, Any]],
+    org_names: Optional[Mapping[str, str]] = None
+) -> Dict[str, List[Dict[str, Any]]]:
     """
     Group bounties by organization.
 
     Args:
         bounty_data: List of bounty data dictionaries
+        org_names: Case-folded owner -> display name (BountyProcessor.project_names);
+            owners missing from it use the casing of their first bounty
 
     Returns:
         Dictionary of organization -> list of bounties
     """
     orgs = {}
+    # Case-folded owner -> display name of the first bounty seen for that org
+    org_keys = dict(org_names or {})
     for bounty in bounty_data:
         owner = bounty["owner"]
-        org_key = next((key for key in orgs if key.lower() == owner.lower()), owner)
+        org_key = org_keys.setdefault(owner.casefold(), owner)
         if org_key not in orgs:
             orgs[org_key] = []
         orgs[org_key].append(bounty)
@@ -137,9 +161,55 @@ def group_by_currency(bounty_data: List[Dict[str, Any]]) -> Dict[str, List[Dict[
     return currencies_dict
 
 
+class BountyIndex:
+    """
+    Language, organization and currency groupings of a run's bounties together
+    with the navigation counts shown on every page.
+
+    Built once per run and shared by all generators instead of regrouping the
+    full bounty list for every page.
+    """
+
+    def __init__(self, bounty_data: List[Dict[str, Any]], org_names: Optional[Mapping[str, str]] = None):
+        """
+        Group the bounties.
+
+        Args:
+            bounty_data: List of bounty data dictionaries
+            org_names: Case-folded owner -> display name, so organization pages
+                and files use the same casing as the project totals
+        """
+        self.bounty_data = bounty_data
+        self.languages = group_by_language(bounty_data)
+        self.organizations = group_by_organization(bounty_data, org_names)
+        self.currencies = group_by_currency(bounty_data)
+        self.not_specified = [b for b in bounty_data if b["currency"] == "Not specified"]
+
+        # Navigation counts ("Not specified" counts as a currency when present)
+        self.languages_count = len(self.languages)
+        self.orgs_count = len(self.organizations)
+        self.currencies_count = len(self.currencies) + (1 if self.not_specified else 0)
+
+
+def _get_index(bounty_data: List[Dict[str, Any]], index: Optional[BountyIndex]) -> BountyIndex:
+    """Return the shared index, or build one for bounty_data when none is passed."""
+    return index if index is not None else BountyIndex(bounty_data)
+
+
+def _get_valuation(
+    bounty_data: List[Dict[str, Any]],
+    conversion_rates: Dict[str, float],
+    valuation: Optional[ErgValuation]
+) -> ErgValuation:
+    """Return the shared valuation, or compute one for bounty_data when none is passed."""
+    return valuation if valuation is not None else ErgValuation(bounty_data, conversion_rates)
+
+
 def calculate_currency_totals(
     bounty_data: List[Dict[str, Any]],
-    conversion_rates: Dict[str, float]
+    conversion_rates: Dict[str, float],
+    valuation: Optional[ErgValuation] = None,
+    index: Optional[BountyIndex] = None
 ) -> Dict[str, Dict[str, Any]]:
     """
     Calculate totals by currency.
@@ -147,14 +217,15 @@ def calculate_currency_totals(
     Args:
         bounty_data: List of bounty data dictionaries
         conversion_rates: Dictionary of currency conversion rates
+        valuation: Optional precomputed ERG values shared across generators
+        index: Optional precomputed bounty groupings shared across generators
 
     Returns:
         Dictionary of currency -> {count, value} totals
     """
     currency_totals = {}
-    currencies_dict = group_by_currency(bounty_data)
-    currency_client = CurrencyClient()
-    currency_client.rates = conversion_rates
+    currencies_dict = _get_index(bounty_data, index).currencies
+    valuation = _get_valuation(bounty_data, conversion_rates, valuation)
 
     for currency, currency_bounties in currencies_dict.items():
         # Count only bounties with specified amounts (excluding "Ongoing" programs)
@@ -170,10 +241,7 @@ def calculate_currency_totals(
 
         # Calculate total value
         for bounty in specified_bounties:
-            amount = bounty["amount"]
-            currency_totals[currency]["value"] += currency_client.calculate_erg_value(
-                amount, currency
-            )
+            currency_totals[currency]["value"] += valuation.value(bounty)
 
     return currency_totals
 
@@ -181,7 +249,8 @@ def calculate_currency_totals(
 def find_featured_bounties(
     bounty_data: List[Dict[str, Any]],
     conversion_rates: Dict[str, float],
-    count: int = 2
+    count: int = 2,
+    valuation: Optional[ErgValuation] = None
 ) -> List[Dict[str, Any]]:
     """
     Find the highest-value bounties to feature.
@@ -190,39 +259,29 @@ def find_featured_bounties(
         bounty_data: List of bounty data dictionaries
         conversion_rates: Dictionary of currency conversion rates
         count: Number of featured bounties to return
+        valuation: Optional precomputed ERG values shared across generators
 
     Returns:
-        List of high-value bounty objects with ERG value
+        List of the highest-value bounties, highest first
     """
-    featured_bounties = []
-    currency_client = CurrencyClient()
-    currency_client.rates = conversion_rates
+    valuation = _get_valuation(bounty_data, conversion_rates, valuation)
 
-    for bounty in bounty_data:
-        amount = bounty["amount"]
-        currency = bounty["currency"]
-
-        if amount != "Not specified" and amount != "Ongoing":
-            try:
-                # Calculate ERG equivalent
-                value = currency_client.calculate_erg_value(amount, currency)
-
-                featured_bounties.append({
-                    **bounty,
-                    "value": value
-                })
-            except (ValueError, TypeError):
-                pass
+    # Bounties are returned as they are; valuation.value() gives their ERG value
+    featured_bounties = [
+        bounty for bounty in bounty_data
+        if bounty["amount"] != "Not specified" and bounty["amount"] != "Ongoing"
+    ]
 
     # Sort by value and get top bounties
-    featured_bounties.sort(key=lambda x: x["value"], reverse=True)
+    featured_bounties.sort(key=valuation.value, reverse=True)
     return featured_bounties[:count]
 
 
 def find_high_value_bounties(
     bounty_data: List[Dict[str, Any]],
     conversion_rates: Dict[str, float],
-    threshold: float = 1000.0
+    threshold: float = 1000.0,
+    valuation: Optional[ErgValuation] = None
 ) -> List[Dict[str, Any]]:
     """
     Find bounties with value above a threshold.
@@ -231,34 +290,22 @@ def find_high_value_bounties(
         bounty_data: List of bounty data dictionaries
         conversion_rates: Dictionary of currency conversion rates
         threshold: Minimum ERG value for high-value bounties
+        valuation: Optional precomputed ERG values shared across generators
 
     Returns:
         List of high-value bounty objects sorted by value
     """
-    high_value_bounties = []
-    currency_client = CurrencyClient()
-    currency_client.rates = conversion_rates
+    valuation = _get_valuation(bounty_data, conversion_rates, valuation)
 
-    for bounty in bounty_data:
-        amount = bounty["amount"]
-        currency = bounty["currency"]
-
-        if amount != "Not specified" and amount != "Ongoing":
-            try:
-                # Calculate ERG equivalent
-                value = currency_client.calculate_erg_value(amount, currency)
-
-                if value >= threshold:
-                    high_value_bounties.append({
-                        **bounty,
-                        "value": value,
-                        "status": bounty.get("status", "")
-                    })
-            except (ValueError, TypeError):
-                pass
+    # Bounties are returned as they are; valuation.value() gives their ERG value
+    high_value_bounties = [
+        bounty for bounty in bounty_data
+        if bounty["amount"] != "Not specified" and bounty["amount"] != "Ongoing"
+        and valuation.value(bounty) >= threshold
+    ]
 
     # Sort by value
-    high_value_bounties.sort(key=lambda x: x["value"], reverse=True)
+    high_value_bounties.sort(key=valuation.value, reverse=True)
     return high_value_bounties
 
 
@@ -290,12 +337,90 @@ def find_beginner_friendly_bounties(bounty_data: List[Dict[str, Any]]) -> List[D
 
 # --- Generator Functions ---
 
-def _clear_markdown_dir(directory: Path) -> None:
-    """Remove old generated markdown pages before writing current category pages."""
-    ensure_directory(directory)
+def _content_hash(content: str) -> str:
+    """Hash page content with its generation timestamps removed."""
+    return hashlib.sha256(TIMESTAMP_LINE_PATTERN.sub("", content).encode("utf-8")).hexdigest()
+
+
+def _skip_timestamp_only_changes() -> bool:
+    """Whether pages that differ only in their timestamps keep the existing file."""
+    if os.environ.get("FORCE_REFRESH", "").lower() == "true":
+        return False
+    return bool(CONSTANTS.get("output", {}).get("skip_timestamp_only_changes", True))
+
+
+def _write_page_if_changed(filename: Union[str, Path], content: str) -> bool:
+    """
+    Write a generated page atomically unless its content is unchanged.
+
+    Pages whose only difference from the file on disk is the generation timestamp
+    keep the existing file (and its timestamp), unless disabled through
+    output.skip_timestamp_only_changes or FORCE_REFRESH.
+
+    Args:
+        filename: The output file path.
+        content: The full page content.
+
+    Returns:
+        True if the page was written, False if the existing file was kept.
+    """
+    if _skip_timestamp_only_changes():
+        try:
+            existing = Path(filename).read_text(encoding="utf-8")
+        except (OSError, UnicodeDecodeError):
+            existing = None
+        if existing is not None and _content_hash(existing) == _content_hash(content):
+            logger.debug(f"Only timestamps changed, keeping {filename}")
+            return False
+    return write_text_if_changed(filename, content)
+
+
+def _write_page(filename: Union[str, Path], content: str) -> bool:
+    """
+    Write a generated page, logging instead of raising on errors.
+
+    Args:
+        filename: The output file path.
+        content: The full page content.
+
+    Returns:
+        True if the page was written, False if it was unchanged or could not be written.
+    """
+    try:
+        written = _write_page_if_changed(filename, content)
+    except Exception as e:
+        logger.error(f"Error writing file {filename}: {e}")
+        return False
+    if written:
+        logger.debug(f"Successfully wrote {filename}")
+    return written
+
+
+def _render_pages(jobs: List[Callable[[], Any]]) -> List[Any]:
+    """
+    Run page rendering jobs on a thread pool.
+
+    Args:
+        jobs: Callables that each render and write one page.
+
+    Returns:
+        The job results, in the order of jobs.
+    """
+    if not jobs:
+        return []
+    with ThreadPoolExecutor(max_workers=min(RENDER_WORKERS, len(jobs))) as executor:
+        return list(executor.map(lambda job: job(), jobs))
+
+
+def _remove_stale_pages(directory: Path, current_pages: Iterable[Union[str, Path]]) -> None:
+    """Remove generated markdown pages in directory that were not part of this run."""
+    keep = {Path(page).name for page in current_pages}
     for path in directory.glob("*.md"):
+        if path.name in keep:
+            continue
         try:
             path.unlink()
+            logger.info(f"Removed stale generated file {path}")
         except OSError as e:
             logger.error(f"Error removing stale generated file {path}: {e}")
             raise
@@ -312,8 +437,10 @@ def _generate_markdown_page(
     # Add flags to control table columns
     show_org: bool = True,
     show_language: bool = True,
-    sort_by: str = "value"
-) -> None:
+    sort_by: str = "value",
+    valuation: Optional[ErgValuation] = None,
+    index: Optional[BountyIndex] = None
+) -> bool:
     """
     Helper function to generate a standard markdown bounty page.
 
@@ -326,23 +453,24 @@ def _generate_markdown_page(
         total_bounties: Total number of bounties across all categories.
         nav_relative_path: Relative path for navigation links.
         extra_content: Optional extra markdown content to insert before the main table.
+        valuation: Optional precomputed ERG values shared across generators.
+        index: Optional precomputed bounty groupings shared across generators.
+
+    Returns:
+        True if the page was written, False if it was unchanged or could not be written.
     """
     logger.debug(f"Generating page: {filename}")
 
-    # Calculate necessary counts for navigation
-    languages = group_by_language(all_bounty_data)
-    currencies_dict = group_by_currency(all_bounty_data)
-    orgs = group_by_organization(all_bounty_data)
-    # Include "Not specified" if present for accurate count
-    currencies_count = len(currencies_dict) + (1 if any(b["currency"] == "Not specified" for b in all_bounty_data) else 0)
-    orgs_count = len(orgs)
-    languages_count = len(languages)
+    # Navigation counts come from the run-wide index
+    index = _get_index(all_bounty_data, index)
+    currencies_count = index.currencies_count
+    orgs_count = index.orgs_count
+    languages_count = index.languages_count
 
     # Calculate total value for this specific page
-    currency_client = CurrencyClient()
-    currency_client.rates = conversion_rates
+    valuation = _get_valuation(all_bounty_data, conversion_rates, valuation)
     page_value = sum(
-        currency_client.calculate_erg_value(b["amount"], b["currency"])
+        valuation.value(b)
         for b in page_bounties
         if b["amount"] != "Not specified" and b["amount"] != "Ongoing"
     )
@@ -379,7 +507,8 @@ def _generate_markdown_page(
         show_org=show_org,
         show_language=show_language,
         sort_by=sort_by,
-        link_prefix=nav_relative_path
+        link_prefix=nav_relative_path,
+        valuation=valuation
     )
 
     # Add footer buttons
@@ -389,19 +518,16 @@ def _generate_markdown_page(
     final_content = wrap_with_guardrails(content, title) # Use wrap_with_guardrails
 
     # Write to file
-    try:
-        with open(filename, 'w', encoding='utf-8') as f:
-            f.write(final_content)
-        logger.debug(f"Successfully wrote {filename}")
-    except Exception as e:
-        logger.error(f"Error writing file {filename}: {e}")
+    return _write_page(filename, final_content)
 
 
 def generate_language_files(
     bounty_data: List[Dict[str, Any]],
     conversion_rates: Dict[str, float],
     total_bounties: int,
-    bounties_dir: str
+    bounties_dir: str,
+    valuation: Optional[ErgValuation] = None,
+    index: Optional[BountyIndex] = None
 ) -> None:
     """
     Generate language-specific markdown files.
@@ -411,18 +537,26 @@ def generate_language_files(
         conversion_rates: Dictionary of conversion rates
         total_bounties: Total number of bounties
         bounties_dir: Bounties directory
+        valuation: Optional precomputed ERG values shared across generators
+        index: Optional precomputed bounty groupings shared across generators
     """
-    languages = group_by_language(bounty_data)
+    index = _get_index(bounty_data, index)
+    languages = index.languages
     language_dir = Path(bounties_dir) / 'by_language'
-    _clear_markdown_dir(language_dir)
+    ensure_directory(language_dir)
 
     logger.info(f"Generating language-specific files for {len(languages)} languages")
+    valuation = _get_valuation(bounty_data, conversion_rates, valuation)
 
+    jobs = []
+    language_files = []
     for language, language_bounties in languages.items():
         language_file = language_dir / f'{language.lower()}.md'
         page_title = f"# {language} Bounties"
+        language_files.append(language_file)
 
-        _generate_markdown_page(
+        jobs.append(partial(
+            _generate_markdown_page,
             filename=str(language_file),
             title=page_title,
             page_bounties=language_bounties,
@@ -430,16 +564,22 @@ def generate_language_files(
             conversion_rates=conversion_rates,
             total_bounties=total_bounties,
             nav_relative_path="../",
-            show_language=False # Don't show language column on language page
-        )
-    logger.info(f"Generated {len(languages)} language-specific files")
+            show_language=False, # Don't show language column on language page
+            valuation=valuation,
+            index=index
+        ))
+    written = sum(_render_pages(jobs))
+    _remove_stale_pages(language_dir, language_files)
+    logger.info(f"Generated {len(languages)} language-specific files ({written} changed)")
 
 
 def generate_organization_files(
     bounty_data: List[Dict[str, Any]],
     conversion_rates: Dict[str, float],
     total_bounties: int,
-    bounties_dir: str
+    bounties_dir: str,
+    valuation: Optional[ErgValuation] = None,
+    index: Optional[BountyIndex] = None
 ) -> None:
     """
     Generate organization-specific markdown files.
@@ -449,18 +589,26 @@ def generate_organization_files(
         conversion_rates: Dictionary of conversion rates
         total_bounties: Total number of bounties
         bounties_dir: Bounties directory
+        valuation: Optional precomputed ERG values shared across generators
+        index: Optional precomputed bounty groupings shared across generators
     """
-    orgs = group_by_organization(bounty_data)
+    index = _get_index(bounty_data, index)
+    orgs = index.organizations
     org_dir = Path(bounties_dir) / 'by_org'
-    _clear_markdown_dir(org_dir)
+    ensure_directory(org_dir)
 
     logger.info(f"Generating organization-specific files for {len(orgs)} organizations")
+    valuation = _get_valuation(bounty_data, conversion_rates, valuation)
 
+    jobs = []
+    org_files = []
     for org, org_bounties in orgs.items():
         org_file = org_dir / f'{org.lower()}.md'
         page_title = f"# {org} Bounties"
+        org_files.append(org_file)
 
-        _generate_markdown_page(
+        jobs.append(partial(
+            _generate_markdown_page,
             filename=str(org_file),
             title=page_title,
             page_bounties=org_bounties,
@@ -468,16 +616,22 @@ def generate_organization_files(
             conversion_rates=conversion_rates,
             total_bounties=total_bounties,
             nav_relative_path="../",
-            show_org=False # Don't show org column on org page
-        )
-    logger.info(f"Generated {len(orgs)} organization-specific files")
+            show_org=False, # Don't show org column on org page
+            valuation=valuation,
+            index=index
+        ))
+    written = sum(_render_pages(jobs))
+    _remove_stale_pages(org_dir, org_files)
+    logger.info(f"Generated {len(orgs)} organization-specific files ({written} changed)")
 
 
 def generate_currency_files(
     bounty_data: List[Dict[str, Any]],
     conversion_rates: Dict[str, float],
     total_bounties: int,
-    bounties_dir: str
+    bounties_dir: str,
+    valuation: Optional[ErgValuation] = None,
+    index: Optional[BountyIndex] = None
 ) -> None:
     """
     Generate currency-specific markdown files.
@@ -487,29 +641,29 @@ def generate_currency_files(
         conversion_rates: Dictionary of conversion rates
         total_bounties: Total number of bounties
         bounties_dir: Bounties directory
+        valuation: Optional precomputed ERG values shared across generators
+        index: Optional precomputed bounty groupings shared across generators
     """
-    currencies_dict = group_by_currency(bounty_data)
+    index = _get_index(bounty_data, index)
+    currencies_dict = index.currencies
     currency_dir = Path(bounties_dir) / 'by_currency'
-    _clear_markdown_dir(currency_dir)
+    ensure_directory(currency_dir)
 
     logger.info(f"Generating currency-specific files for {len(currencies_dict)} currencies")
 
     # Reverted: Write currency-specific Markdown files manually
-    languages = group_by_language(bounty_data) # Needed for nav
-    orgs = group_by_organization(bounty_data) # Needed for nav
-    currencies_count = len(currencies_dict) + (1 if any(b["currency"] == "Not specified" for b in bounty_data) else 0) # Needed for nav
+    languages = index.languages # Needed for nav
+    orgs = index.organizations # Needed for nav
+    currencies_count = index.currencies_count # Needed for nav
 
-    currency_client = CurrencyClient() # Needed for value calc
-    currency_client.rates = conversion_rates
+    valuation = _get_valuation(bounty_data, conversion_rates, valuation) # Needed for value calc
 
-    for currency, currency_bounties in currencies_dict.items():
-        currency_file_name = get_currency_filename(currency)
-        currency_file = currency_dir / f'{currency_file_name}.md'
+    def generate_currency_page(currency: str, currency_bounties: List[Dict[str, Any]], currency_file: Path) -> bool:
         display_name = get_currency_display_name(currency)
         page_title = f"# {display_name} Bounties"
 
         currency_value = sum(
-            currency_client.calculate_erg_value(b["amount"], currency)
+            valuation.value(b)
             for b in currency_bounties
             if b["amount"] != "Not specified" and b["amount"] != "Ongoing"
         )
@@ -538,22 +692,22 @@ def generate_currency_files(
 
         content += f"## {display_name} Bounties\n\n"
         # Currency pages show all columns (defaults are True)
-        content += generate_standard_bounty_table(currency_bounties, conversion_rates, link_prefix="../")
+        content += generate_standard_bounty_table(currency_bounties, conversion_rates, link_prefix="../", valuation=valuation)
         content += add_footer_buttons("../")
 
         final_content = wrap_with_guardrails(content, page_title)
-        try:
-            with open(currency_file, 'w', encoding='utf-8') as f:
-                f.write(final_content)
-            logger.debug(f"Successfully wrote {currency_file}")
-        except Exception as e:
-            logger.error(f"Error writing file {currency_file}: {e}")
+        return _write_page(currency_file, final_content)
 
+    jobs = []
+    currency_files = []
+    for currency, currency_bounties in currencies_dict.items():
+        currency_file = currency_dir / f'{get_currency_filename(currency)}.md'
+        currency_files.append(currency_file)
+        jobs.append(partial(generate_currency_page, currency, currency_bounties, currency_file))
+    written = sum(_render_pages(jobs))
 
     # Don't forget the "Not specified" currency
-    not_specified_bounties = [
-        b for b in bounty_data if b["currency"] == "Not specified"
-    ]
+    not_specified_bounties = index.not_specified
 
     if not_specified_bounties:
         not_specified_file = currency_dir / 'not_specified.md'
@@ -573,28 +727,41 @@ def generate_currency_files(
         )
         content += "## Bounties with Unspecified Value\n\n"
         # Not specified page shows all columns (defaults are True)
-        content += generate_standard_bounty_table(not_specified_bounties, conversion_rates, link_prefix="../")
+        content += generate_standard_bounty_table(not_specified_bounties, conversion_rates, link_prefix="../", valuation=valuation)
         content += "\n[View summary of bounties with unspecified value in summary file →](../summary.md#bounties-with-unspecified-value)\n\n"
         content += add_footer_buttons("../")
 
         final_content = wrap_with_guardrails(content, page_title)
-        try:
-            # Cast Path to string for open()
-            with open(str(not_specified_file), 'w', encoding='utf-8') as f:
-                f.write(final_content)
-            logger.debug(f"Successfully wrote {not_specified_file}")
-        except Exception as e:
-             logger.error(f"Error writing file {not_specified_file}: {e}")
+        currency_files.append(not_specified_file)
+        written += _write_page(not_specified_file, final_content)
+
+    _remove_stale_pages(currency_dir, currency_files)
+    logger.info(
+        f"Generated {len(currencies_dict) + (1 if not_specified_bounties else 0)} currency-specific files "
+        f"({written} changed)"
+    )
 
 
-    logger.info(f"Generated {len(currencies_dict) + (1 if not_specified_bounties else 0)} currency-specific files")
+def _format_rate_source(provenance: Optional[Dict[str, Any]]) -> str:
+    """Describe where a conversion rate came from, e.g. "cached (3h old)"."""
+    if not provenance:
+        return "default"
+    source = provenance.get("source", "default")
+    age = provenance.get("age")
+    if source != "cached" or age is None:
+        return source
+    if age < 3600:
+        return f"cached ({int(age // 60)}m old)"
+    return f"cached ({int(age // 3600)}h old)"
 
 
 def generate_price_table(
     bounty_data: List[Dict[str, Any]], # Added bounty_data
     conversion_rates: Dict[str, float],
     total_bounties: int,
-    bounties_dir: str
+    bounties_dir: str,
+    index: Optional[BountyIndex] = None,
+    rate_provenance: Optional[Dict[str, Dict[str, Any]]] = None
 ) -> None:
     """
     Generate a currency price table markdown file.
@@ -604,11 +771,14 @@ def generate_price_table(
         conversion_rates: Dictionary of conversion rates
         total_bounties: Total number of bounties
         bounties_dir: Bounties directory
+        index: Optional precomputed bounty groupings shared across generators
+        rate_provenance: Optional source ("live", "cached" or "default") and age in
+            seconds of every rate; adds a Source column to the table
     """
-    languages = group_by_language(bounty_data)
-    currencies_dict = group_by_currency(bounty_data)
-    orgs = group_by_organization(bounty_data)
-    currencies_count = len(currencies_dict) + (1 if any(b["currency"] == "Not specified" for b in bounty_data) else 0)
+    index = _get_index(bounty_data, index)
+    languages = index.languages
+    orgs = index.organizations
+    currencies_count = index.currencies_count
 
     logger.info("Generating currency price table")
 
@@ -635,8 +805,12 @@ def generate_price_table(
 
     # Write price table
     content += "## Current Prices\n\n"
-    content += "| Currency | ERG Equivalent | Notes |\n"
-    content += "|----------|----------------|-------|\n"
+    if rate_provenance is not None:
+        content += "| Currency | ERG Equivalent | Source | Notes |\n"
+        content += "|----------|----------------|--------|-------|\n"
+    else:
+        content += "| Currency | ERG Equivalent | Notes |\n"
+        content += "|----------|----------------|-------|\n"
 
     # Add rows for each currency with known conversion rates
     for currency, rate in sorted(conversion_rates.items()):
@@ -654,7 +828,11 @@ def generate_price_table(
         if currency not in no_rate_inversion:
             display_rate = 1.0 / rate if rate > 0 else 0.0
 
-        content += f"| {currency_link} | {display_rate:.6f} | {notes} |\n"
+        if rate_provenance is not None:
+            source = _format_rate_source(rate_provenance.get(currency))
+            content += f"| {currency_link} | {display_rate:.6f} | {source} | {notes} |\n"
+        else:
+            content += f"| {currency_link} | {display_rate:.6f} | {notes} |\n"
 
     content += "\n*Note: These prices are used to calculate ERG equivalents for bounties paid in different currencies.*\n"
 
@@ -692,9 +870,7 @@ def generate_price_table(
     final_content = wrap_with_guardrails(content, "# Currency Prices") # Use wrap_with_guardrails
 
     # Write to file
-    # Cast Path to string for open()
-    with open(str(price_table_file), 'w', encoding='utf-8') as f:
-        f.write(final_content)
+    _write_page_if_changed(price_table_file, final_content)
 
     logger.info("Generated currency price table")
 
@@ -704,7 +880,9 @@ def generate_high_value_bounties_file(
     conversion_rates: Dict[str, float],
     total_bounties: int,
     bounties_dir: str,
-    high_value_threshold: float = 1000.0
+    high_value_threshold: float = 1000.0,
+    valuation: Optional[ErgValuation] = None,
+    index: Optional[BountyIndex] = None
 ) -> None:
     """
     Generate a high-value bounties markdown file. (Reverted - Not using helper)
@@ -715,16 +893,21 @@ def generate_high_value_bounties_file(
         total_bounties: Total number of bounties
         bounties_dir: Bounties directory
         high_value_threshold: Minimum ERG value to be considered high-value
+        valuation: Optional precomputed ERG values shared across generators
+        index: Optional precomputed bounty groupings shared across generators
     """
-    languages = group_by_language(bounty_data)
-    currencies_dict = group_by_currency(bounty_data)
-    orgs = group_by_organization(bounty_data)
-    currencies_count = len(currencies_dict) + (1 if any(b["currency"] == "Not specified" for b in bounty_data) else 0)
+    index = _get_index(bounty_data, index)
+    languages = index.languages
+    orgs = index.organizations
+    currencies_count = index.currencies_count
 
     logger.info(f"Generating high-value bounties file (threshold: {high_value_threshold} ERG)")
 
     # Find high-value bounties using the module-level function
-    high_value_bounties = find_high_value_bounties(bounty_data, conversion_rates, threshold=high_value_threshold)
+    valuation = _get_valuation(bounty_data, conversion_rates, valuation)
+    high_value_bounties = find_high_value_bounties(
+        bounty_data, conversion_rates, threshold=high_value_threshold, valuation=valuation
+    )
 
     high_value_file = Path(bounties_dir) / 'high-value-bounties.md' # Use Path
     page_title = f"# High-Value Bounties (Over {high_value_threshold:,.0f} ERG)"
@@ -755,7 +938,7 @@ def generate_high_value_bounties_file(
         issue_number = bounty["issue_number"]
         creator = bounty["creator"]
         amount = bounty["amount"]
-        erg_value = bounty["value"]
+        erg_value = valuation.value(bounty)
         claim_url = create_claim_url(owner, repo_name, issue_number, title, url, currency, amount, creator)
         org_link = format_organization_link(owner)
         primary_lang_link = format_language_link(primary_lang)
@@ -766,20 +949,17 @@ def generate_high_value_bounties_file(
     content += add_footer_buttons()
 
     final_content = wrap_with_guardrails(content, page_title)
-    try:
-        # Cast Path to string for open()
-        with open(str(high_value_file), 'w', encoding='utf-8') as f:
-            f.write(final_content)
-        logger.info(f"Generated high-value bounties file with {len(high_value_bounties)} bounties")
-    except Exception as e:
-        logger.error(f"Error writing file {high_value_file}: {e}")
+    _write_page(high_value_file, final_content)
+    logger.info(f"Generated high-value bounties file with {len(high_value_bounties)} bounties")
 
 
 def generate_main_file(
     bounty_data: List[Dict[str, Any]],
     conversion_rates: Dict[str, float],
     total_bounties: int,
-    bounties_dir: str
+    bounties_dir: str,
+    valuation: Optional[ErgValuation] = None,
+    index: Optional[BountyIndex] = None
 ) -> None:
     """
     Generate the main markdown file with all bounties. (Reverted - Not using helper)
@@ -789,11 +969,13 @@ def generate_main_file(
         conversion_rates: Dictionary of conversion rates
         total_bounties: Total number of bounties
         bounties_dir: Bounties directory
+        valuation: Optional precomputed ERG values shared across generators
+        index: Optional precomputed bounty groupings shared across generators
     """
-    languages = group_by_language(bounty_data)
-    currencies_dict = group_by_currency(bounty_data)
-    orgs = group_by_organization(bounty_data)
-    currencies_count = len(currencies_dict) + (1 if any(b["currency"] == "Not specified" for b in bounty_data) else 0)
+    index = _get_index(bounty_data, index)
+    languages = index.languages
+    orgs = index.organizations
+    currencies_count = index.currencies_count
 
     logger.info("Generating main bounty file")
 
@@ -820,42 +1002,32 @@ def generate_main_file(
 
     content += "## All Bounties\n\n"
     # Main page shows all columns (defaults are True)
-    content += generate_standard_bounty_table(bounty_data, conversion_rates)
+    content += generate_standard_bounty_table(bounty_data, conversion_rates, valuation=valuation)
     content += add_footer_buttons()
 
     final_content = wrap_with_guardrails(content, page_title)
-    try:
-        # Cast Path to string for open()
-        with open(str(md_file), 'w', encoding='utf-8') as f:
-            f.write(final_content)
-        logger.info("Generated main bounty file")
-    except Exception as e:
-        logger.error(f"Error writing file {md_file}: {e}")
+    _write_page(md_file, final_content)
+    logger.info("Generated main bounty file")
 
 
 def generate_bounty_discovery_files(
     bounty_data: List[Dict[str, Any]],
     conversion_rates: Dict[str, float],
     total_bounties: int,
-    bounties_dir: str
+    bounties_dir: str,
+    valuation: Optional[ErgValuation] = None,
+    index: Optional[BountyIndex] = None
 ) -> None:
     """Generate alternate bounty views for discovery and maintenance."""
     now = datetime.now(timezone.utc)
 
-    def parse_dt(value: str):
-        if not value:
-            return None
-        try:
-            return datetime.fromisoformat(value.replace("Z", "+00:00"))
-        except ValueError:
-            return None
-
-    def age_days(bounty: Dict[str, Any]) -> int:
-        created = parse_dt(bounty.get("created_at", ""))
-        return (now - created).days if created else 0
-
+    valuation = _get_valuation(bounty_data, conversion_rates, valuation)
+    index = _get_index(bounty_data, index)
     beginner = find_beginner_friendly_bounties(bounty_data)
-    stale = [b for b in bounty_data if age_days(b) >= 180 and b.get("status", "").lower() == "open"]
+    stale = [
+        b for b in bounty_data
+        if (age_in_days(b, now) or 0) >= STALE_BOUNTY_DAYS and b.get("status", "").lower() == "open"
+    ]
 
     views = [
         ("new-bounties.md", "# New Bounties", bounty_data, "new"),
@@ -864,8 +1036,9 @@ def generate_bounty_discovery_files(
         ("starter-bounties.md", "# Starter Bounties", beginner, "updated"),
     ]
 
-    for filename, title, bounties, sort_by in views:
-        _generate_markdown_page(
+    _render_pages([
+        partial(
+            _generate_markdown_page,
             filename=str(Path(bounties_dir) / filename),
             title=title,
             page_bounties=bounties,
@@ -873,8 +1046,12 @@ def generate_bounty_discovery_files(
             conversion_rates=conversion_rates,
             total_bounties=total_bounties,
             nav_relative_path="",
-            sort_by=sort_by
+            sort_by=sort_by,
+            valuation=valuation,
+            index=index
         )
+        for filename, title, bounties, sort_by in views
+    ])
 
 
 def generate_summary_file(
@@ -883,7 +1060,9 @@ def generate_summary_file(
     conversion_rates: Dict[str, float],
     total_bounties: int,
     total_value: float,
-    bounties_dir: str
+    bounties_dir: str,
+    valuation: Optional[ErgValuation] = None,
+    index: Optional[BountyIndex] = None
 ) -> None:
     """
     Generate a summary markdown file for README reference.
@@ -895,11 +1074,13 @@ def generate_summary_file(
         total_bounties: Total number of bounties
         total_value: Total value of bounties
         bounties_dir: Bounties directory
+        valuation: Optional precomputed ERG values shared across generators
+        index: Optional precomputed bounty groupings shared across generators
     """
-    languages = group_by_language(bounty_data)
-    currencies_dict = group_by_currency(bounty_data)
-    orgs = group_by_organization(bounty_data)
-    currencies_count = len(currencies_dict) + (1 if any(b["currency"] == "Not specified" for b in bounty_data) else 0)
+    index = _get_index(bounty_data, index)
+    languages = index.languages
+    orgs = index.organizations
+    currencies_count = index.currencies_count
 
     logger.info("Generating summary file")
 
@@ -936,7 +1117,8 @@ def generate_summary_file(
 
 
     # Calculate currency totals using the module-level function
-    currency_totals = calculate_currency_totals(bounty_data, conversion_rates)
+    valuation = _get_valuation(bounty_data, conversion_rates, valuation)
+    currency_totals = calculate_currency_totals(bounty_data, conversion_rates, valuation=valuation, index=index)
 
     # Add currency breakdown
     content += "## Currencies\n\n"
@@ -984,23 +1166,22 @@ def generate_summary_file(
     final_content = wrap_with_guardrails(content, "# Summary of Bounties") # Use wrap_with_guardrails
 
     # Write to file
-    # Cast Path to string for open()
-    with open(str(summary_file), 'w', encoding='utf-8') as f:
-        f.write(final_content)
+    _write_page_if_changed(summary_file, final_content)
 
     logger.info("Generated summary file")
 
     # Update README badges
     # from ..utils.markdown import update_readme_badges # Already imported
     # Calculate high value count here before passing to update_readme_badges
-    high_value_bounties = find_high_value_bounties(bounty_data, conversion_rates) # Use default threshold
+    high_value_bounties = find_high_value_bounties(bounty_data, conversion_rates, valuation=valuation) # Use default threshold
     update_readme_badges(total_bounties, total_value, len(high_value_bounties), languages)
 
 
 def update_ongoing_programs_table(
     bounty_data: List[Dict[str, Any]],
     conversion_rates: Dict[str, float],
-    bounties_dir: str # This argument seems unused here, consider removing
+    bounties_dir: str, # This argument seems unused here, consider removing
+    valuation: Optional[ErgValuation] = None
 ) -> None:
     """
     Update the tables in the ongoing programs markdown file using guardrails.
@@ -1009,6 +1190,7 @@ def update_ongoing_programs_table(
         bounty_data: List of bounty data
         conversion_rates: Dictionary of conversion rates
         bounties_dir: Bounties directory (unused)
+        valuation: Optional precomputed ERG values shared across generators
     """
     logger.info("Updating ongoing programs tables with guardrails")
 
@@ -1041,8 +1223,7 @@ def update_ongoing_programs_table(
                 new_content = pre_content + "\n" + ongoing_table_content + "\n" + post_content
 
                 # Write the updated content back to the file
-                with open('docs/ongoing-programs.md', 'w', encoding='utf-8') as f:
-                    f.write(new_content)
+                write_text_if_changed('docs/ongoing-programs.md', new_content)
 
                 logger.info("Successfully updated ongoing programs table with guardrails")
             else:
@@ -1085,7 +1266,8 @@ def update_ongoing_programs_table(
         bounty_table_content = intro_text + generate_standard_bounty_table(
             extra_bounties,
             conversion_rates,
-            link_prefix="/data/"
+            link_prefix="/data/",
+            valuation=valuation
         )
 
         # Update the table between guardrails
@@ -1110,8 +1292,7 @@ def update_ongoing_programs_table(
                 new_content = pre_content + "\n" + bounty_table_content + "\n" + post_content
 
                 # Write the updated content back to the file
-                with open('docs/ongoing-programs.md', 'w', encoding='utf-8') as f:
-                    f.write(new_content)
+                write_text_if_changed('docs/ongoing-programs.md', new_content)
 
                 logger.info("Successfully updated grants and additional bounties table with guardrails")
             else:
@@ -1129,7 +1310,9 @@ def generate_featured_bounties_file(
     # languages: Dict[str, List[Dict[str, Any]]], # Removed, calculated internally
     # currencies_dict: Dict[str, List[Dict[str, Any]]], # Removed, calculated internally
     # orgs: Dict[str, List[Dict[str, Any]]], # Removed, calculated internally
-    bounties_dir: str
+    bounties_dir: str,
+    valuation: Optional[ErgValuation] = None,
+    index: Optional[BountyIndex] = None
 ) -> None:
     """
     Generate a featured bounties markdown file.
@@ -1143,16 +1326,19 @@ def generate_featured_bounties_file(
         # currencies_dict: Dictionary of currencies and their bounties # Removed
         # orgs: Dictionary of organizations and their bounties # Removed
         bounties_dir: Bounties directory
+        valuation: Optional precomputed ERG values shared across generators
+        index: Optional precomputed bounty groupings shared across generators
     """
-    languages = group_by_language(bounty_data) # Calculate internally
-    currencies_dict = group_by_currency(bounty_data) # Calculate internally
-    orgs = group_by_organization(bounty_data)
-    currencies_count = len(currencies_dict) + (1 if any(b["currency"] == "Not specified" for b in bounty_data) else 0)
+    index = _get_index(bounty_data, index)
+    languages = index.languages
+    orgs = index.organizations
+    currencies_count = index.currencies_count
 
     logger.info("Generating featured bounties file")
 
     # Find top bounties using the module-level function
-    featured_bounties = find_featured_bounties(bounty_data, conversion_rates, count=2)
+    valuation = _get_valuation(bounty_data, conversion_rates, valuation)
+    featured_bounties = find_featured_bounties(bounty_data, conversion_rates, count=2, valuation=valuation)
 
     featured_bounties_file = f'{bounties_dir}/featured_bounties.md'
 
@@ -1183,7 +1369,7 @@ def generate_featured_bounties_file(
         currency_link = format_currency_link(bounty['currency'])
 
         # Calculate ERG equivalent
-        erg_equiv = bounty["value"]
+        erg_equiv = valuation.value(bounty)
 
         content += f"| [{escape_markdown_link_text(bounty['title'])}]({bounty['url']}) | {org_link} | {erg_equiv:.2f} ERG | {currency_link} |\n"
 
@@ -1199,8 +1385,6 @@ def generate_featured_bounties_file(
     final_content = wrap_with_guardrails(content, "# Featured Bounties") # Use wrap_with_guardrails
 
     # Write to file
-    # Cast Path to string for open()
-    with open(str(featured_bounties_file), 'w', encoding='utf-8') as f:
-        f.write(final_content)
+    _write_page_if_changed(featured_bounties_file, final_content)
 
     logger.info("Generated featured bounties file")
@@ -1,5 +1,3 @@
-import os # Import os for path.getmtime
-import json
 import datetime # Import datetime
 import sys
 from collections import defaultdict
@@ -10,44 +8,46 @@ if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
 from src.utils.common import escape_markdown_cell, escape_markdown_link_text
+from src.utils.rate_history import RateHistory, configured_history_path, format_erg_value_at
+from src.utils.submissions_index import SubmissionsIndex, configured_index_path
 
 SUBMISSIONS_DIR = Path("submissions")
 # Update output paths to be inside the submissions directory
 ACTIVE_STATUS_FILE = SUBMISSIONS_DIR / "payment_status.md"
 PAID_STATUS_FILE = SUBMISSIONS_DIR / "paid.md"
 PAYMENT_QUEUE_FILE = SUBMISSIONS_DIR / "payment_queue.md"
+# Parsed submissions cached between runs (scan.submissions_index_path, shared with the bounty finder)
+SUBMISSIONS_INDEX_FILE = configured_index_path()
+# Conversion rates recorded by the bounty finder (scan.rate_history_path), used to value paid bounties
+RATE_HISTORY_FILE = configured_history_path()
 # Define the new valid statuses and their order for the active report
 ACTIVE_STATUS_ORDER = ["awaiting-review", "reviewed", "in-progress"]
 PAID_STATUS = "paid"
 VALID_STATUSES = set(ACTIVE_STATUS_ORDER + [PAID_STATUS]) # Used for potential future validation if needed
 IGNORE_FILES = {"example-user-ergoscript-fsmtest.json"} # Files to ignore
 
-def load_submissions():
-    """Loads all submission JSON files from the submissions directory."""
+def load_submissions(index_path=SUBMISSIONS_INDEX_FILE):
+    """Loads all submission JSON files from the submissions directory.
+
+    Parsed files are cached in a sidecar index shared with the bounty finder, so
+    only files added or changed since the last run are parsed again.
+    """
     submissions = []
     if not SUBMISSIONS_DIR.is_dir():
         print(f"Error: Submissions directory not found at {SUBMISSIONS_DIR}")
         return submissions
 
-    for filename in SUBMISSIONS_DIR.glob("*.json"):
-        if filename.name in IGNORE_FILES:
-            print(f"Ignoring file: {filename.name}")
+    index = SubmissionsIndex(SUBMISSIONS_DIR, index_path)
+    for data in index.submissions():
+        if data['_filename'] in IGNORE_FILES:
+            print(f"Ignoring file: {data['_filename']}")
             continue
-        try:
-            # Get last modified time before opening
-            last_modified_timestamp = os.path.getmtime(filename)
-            last_modified_date = datetime.datetime.fromtimestamp(last_modified_timestamp).strftime('%Y-%m-%d')
-
-            with open(filename, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                # Add filename and last modified date for reference
-                data['_filename'] = filename.name
-                data['_last_modified_date'] = last_modified_date
-                submissions.append(data)
-        except json.JSONDecodeError:
-            print(f"Warning: Could not decode JSON from {filename}")
-        except Exception as e:
-            print(f"Warning: Error reading {filename}: {e}")
+        # Add last modified date for reference
+        data['_last_modified_date'] = datetime.datetime.fromtimestamp(data.pop('_mtime')).strftime('%Y-%m-%d')
+        submissions.append(data)
+    index.save()
+    stats = index.stats()
+    print(f"Parsed {stats['parsed']} submission files ({stats['reused']} unchanged files reused from the index)")
     return submissions
 
 def group_by_status(submissions):
@@ -73,13 +73,19 @@ def truncate_address(address, start_len=4, end_len=3):
         return address # Return original if too short or not a string
     return f"{address[:start_len]}...{address[-end_len:]}"
 
-def generate_markdown_table(submissions):
-    """Generates a Markdown table for a list of submissions."""
+def generate_markdown_table(submissions, rate_history=None):
+    """Generates a Markdown table for a list of submissions.
+
+    With a rate history, an "ERG at Payment" column values each submission at the
+    rates of its payment date (or its last update when no payment date is set).
+    """
     if not submissions:
         return "No submissions in this category.\n"
 
     # Add "Last Updated" header
     headers = ["Contributor", "Work Title", "Value", "Wallet Address", "Reviewer", "Work Link", "Last Updated"]
+    if rate_history is not None:
+        headers.insert(3, "ERG at Payment")
     table = "| " + " | ".join(headers) + " |\n"
     table += "| " + " | ".join(["---"] * len(headers)) + " |\n"
 
@@ -118,11 +124,14 @@ def generate_markdown_table(submissions):
             work_link_md, # Use the separate work link MD
             escape_markdown_cell(last_modified_date) # Add last updated date
         ]
+        if rate_history is not None:
+            payment_date = str(sub.get("payment_date") or "").strip() or sub.get("_last_modified_date", "")
+            row.insert(3, format_erg_value_at(value, currency, payment_date, rate_history))
         table += "| " + " | ".join(map(str, row)) + " |\n"
 
     return table
 
-def write_markdown_file(output_path, title, description, grouped_submissions, status_order):
+def write_markdown_file(output_path, title, description, grouped_submissions, status_order, rate_history=None):
     """Writes a markdown file for the given statuses."""
     print(f"Generating Markdown for statuses: {status_order} -> {output_path}")
     markdown_content = f"# {title}\n\n"
@@ -133,7 +142,7 @@ def write_markdown_file(output_path, title, description, grouped_submissions, st
         if status in grouped_submissions and grouped_submissions[status]:
             status_title = status.replace("_", " ").title()
             markdown_content += f"## {status_title}\n\n"
-            markdown_content += generate_markdown_table(grouped_submissions[status])
+            markdown_content += generate_markdown_table(grouped_submissions[status], rate_history)
             markdown_content += "\n"
             found_content = True
 
@@ -231,7 +240,8 @@ def main():
         "Paid Bounties",
         "This page lists completed and paid bounty submissions.",
         grouped_submissions,
-        [PAID_STATUS] # Only include the paid status
+        [PAID_STATUS], # Only include the paid status
+        rate_history=RateHistory(RATE_HISTORY_FILE) if RATE_HISTORY_FILE else None
     )
 
     generate_payment_queue(grouped_submissions.get("reviewed", []))
@@ -0,0 +1,185 @@
+import asyncio
+import threading
+import time
+
+import pytest
+import requests
+
+from src.api import async_base_client
+from src.api.async_base_client import AsyncBaseClient
+from src.api.currency_client import AsyncCurrencyClient, CurrencyClient
+from src.api.github_client import AsyncGitHubClient, GitHubClient
+
+
+class MockResponse:
+    def __init__(self, status_code, payload=None, headers=None, links=None):
+        self.status_code = status_code
+        self._payload = payload
+        self.headers = headers or {}
+        self.links = links or {}
+
+    def json(self):
+        if self._payload is None:
+            raise ValueError("No JSON body")
+        return self._payload
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.exceptions.HTTPError(f"{self.status_code} error")
+
+
+def _fake_github(client):
+    pages = {
+        "https://api.github.com/repos/org/repo/issues?state=open&per_page=100": MockResponse(
+            200, [{"number": 3}, {"number": 2}],
+            links={"next": {"url": "https://api.github.com/repos/org/repo/issues?page=2"}},
+        ),
+        "https://api.github.com/repos/org/repo/issues?page=2": MockResponse(200, [{"number": 1}]),
+        "https://api.github.com/repos/org/repo/languages": MockResponse(200, {"Rust": 10, "Scala": 30, "Shell": 1}),
+    }
+
+    def fake_request(method, url, headers, json, timeout):
+        assert headers["Authorization"] == "token secret"
+        return pages[url]
+
+    client.session.request = fake_request
+
+
+def test_async_github_client_matches_sync_client():
+    sync_client = GitHubClient("secret")
+    _fake_github(sync_client)
+
+    async def fetch():
+        async with AsyncGitHubClient("secret") as client:
+            _fake_github(client)
+            return await asyncio.gather(
+                client.get_repository_issues("org", "repo"),
+                client.get_repository_languages("org", "repo"),
+            )
+
+    issues, languages = asyncio.run(fetch())
+
+    assert issues == sync_client.get_repository_issues("org", "repo")
+    assert [issue["number"] for issue in issues] == [3, 2, 1]
+    assert languages == sync_client.get_repository_languages("org", "repo") == ["Scala", "Rust"]
+
+
+def test_rate_limit_wait_only_delays_the_limited_request(monkeypatch):
+    client = AsyncBaseClient(base_url="https://api.example.com", max_connections=4)
+    reset = int(time.time()) + 30
+    attempts = {"/limited": 0, "/free": 0}
+    sleeps = []
+
+    def fake_request(method, url, headers, json, timeout):
+        path = url.replace("https://api.example.com", "")
+        attempts[path] += 1
+        if path == "/limited" and attempts[path] == 1:
+            return MockResponse(403, headers={"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": str(reset)})
+        return MockResponse(200, {"path": path})
+
+    client.session.request = fake_request
+
+    async def run():
+        order = []
+        released = asyncio.Event()
+
+        async def fake_sleep(delay):
+            sleeps.append(delay)
+            await released.wait()
+
+        monkeypatch.setattr(async_base_client.asyncio, "sleep", fake_sleep)
+
+        async def request(path):
+            data, _ = await client._make_json_request(path)
+            order.append(data["path"])
+            if path == "/free":
+                released.set()
+
+        await asyncio.gather(request("/limited"), request("/free"))
+        return order
+
+    order = asyncio.run(run())
+    client.close()
+
+    assert order == ["/free", "/limited"]
+    assert attempts == {"/limited": 2, "/free": 1}
+    assert len(sleeps) == 1 and 1 <= sleeps[0] <= 30
+
+
+def test_async_requests_run_concurrently_and_retry_with_asyncio_sleep(monkeypatch):
+    client = AsyncBaseClient(base_url="https://api.example.com", max_retries=2, retry_delay=7, max_connections=8)
+    in_flight = []
+    peak = []
+    lock = threading.Lock()
+    failures = {"/flaky": 1}
+    sleeps = []
+
+    def fake_request(method, url, headers, json, timeout):
+        path = url.replace("https://api.example.com", "")
+        with lock:
+            in_flight.append(path)
+            peak.append(len(in_flight))
+        time.sleep(0.05)
+        with lock:
+            in_flight.remove(path)
+        if failures.get(path):
+            failures[path] -= 1
+            raise requests.exceptions.ConnectionError("connection reset")
+        return MockResponse(200, [path])
+
+    client.session.request = fake_request
+
+    async def fake_sleep(delay):
+        sleeps.append(delay)
+
+    monkeypatch.setattr(async_base_client.asyncio, "sleep", fake_sleep)
+
+    async def run():
+        paths = [f"/items/{i}" for i in range(6)] + ["/flaky"]
+        return await asyncio.gather(*(client._make_json_request(path) for path in paths))
+
+    results = asyncio.run(run())
+    client.close()
+
+    assert [data for data, _ in results] == [[f"/items/{i}"] for i in range(6)] + [["/flaky"]]
+    assert max(peak) > 1
+    assert len(sleeps) == 1 and 0 <= sleeps[0] <= 7
+
+
+def test_async_request_raises_after_max_retries(monkeypatch):
+    client = AsyncBaseClient(base_url="https://api.example.com", max_retries=2, retry_delay=0)
+    client.session.request = lambda **kwargs: MockResponse(500)
+
+    with pytest.raises(requests.exceptions.RequestException, match="Max retries exceeded") as raised:
+        asyncio.run(client._make_json_request("/broken"))
+    client.close()
+
+    # The last attempt's failure is kept as the cause
+    assert isinstance(raised.value.__cause__, requests.exceptions.HTTPError)
+
+
+def test_async_currency_client_matches_sync_client(monkeypatch):
+    markets = [
+        {"baseSymbol": "ERG", "quoteSymbol": "SigUSD", "lastPrice": "3", "baseVolume": {"value": "10"}},
+        {"baseSymbol": "ERG", "quoteSymbol": "SigUSD", "lastPrice": "2", "baseVolume": {"value": "20"}},
+        {"baseSymbol": "ERG", "quoteSymbol": "GORT", "lastPrice": "4"},
+    ]
+    oracle_payload = {"items": [{"additionalRegisters": {"R4": {"renderedValue": "100000000000000"}}}]}
+
+    def fake_get(url, timeout):
+        if url == CurrencyClient.SPECTRUM_API_URL:
+            return MockResponse(200, markets)
+        return MockResponse(200, oracle_payload)
+
+    sync_client = CurrencyClient()
+    monkeypatch.setattr(sync_client.session, "get", fake_get)
+    async_client = AsyncCurrencyClient()
+    monkeypatch.setattr(async_client.session, "get", fake_get)
+
+    rates = asyncio.run(async_client.get_all_rates())
+    async_client.close()
+
+    assert rates == sync_client.get_all_rates()
+    assert rates["SigUSD"] == rates["BENE"] == 2.0
+    assert rates["gGOLD"] == 100.0
+    assert async_client.calculate_erg_value("10", "SigUSD") == 5.0
@@ -0,0 +1,141 @@
+import pytest
+import requests
+
+from src.api import base_client
+from src.api.base_client import BaseClient, ClientError
+from src.api.currency_client import CurrencyClient
+from src.api.host_health import CircuitOpenError, HostHealth
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class MockResponse:
+    def __init__(self, status_code, payload=None, headers=None, text=""):
+        self.status_code = status_code
+        self._payload = payload
+        self.headers = headers or {}
+        self.links = {}
+        self.text = text
+
+    def json(self):
+        return self._payload
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.exceptions.HTTPError(f"{self.status_code} error", response=self)
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    recorded = []
+    monkeypatch.setattr(base_client.time, "sleep", recorded.append)
+    # Full jitter draws uniformly from [0, cap]; take the cap to check the exponential growth
+    monkeypatch.setattr(base_client.random, "uniform", lambda low, high: high)
+    return recorded
+
+
+def _client_with_responses(responses, **kwargs):
+    client = BaseClient(base_url="https://api.example.com", **kwargs)
+    calls = []
+
+    def fake_request(method, url, headers, json, timeout):
+        calls.append(url)
+        response = responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    client.session.request = fake_request
+    return client, calls
+
+
+def test_client_errors_fail_without_retry(sleeps):
+    client, calls = _client_with_responses([MockResponse(404), MockResponse(200, [])])
+
+    with pytest.raises(ClientError, match="HTTP 404"):
+        client._make_json_request("/missing")
+
+    assert len(calls) == 1
+    assert sleeps == []
+    assert client.host_health.metrics()["api.example.com"]["errors"] == {"4xx": 1}
+
+
+def test_server_errors_and_too_many_requests_retry_with_exponential_backoff(sleeps):
+    client, calls = _client_with_responses(
+        [MockResponse(503), MockResponse(429), requests.exceptions.ConnectionError("reset"), MockResponse(200, [1])],
+        max_retries=4, retry_delay=2, max_retry_delay=6,
+    )
+
+    assert client._make_json_request("/items") == ([1], {})
+
+    assert len(calls) == 4
+    assert sleeps == [2, 4, 6]
+    errors = client.host_health.metrics()["api.example.com"]["errors"]
+    assert errors == {"5xx": 1, "429": 1, "connection": 1}
+
+
+def test_secondary_rate_limit_is_retried_without_rate_limiter(sleeps):
+    client, calls = _client_with_responses([
+        MockResponse(403, text="You have exceeded a secondary rate limit"),
+        MockResponse(403, headers={"Retry-After": "7"}),
+        MockResponse(200, {"ok": True}),
+    ])
+
+    assert client._make_json_request("/items") == ({"ok": True}, {})
+    assert sleeps == [60, 7]
+
+
+def test_circuit_opens_after_repeated_failures_and_recovers_after_cool_down(sleeps):
+    clock = FakeClock()
+    health = HostHealth(failure_threshold=3, reset_timeout=30, clock=clock)
+    client, calls = _client_with_responses(
+        [MockResponse(500)] * 3 + [MockResponse(500), MockResponse(200, [])],
+        max_retries=3, retry_delay=0, host_health=health,
+    )
+
+    with pytest.raises(requests.exceptions.RequestException, match="Max retries exceeded"):
+        client._make_json_request("/items")
+    assert health.state("api.example.com") == "open"
+
+    with pytest.raises(CircuitOpenError):
+        client._make_json_request("/items")
+    assert len(calls) == 3
+
+    # One trial request after the cool-down; a failure reopens the circuit at once
+    clock.now += 30
+    with pytest.raises(CircuitOpenError):
+        client._make_json_request("/items")
+    assert len(calls) == 4 and health.state("api.example.com") == "open"
+
+    clock.now += 30
+    assert client._make_json_request("/items") == ([], {})
+    assert health.state("api.example.com") == "closed"
+
+    metrics = health.metrics()["api.example.com"]
+    assert metrics["requests"] == 5
+    assert sum(metrics["latency"].values()) == 5
+    assert metrics["errors"] == {"5xx": 4, "circuit_open": 2}
+
+
+def test_currency_client_requests_are_tracked_per_host(monkeypatch):
+    client = CurrencyClient()
+
+    def fake_get(url, timeout):
+        if url == client.SPECTRUM_API_URL:
+            raise requests.exceptions.Timeout("timed out")
+        return MockResponse(503)
+
+    monkeypatch.setattr(client.session, "get", fake_get)
+
+    rates = client.get_all_rates()
+
+    assert rates["SigUSD"] == 0.819389
+    metrics = client.host_health.metrics()
+    assert metrics["api.spectrum.fi"]["errors"] == {"timeout": 1}
+    assert metrics["api.ergoplatform.com"]["errors"] == {"5xx": 1}
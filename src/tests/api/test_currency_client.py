@@ -1,4 +1,9 @@
-from src.api.currency_client import CurrencyClient
+import threading
+import time
+
+from src.api.currency_client import CurrencyClient, index_markets
+from src.api.rate_cache import RateCache
+from src.utils.rate_history import RateHistory
 
 
 class MockResponse:
@@ -78,3 +83,141 @@ def test_fetch_gold_price_reads_oracle_register(monkeypatch):
     client._fetch_gold_price()
 
     assert client.rates["gGOLD"] == 100.0
+
+
+def test_fresh_rate_cache_skips_fetching(tmp_path, monkeypatch):
+    cache = RateCache(tmp_path / "rates.json", ttl_minutes=60)
+    cache.store({"SigUSD": 2.0, "GORT": 4.0, "RSN": 8.0, "gGOLD": 10.0}, now=time.time() - 600)
+    client = CurrencyClient(rate_cache=cache)
+
+    def fail_get(url, timeout):
+        raise AssertionError("rates should come from the cache")
+
+    monkeypatch.setattr(client.session, "get", fail_get)
+    monkeypatch.delenv("FORCE_REFRESH", raising=False)
+
+    rates = client.get_all_rates()
+
+    assert rates["SigUSD"] == 2.0
+    assert rates["BENE"] == 2.0
+    assert rates["gGOLD"] == 10.0
+    assert client.rate_provenance["BENE"]["source"] == "cached"
+    assert 590 <= client.rate_provenance["GORT"]["age"] <= 700
+
+
+def test_failed_fetch_falls_back_to_last_known_good_rate(tmp_path, monkeypatch):
+    path = tmp_path / "rates.json"
+    cache = RateCache(path, ttl_minutes=60)
+    cache.store({"RSN": 8.0}, now=time.time() - 2 * 86400)
+    client = CurrencyClient(rate_cache=cache)
+    markets = [{"baseSymbol": "ERG", "quoteSymbol": "SigUSD", "lastPrice": "2"}]
+
+    def fake_get(url, timeout):
+        if url == client.SPECTRUM_API_URL:
+            return MockResponse(200, markets)
+        return MockResponse(503, None)
+
+    monkeypatch.setattr(client.session, "get", fake_get)
+
+    rates = client.get_all_rates()
+
+    assert rates["SigUSD"] == 2.0
+    assert rates["RSN"] == 8.0
+    assert rates["GORT"] == 12.76516
+    assert client.rate_provenance["SigUSD"] == {"source": "live", "age": 0.0}
+    assert client.rate_provenance["BENE"]["source"] == "live"
+    assert client.rate_provenance["RSN"]["source"] == "cached"
+    assert client.rate_provenance["GORT"] == {"source": "default", "age": None}
+    assert client.rate_provenance["gGOLD"] == {"source": "default", "age": None}
+
+    # The live rate is persisted for the next run
+    assert RateCache(path).entries()["SigUSD"][0] == 2.0
+
+
+def test_get_all_rates_fetches_spectrum_and_oracle_concurrently(monkeypatch):
+    client = CurrencyClient()
+    both_in_flight = threading.Barrier(2, timeout=5)
+    oracle_payload = {"items": [{"additionalRegisters": {"R4": {"renderedValue": "100000000000000"}}}]}
+
+    def fake_get(url, timeout):
+        # Deadlocks (and times out) unless both requests are in flight together
+        both_in_flight.wait()
+        if url == client.SPECTRUM_API_URL:
+            return MockResponse(200, [{"baseSymbol": "ERG", "quoteSymbol": "GORT", "lastPrice": "4"}])
+        return MockResponse(200, oracle_payload)
+
+    monkeypatch.setattr(client.session, "get", fake_get)
+
+    rates = client.get_all_rates()
+
+    assert rates["GORT"] == 4.0
+    assert rates["gGOLD"] == 100.0
+
+
+def test_background_rates_are_joined_on_first_lookup(monkeypatch):
+    client = CurrencyClient()
+    release = threading.Event()
+
+    def slow_get_all_rates():
+        release.wait(5)
+        return {"SigUSD": 2.0}
+
+    monkeypatch.setattr(client, "get_all_rates", slow_get_all_rates)
+
+    pending = client.fetch_rates_in_background()
+    assert repr(pending) == "PendingRates(<fetching>)"
+
+    release.set()
+    assert client.calculate_erg_value("10", "SigUSD", pending) == 5.0
+    assert dict(pending) == {"SigUSD": 2.0}
+
+
+def test_index_markets_keeps_highest_volume_market_per_pair():
+    markets = [
+        {"baseSymbol": "ERG", "quoteSymbol": "SigUSD", "lastPrice": "3", "baseVolume": {"value": "10"}},
+        {"baseSymbol": "ERG", "quoteSymbol": "RSN", "lastPrice": "5"},
+        {"baseSymbol": "ERG", "quoteSymbol": "SigUSD", "lastPrice": "2", "baseVolume": {"value": "20"}},
+        {"baseSymbol": "ERG", "quoteSymbol": "RSN", "lastPrice": "6"},
+        {"baseSymbol": "SigUSD", "quoteSymbol": "ERG", "lastPrice": "0.5"},
+    ]
+
+    by_pair = index_markets(markets)
+
+    assert by_pair[("ERG", "SigUSD")]["lastPrice"] == "2"
+    assert by_pair[("ERG", "RSN")]["lastPrice"] == "5"
+    assert by_pair[("SigUSD", "ERG")]["lastPrice"] == "0.5"
+
+
+def test_configured_spectrum_tokens_are_fetched_and_converted(monkeypatch):
+    client = CurrencyClient(spectrum_tokens=["SigUSD", "PAIDEIA"])
+    markets = [
+        {"baseSymbol": "ERG", "quoteSymbol": "SigUSD", "lastPrice": "2"},
+        {"baseSymbol": "ERG", "quoteSymbol": "PAIDEIA", "lastPrice": "50"},
+        {"baseSymbol": "ERG", "quoteSymbol": "GORT", "lastPrice": "4"},
+    ]
+    monkeypatch.setattr(client.session, "get", lambda url, timeout: MockResponse(200, markets))
+
+    client._fetch_spectrum_rates()
+
+    assert client.rates["PAIDEIA"] == 50.0
+    assert "GORT" not in client.rates  # not configured
+    assert client.calculate_erg_value("100", "PAIDEIA") == 2.0
+
+
+def test_live_rates_are_appended_to_the_rate_history(tmp_path, monkeypatch):
+    history = RateHistory(tmp_path / "rate_history.csv")
+    client = CurrencyClient(rate_history=history)
+    markets = [{"baseSymbol": "ERG", "quoteSymbol": "SigUSD", "lastPrice": "2"}]
+
+    def fake_get(url, timeout):
+        if url == client.SPECTRUM_API_URL:
+            return MockResponse(200, markets)
+        return MockResponse(503, None)
+
+    monkeypatch.setattr(client.session, "get", fake_get)
+
+    client.get_all_rates()
+
+    # Defaults are not history; BENE is derived from the live SigUSD rate
+    assert history.currencies() == ["BENE", "SigUSD"]
+    assert history.rates_at(time.time()) == {"BENE": 2.0, "SigUSD": 2.0}
@@ -0,0 +1,132 @@
+import threading
+
+import pytest
+
+from src.api.github_client import GitHubClient, IncompleteListingError, build_search_queries
+
+
+class MockResponse:
+    def __init__(self, status_code, payload=None, headers=None, links=None):
+        self.status_code = status_code
+        self._payload = payload
+        self.headers = headers or {}
+        self.links = links or {}
+
+    def json(self):
+        return self._payload
+
+    def raise_for_status(self):
+        pass
+
+
+def _paged_client(pages, read_ahead_workers=0, on_request=None):
+    client = GitHubClient("secret", read_ahead_workers=read_ahead_workers)
+    requested = []
+
+    def fake_request(method, url, headers, json, timeout):
+        requested.append(url)
+        if on_request:
+            on_request(url)
+        return pages[url]
+
+    client.session.request = fake_request
+    return client, requested
+
+
+def _issue_pages():
+    first = "https://api.github.com/repos/org/repo/issues?state=open&per_page=100"
+    second = "https://api.github.com/repos/org/repo/issues?page=2"
+    return {
+        first: MockResponse(200, [{"number": 3}, {"number": 2}], links={"next": {"url": second}}),
+        second: MockResponse(200, [{"number": 1}]),
+    }
+
+
+def test_issue_pages_are_only_requested_as_items_are_consumed():
+    client, requested = _paged_client(_issue_pages())
+
+    issues = client.iter_repository_issues("org", "repo")
+    assert requested == []
+
+    assert next(issues) == {"number": 3}
+    assert next(issues) == {"number": 2}
+    assert len(requested) == 1
+
+    assert list(issues) == [{"number": 1}]
+    assert len(requested) == 2
+
+
+def test_list_api_wraps_the_streaming_api():
+    client, _ = _paged_client(_issue_pages())
+
+    assert [issue["number"] for issue in client.get_repository_issues("org", "repo")] == [3, 2, 1]
+
+
+@pytest.mark.parametrize("read_ahead_workers", [0, 1])
+def test_failed_page_only_raises_when_the_listing_must_be_complete(read_ahead_workers):
+    pages = _issue_pages()
+    pages["https://api.github.com/repos/org/repo/issues?page=2"] = MockResponse(200, {"message": "unexpected"})
+    client, _ = _paged_client(pages, read_ahead_workers=read_ahead_workers)
+
+    assert [issue["number"] for issue in client.iter_repository_issues("org", "repo")] == [3, 2]
+    with pytest.raises(IncompleteListingError):
+        list(client.iter_repository_issues("org", "repo", require_complete=True))
+
+
+def test_read_ahead_fetches_the_next_page_while_the_current_one_is_consumed():
+    second_requested = threading.Event()
+    pages = _issue_pages()
+    client, requested = _paged_client(
+        pages,
+        read_ahead_workers=1,
+        on_request=lambda url: url.endswith("page=2") and second_requested.set(),
+    )
+
+    issues = client.iter_repository_issues("org", "repo")
+
+    assert next(issues) == {"number": 3}
+    assert second_requested.wait(2)
+    assert [issue["number"] for issue in issues] == [2, 1]
+
+
+def test_read_ahead_fans_out_to_all_pages_up_to_last():
+    base = "https://api.github.com/repos/org/repo/issues?state=open&per_page=100"
+    page_url = base + "&page={}"
+    links = {"next": {"url": page_url.format(2)}, "last": {"url": page_url.format(4)}}
+    pages = {base: MockResponse(200, [{"number": 1}], links=links)}
+    for page in range(2, 5):
+        # Later pages only link their neighbours; the client must not need them
+        pages[page_url.format(page)] = MockResponse(200, [{"number": page}])
+    # All three remaining pages must be in flight at the same time to pass the barrier
+    barrier = threading.Barrier(3, timeout=2)
+    client, requested = _paged_client(
+        pages,
+        read_ahead_workers=3,
+        on_request=lambda url: url != base and barrier.wait(),
+    )
+
+    assert [issue["number"] for issue in client.get_repository_issues("org", "repo")] == [1, 2, 3, 4]
+    assert sorted(requested[1:]) == [page_url.format(page) for page in range(2, 5)]
+
+
+def test_search_queries_batch_qualifiers_under_the_length_limit():
+    qualifiers = [f"repo:organization-{i}/repository-{i}" for i in range(20)]
+
+    queries = build_search_queries("label:bounty state:open", qualifiers)
+
+    assert len(queries) > 1
+    assert all(len(query) <= 256 and query.startswith("label:bounty state:open repo:") for query in queries)
+    assert [q for query in queries for q in query.split()[2:]] == qualifiers
+    assert build_search_queries("label:bounty", []) == []
+
+
+def test_search_issues_yields_items_of_every_result_page():
+    first = "https://api.github.com/search/issues?q=label%3Abounty%20org%3Aergo&per_page=100"
+    second = "https://api.github.com/search/issues?q=label%3Abounty%20org%3Aergo&per_page=100&page=2"
+    client, requested = _paged_client({
+        first: MockResponse(200, {"total_count": 3, "items": [{"number": 1}, {"number": 2}]}, links={"next": {"url": second}}),
+        second: MockResponse(200, {"total_count": 3, "items": [{"number": 3}]}),
+    })
+
+    assert [issue["number"] for issue in client.iter_search_issues("label:bounty org:ergo")] == [1, 2, 3]
+    assert requested == [first, second]
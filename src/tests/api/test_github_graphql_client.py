@@ -0,0 +1,220 @@
+import json
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+import pytest
+
+from src.api.github_graphql_client import GitHubGraphQLClient
+from src.core.processor import BountyProcessor
+
+
+def _rest_issue(owner, repo, number, title, body, labels, is_pr=False):
+    issue = {
+        "number": number,
+        "title": title,
+        "state": "open",
+        "labels": [{"id": number, "name": name, "color": "ffffff"} for name in labels],
+        "html_url": f"https://github.com/{owner}/{repo}/{'pull' if is_pr else 'issues'}/{number}",
+        "body": body,
+        "user": {"login": f"user{number}", "id": number},
+        "created_at": f"2026-01-{number:02d}T00:00:00Z",
+        "updated_at": f"2026-02-{number:02d}T00:00:00Z",
+        "comments": number % 3,
+        "assignees": [{"login": "dev", "id": 7}] if number % 2 else [],
+    }
+    if is_pr:
+        issue["pull_request"] = {"url": issue["html_url"]}
+    return issue
+
+
+REPOS = {
+    ("org", "alpha"): {
+        "languages": ["Scala", "Java"],
+        "issues": [
+            _rest_issue("org", "alpha", 5, "Bounty: parser", "Amount: 100 ERG", ["bounty"]),
+            _rest_issue("org", "alpha", 3, "Fix docs", "no reward", ["docs"]),
+            _rest_issue("org", "alpha", 2, "Wallet support", "Bounty: $50", ["b-wallet"]),
+        ],
+        "pullRequests": [
+            _rest_issue("org", "alpha", 4, "Bounty: 20 SigUSD bounty", None, [], is_pr=True),
+        ],
+    },
+    ("Org", "beta"): {
+        "languages": ["Rust"],
+        "issues": [
+            _rest_issue("Org", "beta", 1, "Bounty - 2g of gold", "", ["bounty-2g gold"]),
+        ],
+        "pullRequests": [],
+    },
+}
+
+
+def _graphql_node(issue):
+    return {
+        "number": issue["number"],
+        "title": issue["title"],
+        "state": "OPEN",
+        "url": issue["html_url"],
+        "body": issue["body"] or "",
+        "createdAt": issue["created_at"],
+        "updatedAt": issue["updated_at"],
+        "author": {"login": issue["user"]["login"]},
+        "comments": {"totalCount": issue["comments"]},
+        "assignees": {
+            "totalCount": len(issue["assignees"]),
+            "nodes": [{"login": a["login"]} for a in issue["assignees"]],
+        },
+        "labels": {
+            "totalCount": len(issue["labels"]) + issue.get("hidden_labels", 0),
+            "nodes": [{"name": label["name"]} for label in issue["labels"]],
+        },
+    }
+
+
+class FakeGraphQLHandler(BaseHTTPRequestHandler):
+    """Resolves the repository queries issued by GitHubGraphQLClient."""
+
+    requests = []
+    # Repositories that exist but fail to resolve (e.g. a GraphQL timeout)
+    failing = set()
+
+    def do_POST(self):
+        payload = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        FakeGraphQLHandler.requests.append(payload)
+        query, variables = payload["query"], payload["variables"]
+        first = variables["first"]
+        data = {}
+        errors = []
+        for alias, index, body in re.findall(r"(r(\d+)): repository\(.*?\) \{\n(.*?)\n  \}", query, re.DOTALL):
+            key = (variables[f"o{index}"], variables[f"n{index}"])
+            repo = REPOS.get(key)
+            if repo is None or key in FakeGraphQLHandler.failing:
+                data[alias] = None
+                errors.append({
+                    "type": "NOT_FOUND" if repo is None else "SERVICE_UNAVAILABLE",
+                    "path": [alias],
+                    "message": f"Could not resolve {key[0]}/{key[1]}",
+                })
+                continue
+            result = {}
+            if "languages(" in body:
+                result["languages"] = {"nodes": [{"name": name} for name in repo["languages"]]}
+            for connection in ("issues", "pullRequests"):
+                if f"{connection}(" not in body:
+                    continue
+                start = int(variables.get(f"c{index}") or 0) if "after:" in body else 0
+                page = repo[connection][start:start + first]
+                has_next = start + first < len(repo[connection])
+                result[connection] = {
+                    "pageInfo": {"hasNextPage": has_next, "endCursor": str(start + first)},
+                    "nodes": [_graphql_node(issue) for issue in page],
+                }
+            data[alias] = result
+        body = json.dumps({"data": data, "errors": errors} if errors else {"data": data}).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def graphql_server():
+    """Local fake GitHub GraphQL endpoint."""
+    FakeGraphQLHandler.requests = []
+    FakeGraphQLHandler.failing = set()
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FakeGraphQLHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/graphql"
+    server.shutdown()
+    server.server_close()
+
+
+def _without_timestamps(bounties):
+    return [{k: v for k, v in bounty.items() if k != "timestamp"} for bounty in bounties]
+
+
+def test_fetch_repositories_paginates_and_returns_rest_shaped_issues(graphql_server):
+    client = GitHubGraphQLClient("token", graphql_url=graphql_server, page_size=1)
+
+    results = client.fetch_repositories([
+        {"owner": "org", "repo": "alpha"},
+        {"owner": "org", "repo": "missing"},
+        {"owner": "Org", "repo": "beta"},
+    ])
+
+    assert [languages for languages, _ in results] == [["Scala", "Java"], [], ["Rust"]]
+    assert [issue["number"] for issue in results[0][1]] == [5, 4, 3, 2]
+    assert results[1] == ([], [])
+    assert results[0][1][0]["labels"] == [{"name": "bounty"}]
+    assert results[0][1][0]["user"] == {"login": "user5"}
+    # One batch query plus follow-ups until the three-issue connection is exhausted
+    assert len(FakeGraphQLHandler.requests) == 3
+
+
+def test_graphql_and_rest_backends_produce_identical_bounties(graphql_server):
+    repos = [{"owner": "org", "repo": "alpha"}, {"owner": "Org", "repo": "beta"}]
+    rates = {"SigUSD": 2.0, "gGOLD": 50.0}
+
+    with patch("src.core.processor.GitHubClient.get_repository_languages",
+               side_effect=lambda owner, repo: REPOS[(owner, repo)]["languages"]), \
+         patch("src.core.processor.GitHubClient.iter_repository_issues",
+               side_effect=lambda owner, repo: iter(sorted(
+                   REPOS[(owner, repo)]["issues"] + REPOS[(owner, repo)]["pullRequests"],
+                   key=lambda issue: issue["number"], reverse=True))):
+        rest = BountyProcessor("token", rates)
+        rest.reserved_bounty_ids = set()
+        rest.process_repositories(repos)
+
+    graphql = BountyProcessor("token", rates, github_backend="graphql", graphql_batch_size=2)
+    graphql.reserved_bounty_ids = set()
+    graphql.github_client.graphql_url = graphql_server
+    graphql.process_repositories(repos)
+
+    assert len(rest.bounty_data) == 4
+    assert _without_timestamps(graphql.bounty_data) == _without_timestamps(rest.bounty_data)
+    assert graphql.project_totals == rest.project_totals
+
+
+def _rest_fallback(client):
+    """Serve the REST methods of a client from REPOS, recording the repositories asked for."""
+    fetched = []
+
+    def issues(owner, repo, require_complete=False):
+        fetched.append((owner, repo))
+        return iter(REPOS[(owner, repo)]["issues"] + REPOS[(owner, repo)]["pullRequests"])
+
+    client.get_repository_languages = lambda owner, repo: REPOS[(owner, repo)]["languages"]
+    client.iter_repository_issues = issues
+    return fetched
+
+
+def test_repositories_failing_in_graphql_are_fetched_through_rest(graphql_server):
+    FakeGraphQLHandler.failing = {("org", "alpha")}
+    client = GitHubGraphQLClient("token", graphql_url=graphql_server)
+    fetched = _rest_fallback(client)
+
+    results = client.fetch_repositories([{"owner": "org", "repo": "alpha"}, {"owner": "Org", "repo": "beta"}])
+
+    assert fetched == [("org", "alpha")]
+    assert results[0][0] == ["Scala", "Java"]
+    assert [issue["number"] for issue in results[0][1]] == [5, 4, 3, 2]
+    assert [issue["number"] for issue in results[1][1]] == [1]
+
+
+def test_issues_with_more_labels_than_returned_are_fetched_through_rest(graphql_server, monkeypatch):
+    issue = dict(REPOS[("Org", "beta")]["issues"][0], hidden_labels=1)
+    monkeypatch.setitem(REPOS, ("Org", "beta"), dict(REPOS[("Org", "beta")], issues=[issue]))
+    client = GitHubGraphQLClient("token", graphql_url=graphql_server)
+    fetched = _rest_fallback(client)
+
+    results = client.fetch_repositories([{"owner": "org", "repo": "alpha"}, {"owner": "Org", "repo": "beta"}])
+
+    assert fetched == [("Org", "beta")]
+    assert [issue["number"] for issue in results[1][1]] == [1]
@@ -0,0 +1,66 @@
+from src.api.base_client import BaseClient
+from src.api.http_cache import HttpCache
+
+
+class MockResponse:
+    def __init__(self, status_code, payload=None, headers=None, links=None):
+        self.status_code = status_code
+        self._payload = payload
+        self.headers = headers or {}
+        self.links = links or {}
+
+    def json(self):
+        if self._payload is None:
+            raise ValueError("No JSON body")
+        return self._payload
+
+    def raise_for_status(self):
+        pass
+
+
+def test_not_modified_reply_is_served_from_cache(tmp_path):
+    cache = HttpCache(tmp_path / "cache.json")
+    client = BaseClient(base_url="https://api.example.com", cache=cache)
+    sent_headers = []
+    responses = [
+        MockResponse(200, [{"id": 1}], headers={"ETag": '"abc"'}, links={"next": {"url": "https://api.example.com/items?page=2"}}),
+        MockResponse(304),
+    ]
+
+    def fake_request(method, url, headers, json, timeout):
+        sent_headers.append(dict(headers))
+        return responses.pop(0)
+
+    client.session.request = fake_request
+
+    assert client._make_json_request("/items") == ([{"id": 1}], {"next": {"url": "https://api.example.com/items?page=2"}})
+    assert client._make_json_request("/items") == ([{"id": 1}], {"next": {"url": "https://api.example.com/items?page=2"}})
+
+    assert "If-None-Match" not in sent_headers[0]
+    assert sent_headers[1]["If-None-Match"] == '"abc"'
+    assert cache.stats() == {"hits": 1, "misses": 1, "evictions": 0, "entries": 1}
+
+
+def test_cache_persists_and_evicts_least_recently_used(tmp_path):
+    path = tmp_path / "cache.json"
+    cache = HttpCache(path, max_entries=2)
+    cache.store("https://a", [1], {}, '"a"', None)
+    cache.store("https://b", [2], {}, None, "Tue, 01 Jan 2030 00:00:00 GMT")
+    cache.get("https://a")
+    cache.store("https://c", [3], {}, '"c"', None)
+    cache.save()
+
+    reloaded = HttpCache(path, max_entries=2)
+
+    assert cache.evictions == 1
+    assert reloaded.conditional_headers("https://b") == {}
+    assert reloaded.conditional_headers("https://a") == {"If-None-Match": '"a"'}
+    assert reloaded.get("https://c")["body"] == [3]
+
+
+def test_responses_without_validators_are_not_cached(tmp_path):
+    cache = HttpCache(tmp_path / "cache.json")
+    cache.store("https://a", [1], {}, None, None)
+
+    assert len(cache) == 0
+    assert cache.misses == 1
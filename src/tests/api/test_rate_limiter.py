@@ -0,0 +1,152 @@
+import threading
+
+import requests
+
+from src.api import base_client
+from src.api.github_client import GitHubClient
+from src.api.rate_limiter import RateLimiter
+
+
+class FakeClock:
+    def __init__(self, now=1_000_000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+class MockResponse:
+    def __init__(self, status_code, payload=None, headers=None, text=""):
+        self.status_code = status_code
+        self._payload = payload
+        self.headers = headers or {}
+        self.links = {}
+        self.text = text
+
+    def json(self):
+        return self._payload
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.exceptions.HTTPError(f"{self.status_code} error")
+
+
+def _budget(remaining, reset, limit=5000):
+    return {
+        "X-RateLimit-Limit": str(limit),
+        "X-RateLimit-Remaining": str(remaining),
+        "X-RateLimit-Reset": str(reset),
+    }
+
+
+def test_requests_are_not_delayed_while_pending_work_fits_the_budget():
+    clock = FakeClock()
+    limiter = RateLimiter(clock=clock)
+    limiter.update(200, _budget(100, clock.now + 600))
+    limiter.set_pending(50)
+
+    assert [limiter.acquire() for _ in range(50)] == [0] * 50
+    assert limiter.metrics()["resources"]["core"]["remaining"] == 50
+
+
+def test_remaining_budget_is_spread_over_pending_work():
+    clock = FakeClock()
+    limiter = RateLimiter(reserve=10, clock=clock)
+    limiter.update(200, _budget(20, clock.now + 100))
+    limiter.set_pending(100)
+
+    delays = [limiter.acquire() for _ in range(3)]
+
+    # 10 usable requests over 100 seconds: one slot every 10 seconds
+    assert delays[0] == 0
+    assert 10 <= delays[1] <= 12
+    assert delays[2] > delays[1]
+    assert limiter.metrics()["pending"] == 97
+
+
+def test_exhausted_budget_waits_for_reset_and_resets_the_window():
+    clock = FakeClock()
+    limiter = RateLimiter(clock=clock)
+    limiter.update(200, _budget(0, clock.now + 30))
+
+    assert limiter.acquire() == 31
+    clock.now += 40
+    assert limiter.acquire() == 0
+
+
+def test_retry_after_and_secondary_limits_pause_every_resource():
+    clock = FakeClock()
+    limiter = RateLimiter(secondary_limit_delay=60, clock=clock)
+
+    assert limiter.update(429, {"Retry-After": "5"}) == 5
+    assert limiter.acquire("search") == 5
+
+    clock.now += 10
+    body = "You have exceeded a secondary rate limit. Please wait a few minutes before you try again."
+    assert limiter.update(403, _budget(4000, clock.now + 600), body=body) == 60
+    assert limiter.update(403, _budget(3999, clock.now + 600), body=body) == 120
+    assert limiter.acquire("graphql") == 120
+    assert limiter.update(200, _budget(3998, clock.now + 600)) is None
+
+    metrics = limiter.metrics()
+    assert metrics["secondary_limit_hits"] == 3
+    assert metrics["rate_limited_responses"] == 3
+    assert metrics["paused_for"] == 120
+
+
+def test_plain_forbidden_reply_is_not_a_rate_limit():
+    limiter = RateLimiter(clock=FakeClock())
+
+    assert limiter.update(403, _budget(4000, 2_000_000), body="Resource not accessible by integration") is None
+    assert limiter.metrics()["rate_limited_responses"] == 0
+
+
+def test_concurrent_acquires_are_scheduled_into_distinct_slots():
+    clock = FakeClock()
+    limiter = RateLimiter(clock=clock)
+    limiter.update(200, _budget(100, clock.now + 100))
+    limiter.set_pending(1000)
+    delays = []
+    lock = threading.Lock()
+
+    def worker():
+        for _ in range(10):
+            delay = limiter.acquire()
+            with lock:
+                delays.append(delay)
+
+    threads = [threading.Thread(target=worker) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(set(round(delay, 6) for delay in delays)) == 50
+    assert limiter.metrics()["requests"] == 50
+
+
+def test_github_client_reports_headers_and_paces_by_resource(monkeypatch):
+    clock = FakeClock()
+    limiter = RateLimiter(clock=clock)
+    client = GitHubClient("secret", retry_delay=0, rate_limiter=limiter)
+    sleeps = []
+
+    def fake_sleep(delay):
+        sleeps.append(delay)
+        clock.now += delay
+
+    monkeypatch.setattr(base_client.time, "sleep", fake_sleep)
+    responses = [
+        MockResponse(403, headers={"Retry-After": "3"}, text="secondary rate limit"),
+        MockResponse(200, {"Rust": 1}, headers=_budget(4999, clock.now + 3600)),
+        MockResponse(200, {"items": []}, headers={**_budget(29, clock.now + 60, limit=30), "X-RateLimit-Resource": "search"}),
+    ]
+    client.session.request = lambda **kwargs: responses.pop(0)
+
+    assert client.get_repository_languages("org", "repo") == ["Rust"]
+    assert client._make_json_request("/search/issues?q=label:bounty")[0] == {"items": []}
+
+    assert sleeps == [3]
+    resources = limiter.metrics()["resources"]
+    assert resources["core"]["remaining"] == 4999
+    assert resources["search"] == {"limit": 30, "remaining": 29, "reset_in": 57}
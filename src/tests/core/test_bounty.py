@@ -0,0 +1,74 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from src.core.bounty import Bounty, age_in_days, created_time, parse_github_timestamp
+
+
+def test_bounty_answers_dictionary_accessors():
+    bounty = Bounty(
+        owner="ergoplatform", repo="sigma-rust", title="Fix parser", url="https://github.com/ergoplatform/sigma-rust/issues/7",
+        amount="150", currency="SigUSD", labels=["bounty"], issue_number=7, creator="alice", status="open",
+    )
+
+    assert bounty["owner"] == "ergoplatform"
+    assert bounty.get("status") == "open"
+    assert bounty.get("missing", "fallback") == "fallback"
+    assert "status" in bounty
+    assert "description" not in bounty
+    with pytest.raises(KeyError):
+        bounty["description"]
+    assert bounty.numeric_amount == 150.0
+    assert Bounty(owner="o", repo="r", amount="Ongoing").numeric_amount is None
+
+
+def test_extra_bounty_round_trips_through_from_dict():
+    entry = {
+        "timestamp": "2025-03-18 12:15:37",
+        "owner": "DevDAO",
+        "repo": "https://github.com/Alesfatalis/keystone-sdk-rust/tree/feat/ergo_support",
+        "title": "Keystone Wallet Integration",
+        "url": "https://discord.com/channels/1",
+        "amount": "3000",
+        "currency": "ERG",
+        "primary_lang": "Rust",
+        "secondary_lang": "None",
+        "labels": ["bounty", "development"],
+        "issue_number": "keystone-integration",
+        "creator": "DevDAO",
+        "description": "Integration of Keystone Wallet with Ergo ecosystem",
+        "status": "In Progress",
+        "notes": "kept",
+    }
+
+    bounty = Bounty.from_dict(entry)
+
+    assert bounty["description"] == entry["description"]
+    assert bounty["issue_number"] == "keystone-integration"
+    assert bounty["notes"] == "kept" and "notes" in bounty
+    assert {key: bounty.to_dict()[key] for key in entry} == entry
+
+
+def test_repeated_strings_are_interned():
+    first = Bounty(owner="".join(["ergo", "platform"]), repo="r", currency="".join(["Sig", "USD"]))
+    second = Bounty(owner="".join(["ergo", "platform"]), repo="r", currency="".join(["Sig", "USD"]))
+
+    assert first.owner is second.owner
+    assert first.currency is second.currency
+    assert not hasattr(first, "__dict__")
+
+
+def test_timestamps_are_parsed_once_with_day_counts():
+    now = datetime(2025, 3, 11, 12, tzinfo=timezone.utc)
+    bounty = Bounty(owner="o", repo="r", created_at="2025-03-01T00:00:00Z", updated_at="not a date", now=now)
+    as_dict = bounty.to_dict()
+
+    assert bounty.created == datetime(2025, 3, 1, tzinfo=timezone.utc)
+    assert bounty.age_days == 10
+    assert bounty.updated is None and bounty.updated_days is None
+    assert "age_days" not in as_dict and as_dict["created_at"] == "2025-03-01T00:00:00Z"
+
+    # Views accept records and plain dictionaries alike
+    assert created_time(as_dict) == bounty.created
+    assert age_in_days(as_dict, now) == age_in_days(bounty, now) == 10
+    assert parse_github_timestamp("") is None
@@ -1,4 +1,16 @@
-from src.core.extractors import extract_bounty_info, extract_from_labels, extract_from_text, is_bounty_issue
+import random
+import re
+
+from src.core.extractors import (
+    CURRENCY_MAPPINGS,
+    LABEL_PATTERNS,
+    TEXT_PATTERNS,
+    UNIT_MAPPINGS,
+    extract_bounty_info,
+    extract_from_labels,
+    extract_from_text,
+    is_bounty_issue,
+)
 
 
 def test_detects_bounty_from_title_and_labels():
@@ -29,3 +41,84 @@ def test_extracts_no_amount_fallback():
     }
 
     assert extract_bounty_info(issue) == ("Not specified", "Not specified")
+
+
+# --- Differential tests against the original uncompiled extraction loop ---
+
+
+def _reference_extract(text, patterns, strip_commas, default_currency):
+    """The pre-compilation implementation: every pattern searched in order, case-insensitively."""
+    for pattern in patterns:
+        for match in re.finditer(pattern, text, re.IGNORECASE):
+            amount = match.group(1).replace(',', '') if strip_commas else match.group(1)
+            if len(match.groups()) == 3 and match.group(3) in ['gold', 'silver', 'platinum']:
+                unit = UNIT_MAPPINGS.get(match.group(2).lower(), match.group(2).lower())
+                return amount, f"{unit} {match.group(3).upper()}"
+            if default_currency:
+                currency = match.group(2) if len(match.groups()) > 1 and match.group(2) else 'USD'
+                return amount, CURRENCY_MAPPINGS.get(currency.lower(), currency.upper())
+            currency = match.group(2).upper()
+            return amount, CURRENCY_MAPPINGS.get(currency.lower(), currency)
+    return None, None
+
+
+def _reference_from_labels(labels):
+    for label in labels:
+        result = _reference_extract(label['name'].lower(), LABEL_PATTERNS, False, False)
+        if result != (None, None):
+            return result
+    return None, None
+
+
+def _reference_from_text(title, body):
+    text = f"{title} {body}".lower() if body else title.lower()
+    return _reference_extract(text, TEXT_PATTERNS, True, True)
+
+
+FRAGMENTS = [
+    "bounty", "Bounty:", "BOUNTY of", "bounty is", "b-", "amount:", "Amount", "$", "€", "£",
+    "100", "1,000", "2.5", "12.50", "0", "erg", "ERGOS", "SigUSD", "usd", "dollars", "gort",
+    "RSN", "bene", "g", "gram", "grams", "oz", "ounces", "of", "gold", "Silver", "platinum",
+    "-", " ", "  ", "\n", "fix", "parser", "wallet", "İ", "ſilver", "ǅ", "ß", "K", "—",
+]
+
+HANDWRITTEN_CORPUS = [
+    ("Fix wallet", "Bounty: 1,000 SigUSD"),
+    ("50 ERG bounty", ""),
+    ("Bounty: 2g of GOLD", None),
+    ("Implement parser", "The amount: 3 ounces of silver is paid"),
+    ("€ 20 bounty for docs", "also $5 erg"),
+    ("Plain title", "no reward mentioned at all"),
+    ("Bounty", "bounty of 1,234.56 dollars, amount: 5 erg"),
+    ("Ünïcödé bounty", "Bounty is 40 ERGOS"),
+    ("b-100sigusd", "ſilver 2 grams of ſilver bounty"),
+]
+
+
+def _generated_corpus(count=3000, seed=1234):
+    rng = random.Random(seed)
+    keywords, amounts, units = FRAGMENTS[:10], FRAGMENTS[10:15], FRAGMENTS[15:32]
+    for _ in range(count):
+        if rng.random() < 0.5:
+            # Keyword, amount and unit in the order most bounty phrases use
+            words = [rng.choice(FRAGMENTS), rng.choice(keywords), rng.choice(amounts),
+                     rng.choice(units), rng.choice(units), rng.choice(keywords)]
+        else:
+            words = [rng.choice(FRAGMENTS) for _ in range(rng.randint(1, 12))]
+        separators = [rng.choice(["", " ", "-", ": "]) for _ in words]
+        text = "".join(w + s for w, s in zip(words, separators, strict=True))
+        split = rng.randint(0, len(text))
+        yield text[:split], text[split:] if rng.random() < 0.9 else None
+
+
+def test_extract_from_text_matches_reference_on_corpus():
+    corpus = HANDWRITTEN_CORPUS + list(_generated_corpus())
+    for title, body in corpus:
+        assert extract_from_text(title, body) == _reference_from_text(title, body), (title, body)
+
+
+def test_extract_from_labels_matches_reference_on_corpus():
+    corpus = [[{"name": title}, {"name": body or ""}] for title, body in HANDWRITTEN_CORPUS + list(_generated_corpus())]
+    corpus += [[{"name": "bounty-100erg"}], [{"name": "b-50sigusd"}], [{"name": "bounty-2g gold"}], [{"name": "2 oz platinum bounty"}]]
+    for labels in corpus:
+        assert extract_from_labels(labels) == _reference_from_labels(labels), labels
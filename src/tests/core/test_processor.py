@@ -4,6 +4,7 @@ Unit tests for the BountyProcessor class.
 
 import pytest
 import json
+from datetime import datetime, timezone
 from unittest.mock import MagicMock, patch
 
 # Assuming BountyProcessor is importable like this
@@ -25,6 +26,8 @@ def mock_github_client(mocker):
     client = mocker.MagicMock(spec=GitHubClient)
     client.get_repository_languages.return_value = ["Python", "JavaScript"]
     client.get_repository_issues.return_value = [] # Default to no issues
+    # Streamed issues come from the list mock so tests can set either
+    client.iter_repository_issues.side_effect = lambda *args, **kwargs: iter(client.get_repository_issues(*args, **kwargs))
     client.get_organization_repos.return_value = [] # Default to no org repos
     return client
 
@@ -115,6 +118,31 @@ def test_process_issue_marks_reserved_based_on_submission(processor, mock_github
     assert open_bounty["currency"] == "ERG", "Currency should be extracted correctly"
 
 
+def test_process_issue_parses_timestamps_once_against_the_run_time(processor):
+    from datetime import datetime, timezone
+
+    processor.now = datetime(2025, 3, 11, 12, tzinfo=timezone.utc)
+    issue = {
+        "number": 7,
+        "title": "Bounty: Dated issue",
+        "state": "open",
+        "labels": [{"name": "bounty"}],
+        "html_url": "https://github.com/test-owner/test-repo/issues/7",
+        "body": "Amount: 50 ERG",
+        "user": {"login": "creator"},
+        "created_at": "2025-03-01T00:00:00Z",
+        "updated_at": "2025-03-10T18:00:00Z",
+    }
+
+    processor._process_issue(issue, "test-owner", "test-repo", "Python", "None")
+
+    bounty = processor.bounty_data[0]
+    assert bounty.created == datetime(2025, 3, 1, tzinfo=timezone.utc)
+    assert bounty.age_days == 10
+    assert bounty.updated_days == 0
+    assert bounty["created_at"] == "2025-03-01T00:00:00Z"
+
+
 def test_process_issue_reservation_uses_full_bounty_id(processor):
     """Same issue number in another repo must not be marked reserved."""
     processor.reserved_bounty_ids = {"test-owner/test-repo#123"}
@@ -127,8 +155,6 @@ def test_process_issue_reservation_uses_full_bounty_id(processor):
         "body": "Amount: 50 ERG",
         "user": {"login": "creator"},
     }
-    processor.project_totals["test-owner"] = {"count": 0, "value": 0.0}
-
     processor._process_issue(issue, "test-owner", "other-repo", "Python", "None")
 
     assert processor.bounty_data[0]["status"] == "open"
@@ -175,7 +201,7 @@ def test_process_organizations_dedupes_case_insensitive(processor, mock_github_c
 
 
 def test_project_totals_merge_owner_case(processor):
-    processor.project_totals["stabilitynexus"] = {"count": 1, "value": 0.0}
+    processor.add_extra_bounties([{"owner": "stabilitynexus", "repo": "other"}])
 
     processor.add_extra_bounties([{
         "owner": "StabilityNexus",
@@ -187,3 +213,229 @@ def test_project_totals_merge_owner_case(processor):
     assert list(processor.project_totals) == ["stabilitynexus"]
     assert processor.project_totals["stabilitynexus"]["count"] == 2
     assert processor.project_totals["stabilitynexus"]["value"] == 100.0
+
+
+def test_project_names_keep_first_casing(processor):
+    processor.add_extra_bounties([
+        {"owner": "StabilityNexus", "repo": "a", "amount": "10", "currency": "ERG"},
+        {"owner": "STABILITYNEXUS", "repo": "b", "amount": "5", "currency": "ERG"},
+    ])
+
+    assert processor.project_names == {"stabilitynexus": "StabilityNexus"}
+    assert processor.project_totals == {"StabilityNexus": {"count": 2, "value": 15.0}}
+
+
+def test_process_repositories_keeps_input_order_with_concurrent_fetches(processor, mock_github_client):
+    """Repos fetched out of order must still be processed in input order."""
+    import threading
+    import time
+
+    slow_repo_started = threading.Event()
+
+    def fake_issues(owner, repo_name):
+        if repo_name == "slow":
+            slow_repo_started.set()
+            time.sleep(0.05)
+        return [{
+            "number": 1,
+            "title": f"Bounty: {repo_name}",
+            "state": "open",
+            "labels": [{"name": "bounty"}],
+            "html_url": f"https://github.com/{owner}/{repo_name}/issues/1",
+            "body": "Amount: 10 ERG",
+            "user": {"login": "creator"},
+        }]
+
+    mock_github_client.get_repository_issues.side_effect = fake_issues
+    processor.max_workers = 4
+
+    processor.process_repositories([
+        {"owner": "Org", "repo": "slow"},
+        {"owner": "org", "repo": "fast"},
+        {"owner": "other", "repo": "fast"},
+    ])
+
+    assert slow_repo_started.is_set()
+    assert [(b["owner"], b["repo"]) for b in processor.bounty_data] == [
+        ("Org", "slow"),
+        ("org", "fast"),
+        ("other", "fast"),
+    ]
+    assert processor.project_totals == {
+        "Org": {"count": 2, "value": 20.0},
+        "other": {"count": 1, "value": 10.0},
+    }
+
+
+def _issue(number, title="Bounty: task", state="open", updated_at="2026-01-01T00:00:00Z"):
+    return {
+        "number": number,
+        "title": title,
+        "state": state,
+        "labels": [],
+        "html_url": f"https://github.com/org/repo/issues/{number}",
+        "body": "Amount: 10 ERG",
+        "user": {"login": "creator"},
+        "created_at": "2026-01-01T00:00:00Z",
+        "updated_at": updated_at,
+    }
+
+
+def test_incremental_sync_merges_changes_into_issue_store(tmp_path, processor, mock_github_client):
+    from src.core.issue_store import IssueStore
+
+    store_path = tmp_path / "issues.json"
+    processor.issue_store = IssueStore(store_path)
+    mock_github_client.get_repository_issues.return_value = [_issue(1), _issue(2), _issue(3, title="Fix typo")]
+
+    assert [i["number"] for i in processor._sync_repository_issues("org", "repo")] == [2, 1]
+    processor.issue_store.save()
+
+    processor.issue_store = IssueStore(store_path)
+    mock_github_client.get_repository_issues.reset_mock()
+    mock_github_client.get_repository_issues.return_value = [
+        _issue(1, state="closed"),
+        _issue(3, title="Bounty: now a bounty"),
+        _issue(4),
+    ]
+
+    issues = processor._sync_repository_issues("org", "repo")
+
+    call = mock_github_client.get_repository_issues.call_args
+    assert call.kwargs["state"] == "all"
+    assert call.kwargs["since"]
+    assert [i["number"] for i in issues] == [4, 3, 2]
+
+
+def test_full_resync_ignores_last_sync_time(tmp_path, processor, mock_github_client):
+    from src.core.issue_store import IssueStore
+
+    processor.issue_store = IssueStore(tmp_path / "issues.json")
+    processor.issue_store.replace("org", "repo", [_issue(1)], "2999-01-01T00:00:00Z")
+    processor.full_resync = True
+    mock_github_client.get_repository_issues.return_value = [_issue(2)]
+
+    issues = processor._sync_repository_issues("org", "repo")
+
+    mock_github_client.get_repository_issues.assert_called_once_with("org", "repo", require_complete=True)
+    assert [i["number"] for i in issues] == [2]
+
+
+def test_incomplete_listing_keeps_stored_issues_and_sync_time(tmp_path, processor, mock_github_client):
+    from src.api.github_client import IncompleteListingError
+    from src.core.issue_store import IssueStore, format_sync_time
+
+    synced_at = format_sync_time(datetime.now(timezone.utc))
+    processor.issue_store = IssueStore(tmp_path / "issues.json")
+    processor.issue_store.replace("org", "repo", [_issue(1), _issue(2)], synced_at)
+
+    def partial_listing(*args, **kwargs):
+        yield _issue(3)
+        raise IncompleteListingError("Listing of all issues stopped at page 2")
+
+    mock_github_client.iter_repository_issues.side_effect = partial_listing
+
+    # Incremental sync: the changes since the last sync are asked for again next run
+    issues = processor._sync_repository_issues("org", "repo")
+    assert [i["number"] for i in issues] == [2, 1]
+    assert processor.issue_store.last_sync("org", "repo") == synced_at
+
+    # Full sync: issues on the pages that were not fetched are not dropped
+    processor.full_resync = True
+    assert [i["number"] for i in processor._sync_repository_issues("org", "repo")] == [2, 1]
+
+
+def test_fetch_repository_keeps_only_trimmed_bounty_candidates(processor, mock_github_client):
+    raw = _issue(1)
+    raw["reactions"] = {"+1": 3}
+    mock_github_client.get_repository_issues.return_value = [
+        raw,
+        _issue(2, title="Fix typo"),
+        _issue(3, state="closed"),
+    ]
+
+    languages, issues = processor._fetch_repository({"owner": "org", "repo": "repo"})
+
+    mock_github_client.iter_repository_issues.assert_called_once_with("org", "repo")
+    assert languages == ["Python", "JavaScript"]
+    assert [issue["number"] for issue in issues] == [1]
+    assert "reactions" not in issues[0]
+
+
+def _search_result(repo, number, title="Bounty: task", labels=()):
+    issue = _issue(number, title=title)
+    issue["labels"] = [{"name": label} for label in labels]
+    issue["repository_url"] = f"https://api.github.com/repos/{repo}"
+    return issue
+
+
+def test_search_discovery_fetches_only_candidates(processor, mock_github_client):
+    processor.discovery_mode = "search"
+    processor.tracked_orgs = {"ergo"}
+    results = {
+        "label:bounty state:open org:ergo repo:solo/tool": [
+            _search_result("ergo/node", 5, title="Improve sync", labels=["bounty"]),
+            _search_result("ergo/archived", 9),
+            _search_result("solo/tool", 2),
+        ],
+        "bounty in:title state:open org:ergo repo:solo/tool": [
+            _search_result("ergo/node", 7, title="Fix typo"),
+            _search_result("ergo/node", 3),
+            _search_result("solo/tool", 2),
+        ],
+    }
+    mock_github_client.iter_search_issues.side_effect = lambda query: iter(results[query])
+
+    processor.process_repositories([
+        {"owner": "ergo", "repo": "node"},
+        {"owner": "ergo", "repo": "idle"},
+        {"owner": "solo", "repo": "tool"},
+    ])
+
+    assert sorted(call.args[0] for call in mock_github_client.iter_search_issues.call_args_list) == sorted(results)
+    assert [(b["repo"], b["issue_number"]) for b in processor.bounty_data] == [("node", 5), ("node", 3), ("tool", 2)]
+    assert sorted(call.args for call in mock_github_client.get_repository_languages.call_args_list) == [
+        ("ergo", "node"), ("solo", "tool")
+    ]
+    mock_github_client.get_repository_issues.assert_not_called()
+
+
+def test_metadata_cache_reuses_languages_until_pushed_at_moves(tmp_path, processor, mock_github_client):
+    from src.core.metadata_cache import MetadataCache
+
+    path = tmp_path / "metadata.json"
+    processor.metadata_cache = MetadataCache(path)
+    repo = {"owner": "org", "repo": "repo", "pushed_at": "2026-01-01T00:00:00Z"}
+
+    assert processor._repository_languages(repo) == ["Python", "JavaScript"]
+    processor.metadata_cache.save()
+
+    processor.metadata_cache = MetadataCache(path)
+    mock_github_client.get_repository_languages.reset_mock()
+    mock_github_client.get_repository_languages.return_value = ["Rust"]
+
+    assert processor._repository_languages(repo) == ["Python", "JavaScript"]
+    mock_github_client.get_repository_languages.assert_not_called()
+
+    moved = dict(repo, pushed_at="2026-02-01T00:00:00Z")
+    assert processor._repository_languages(moved) == ["Rust"]
+    assert processor.metadata_cache.stats() == {"hits": 1, "misses": 1}
+
+
+def test_metadata_cache_expires_org_listings_and_honours_refresh(tmp_path):
+    from src.core.metadata_cache import MetadataCache
+
+    cache = MetadataCache(tmp_path / "metadata.json", org_ttl_hours=1, languages_ttl_hours=2)
+    cache.set_org_repos("Ergo", [{"name": "node", "archived": False, "owner": {"login": "ergo"}}], now=1000)
+    cache.set_languages("ergo", "node", ["Scala"], now=1000)
+
+    assert cache.get_org_repos("ergo", now=1000 + 3599) == [
+        {"name": "node", "archived": False, "fork": None, "has_issues": None, "pushed_at": None}
+    ]
+    assert cache.get_org_repos("ergo", now=1000 + 3600) is None
+    assert cache.get_languages("ergo", "node", now=1000 + 7199) == ["Scala"]
+    assert cache.get_languages("ergo", "node", now=1000 + 7200) is None
+
+    cache.save()
+    refreshed = MetadataCache(tmp_path / "metadata.json", refresh=True)
+    assert refreshed.get_org_repos("ergo", now=1000) is None
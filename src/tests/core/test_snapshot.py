@@ -0,0 +1,56 @@
+import json
+
+from src.core.bounty import Bounty
+from src.core.snapshot import bounty_key, load_snapshot, write_snapshot
+
+
+def _bounty(number, amount="100", currency="SigUSD", status="open", **kwargs):
+    return Bounty(
+        owner="ErgoPlatform", repo="Sigma-Rust", title=f"Issue {number}", url=f"https://github.com/x/{number}",
+        amount=amount, currency=currency, issue_number=number, status=status, timestamp="2025-01-01 00:00:00",
+        **kwargs,
+    )
+
+
+def test_snapshot_is_keyed_sorted_and_stable(tmp_path):
+    path = tmp_path / "bounties.jsonl"
+
+    write_snapshot([_bounty(10), _bounty(2)], path)
+    first = path.read_text(encoding="utf-8")
+    records = [json.loads(line) for line in first.splitlines()]
+
+    assert bounty_key(_bounty(2)) == "ergoplatform/sigma-rust#2"
+    assert [record["key"] for record in records] == ["ergoplatform/sigma-rust#10", "ergoplatform/sigma-rust#2"]
+    assert "timestamp" not in records[0]
+    assert load_snapshot(path)["ergoplatform/sigma-rust#2"]["amount"] == "100"
+
+    # A later run with the same bounties leaves the file byte-identical
+    second = _bounty(2)
+    second.timestamp = "2025-01-02 00:00:00"
+    diff = write_snapshot([second, _bounty(10)], path)
+    assert path.read_text(encoding="utf-8") == first
+    assert diff == {"added": [], "removed": [], "value_changed": [], "status_changed": []}
+
+
+def test_diff_reports_added_removed_value_and_status_changes(tmp_path):
+    path = tmp_path / "bounties.jsonl"
+    diff_path = tmp_path / "bounty_changes.json"
+    write_snapshot([_bounty(1), _bounty(2), _bounty(3)], path)
+
+    diff = write_snapshot(
+        [_bounty(1, amount="150"), _bounty(2, status="Reserved"), _bounty(4, currency="ERG")], path, diff_path
+    )
+
+    assert [record["key"] for record in diff["added"]] == ["ergoplatform/sigma-rust#4"]
+    assert [record["key"] for record in diff["removed"]] == ["ergoplatform/sigma-rust#3"]
+    assert diff["value_changed"] == [{
+        "key": "ergoplatform/sigma-rust#1",
+        "title": "Issue 1",
+        "url": "https://github.com/x/1",
+        "before": {"amount": "100", "currency": "SigUSD"},
+        "after": {"amount": "150", "currency": "SigUSD"},
+    }]
+    assert [(c["key"], c["before"], c["after"]) for c in diff["status_changed"]] == [
+        ("ergoplatform/sigma-rust#2", {"status": "open"}, {"status": "Reserved"})
+    ]
+    assert json.loads(diff_path.read_text(encoding="utf-8")) == diff
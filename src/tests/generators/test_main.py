@@ -3,8 +3,9 @@ Unit tests for the main generator functions.
 """
 
 import pytest
-from unittest.mock import patch, mock_open, MagicMock
+from unittest.mock import patch, MagicMock
 import os
+from pathlib import Path
 
 # Assuming generator functions are importable like this
 # Adjust the import path if necessary based on your project structure
@@ -19,6 +20,7 @@ from src.generators.main import (
     update_readme_badges,
     update_ongoing_programs_table,
     generate_high_value_bounties_file,
+    generate_bounty_discovery_files,
     # Import moved functions for testing
     group_by_language,
     group_by_organization,
@@ -26,9 +28,13 @@ from src.generators.main import (
     calculate_currency_totals,
     find_featured_bounties,
     find_high_value_bounties,
-    find_beginner_friendly_bounties
+    find_beginner_friendly_bounties,
+    BountyIndex,
+    CONSTANTS
 )
 from src.utils.markdown import generate_standard_bounty_table, update_readme_badges
+from src.api.currency_client import CurrencyClient, ErgValuation
+from src.core.bounty import Bounty
 
 # --- Mock Data ---
 
@@ -125,6 +131,27 @@ def test_group_by_organization_merges_case_variants():
     assert list(result) == ["StabilityNexus"]
     assert len(result["StabilityNexus"]) == 2
 
+def test_group_by_organization_uses_given_display_names():
+    result = group_by_organization(
+        [{"owner": "stabilitynexus"}, {"owner": "StabilityNexus"}, {"owner": "other"}],
+        org_names={"stabilitynexus": "StabilityNexus"},
+    )
+
+    assert list(result) == ["StabilityNexus", "other"]
+    assert len(result["StabilityNexus"]) == 2
+
+def test_bounty_index_groups_and_counts(mock_bounty_data):
+    bounty_data = mock_bounty_data + [dict(mock_bounty_data[0], owner="ORG1", issue_number=4)]
+    index = BountyIndex(bounty_data)
+
+    assert index.languages == group_by_language(bounty_data)
+    assert index.organizations == group_by_organization(bounty_data)
+    assert index.currencies == group_by_currency(bounty_data)
+    assert index.not_specified == [mock_bounty_data[2]]
+    assert (index.languages_count, index.orgs_count, index.currencies_count) == (2, 2, 3)
+    assert len(index.organizations["org1"]) == 3  # "ORG1" is grouped with "org1"
+
+
 def test_group_by_currency(mock_bounty_data):
     """Test the group_by_currency function."""
     result = group_by_currency(mock_bounty_data)
@@ -169,33 +196,24 @@ def test_find_beginner_friendly_bounties(mock_bounty_data):
 
 # --- Tests for Generator Functions ---
 
-# We use mock_open to simulate file writing without touching the disk
-@patch("builtins.open", new_callable=mock_open)
-@patch("src.generators.main.ensure_directory")
 @patch("src.utils.common.get_current_timestamp", return_value="2025-03-26 14:00:00")
-def test_generate_main_file(mock_ts, mock_ensure_dir, mock_file_open, mock_bounty_data, mock_conversion_rates):
+def test_generate_main_file(mock_ts, tmp_path, mock_bounty_data, mock_conversion_rates):
     """Test the generate_main_file function."""
-    # Removed unused args: project_totals, mock_languages, mock_currencies, mock_orgs, total_value
     total_bounties = 3
-    bounties_dir = "temp_bounties"
+    bounties_dir = tmp_path / "temp_bounties"
 
     generate_main_file(
         mock_bounty_data,
         mock_conversion_rates,
         total_bounties,
-        bounties_dir
+        str(bounties_dir)
     )
 
-    # Check if ensure_directory was called (implicitly by grouping functions now)
-    # mock_ensure_dir.assert_called() # Removed: This assertion is no longer valid for generate_main_file
-
-    # Check if open was called correctly
-    expected_file_path = os.path.join(bounties_dir, 'all.md')
-    mock_file_open.assert_called_once_with(expected_file_path, 'w', encoding='utf-8')
+    # Check that only the main page was written, with no temporary files left behind
+    assert [p.name for p in bounties_dir.iterdir()] == ["all.md"]
 
     # Check if some expected content is in the written data
-    handle = mock_file_open()
-    written_content = handle.write.call_args[0][0]
+    written_content = (bounties_dir / "all.md").read_text(encoding="utf-8")
     assert "# All Open Bounties" in written_content
     assert "Test Bounty 1" in written_content
     assert "Test Bounty 2" in written_content
@@ -203,6 +221,45 @@ def test_generate_main_file(mock_ts, mock_ensure_dir, mock_file_open, mock_bount
     assert "![All Bounties]" in written_content # Check navigation badge alt text
     assert "<!-- Generated on: 2025-03-26 14:00:00 -->" in written_content # Check timestamp format in comment
 
+
+@patch("src.generators.main.get_current_timestamp", return_value="2025-03-26 14:00:00")
+@patch("src.utils.common.get_current_timestamp", return_value="2025-03-26 14:00:00")
+def test_language_files_skip_unchanged_and_remove_stale_pages(mock_ts, mock_main_ts, tmp_path, mock_bounty_data, mock_conversion_rates):
+    language_dir = tmp_path / "by_language"
+    language_dir.mkdir()
+    (language_dir / "haskell.md").write_text("stale", encoding="utf-8")
+
+    generate_language_files(mock_bounty_data, mock_conversion_rates, 3, str(tmp_path))
+
+    assert sorted(p.name for p in language_dir.iterdir()) == ["python.md", "rust.md"]
+    python_page = language_dir / "python.md"
+    os.utime(python_page, ns=(0, 0))
+
+    generate_language_files(mock_bounty_data, mock_conversion_rates, 3, str(tmp_path))
+    assert python_page.stat().st_mtime_ns == 0  # byte-identical page was not rewritten
+
+    generate_language_files(mock_bounty_data[1:], mock_conversion_rates, 2, str(tmp_path))
+    assert python_page.stat().st_mtime_ns != 0
+    assert "Test Bounty 1" not in python_page.read_text(encoding="utf-8")
+
+
+@patch("src.generators.main.get_current_timestamp", return_value="2025-03-26 14:00:00")
+@patch("src.utils.common.get_current_timestamp", return_value="2025-03-26 14:00:00")
+def test_price_table_shows_rate_provenance(mock_ts, mock_main_ts, tmp_path, mock_bounty_data, mock_conversion_rates):
+    provenance = {
+        "SigUSD": {"source": "live", "age": 0.0},
+        "gGOLD": {"source": "cached", "age": 3 * 3600 + 120},
+    }
+
+    generate_price_table(mock_bounty_data, mock_conversion_rates, 3, str(tmp_path), rate_provenance=provenance)
+
+    content = (tmp_path / "currency_prices.md").read_text(encoding="utf-8")
+    assert "| Currency | ERG Equivalent | Source | Notes |" in content
+    assert "| live |" in content
+    assert "| cached (3h old) |" in content
+    assert "| default |" in content
+
+
 def test_bounty_table_escapes_dynamic_markdown(mock_conversion_rates):
     """Issue titles are untrusted and must not break markdown tables."""
     bounties = [{
@@ -292,3 +349,131 @@ def test_update_readme_badges_updates_encoded_plus_counts(tmp_path, monkeypatch)
     assert "Open%20Bounties-108%2B-4CAF50" in content
     assert "Total%20Value-111,126.69%20ERG-2196F3" in content
     assert "High%20Value-38%2B%20Over%201000%20ERG-FFC107" in content
+
+
+def _render_all_pages(bounty_data, conversion_rates, workdir, monkeypatch, valuation=None, index=None):
+    workdir.mkdir()
+    monkeypatch.chdir(workdir)
+    bounties_dir = Path("data")
+    total_bounties = len(bounty_data)
+    total_value = 150.0
+    kwargs = {} if valuation is None else {"valuation": valuation, "index": index}
+    generate_language_files(bounty_data, conversion_rates, total_bounties, bounties_dir, **kwargs)
+    generate_organization_files(bounty_data, conversion_rates, total_bounties, bounties_dir, **kwargs)
+    generate_currency_files(bounty_data, conversion_rates, total_bounties, bounties_dir, **kwargs)
+    generate_main_file(bounty_data, conversion_rates, total_bounties, bounties_dir, **kwargs)
+    generate_summary_file(bounty_data, {}, conversion_rates, total_bounties, total_value, bounties_dir, **kwargs)
+    generate_featured_bounties_file(
+        bounty_data, conversion_rates, total_bounties, total_value, bounties_dir, **kwargs
+    )
+    generate_high_value_bounties_file(
+        bounty_data, conversion_rates, total_bounties, bounties_dir, high_value_threshold=60, **kwargs
+    )
+    generate_bounty_discovery_files(bounty_data, conversion_rates, total_bounties, bounties_dir, **kwargs)
+    return {
+        str(path.relative_to(bounties_dir)): path.read_text(encoding="utf-8")
+        for path in sorted(bounties_dir.rglob("*.md"))
+    }
+
+
+@patch("src.generators.main.get_current_timestamp", return_value="2025-03-26 14:00:00")
+@patch("src.utils.common.get_current_timestamp", return_value="2025-03-26 14:00:00")
+def test_shared_valuation_and_index_render_identical_pages(mock_ts, mock_main_ts, tmp_path, monkeypatch, mock_bounty_data):
+    """Pages rendered with a shared ErgValuation and BountyIndex match pages that recompute per call."""
+    conversion_rates = {"SigUSD": 2.0, "RSN": 40.0, "gGOLD": 50.0}
+    bounty_data = mock_bounty_data + [
+        {
+            "owner": "Org1", "repo": "repo4", "title": "Rosen bounty", "url": "https://github.com/Org1/repo4/issues/4",
+            "amount": "1000", "currency": "RSN", "primary_lang": "Scala", "secondary_lang": "None",
+            "labels": ["bounty"], "issue_number": 4, "creator": "user4", "status": "open",
+            "created_at": "2025-01-01T00:00:00Z", "updated_at": "2025-02-01T00:00:00Z", "comments": 2,
+        },
+        {
+            "owner": "org3", "repo": "repo5", "title": "Gold bounty", "url": "https://github.com/org3/repo5/issues/5",
+            "amount": "2", "currency": "g GOLD", "primary_lang": "Rust", "secondary_lang": "None",
+            "labels": ["bounty"], "issue_number": 5, "creator": "user5", "status": "In Progress",
+        },
+        {
+            "owner": "org3", "repo": "repo6", "title": "Unknown token", "url": "https://github.com/org3/repo6/issues/6",
+            "amount": "5", "currency": "XYZ", "primary_lang": "Python", "secondary_lang": "None",
+            "labels": ["bounty"], "issue_number": 6, "creator": "user6", "status": "open",
+        },
+    ]
+
+    expected = _render_all_pages(bounty_data, conversion_rates, tmp_path / "per_call", monkeypatch)
+    valuation = ErgValuation(bounty_data, conversion_rates)
+    index = BountyIndex(bounty_data)
+    shared = _render_all_pages(
+        bounty_data, conversion_rates, tmp_path / "shared", monkeypatch, valuation=valuation, index=index
+    )
+
+    assert shared.keys() == expected.keys()
+    assert "all.md" in shared and "high-value-bounties.md" in shared
+    for name, content in expected.items():
+        assert shared[name] == content, name
+
+    # Bounty records render exactly like the dictionaries they replace
+    records = [Bounty.from_dict(bounty) for bounty in bounty_data]
+    from_records = _render_all_pages(
+        records, conversion_rates, tmp_path / "records", monkeypatch,
+        valuation=ErgValuation(records, conversion_rates), index=BountyIndex(records)
+    )
+    assert from_records == expected
+    assert [record.erg_value for record in records] == valuation.values
+
+
+def test_erg_valuation_matches_currency_client(mock_bounty_data):
+    conversion_rates = {"SigUSD": 2.0, "gGOLD": 50.0}
+    client = CurrencyClient()
+    client.rates = conversion_rates
+    valuation = ErgValuation(mock_bounty_data, conversion_rates)
+
+    for bounty in mock_bounty_data:
+        assert valuation.value(bounty) == client.calculate_erg_value(bounty["amount"], bounty["currency"])
+    # Bounties outside the original list are converted on demand
+    assert valuation.value({"amount": "3", "currency": "g GOLD"}) == 150.0
+
+    with patch.object(CurrencyClient, "calculate_erg_value", return_value=1.0) as convert:
+        ErgValuation(mock_bounty_data * 4, conversion_rates)
+    assert convert.call_count == len(mock_bounty_data)
+
+
+def test_timestamp_only_changes_keep_existing_page(tmp_path, monkeypatch, mock_bounty_data, mock_conversion_rates):
+    monkeypatch.delenv("FORCE_REFRESH", raising=False)
+    all_page = tmp_path / "all.md"
+
+    with patch("src.utils.common.get_current_timestamp", return_value="2025-03-26 14:00:00"):
+        generate_main_file(mock_bounty_data, mock_conversion_rates, 3, str(tmp_path))
+    first = all_page.read_text(encoding="utf-8")
+
+    with patch("src.utils.common.get_current_timestamp", return_value="2025-03-27 09:30:00"):
+        generate_main_file(mock_bounty_data, mock_conversion_rates, 3, str(tmp_path))
+        assert all_page.read_text(encoding="utf-8") == first
+
+        monkeypatch.setitem(CONSTANTS, "output", {"skip_timestamp_only_changes": False})
+        generate_main_file(mock_bounty_data, mock_conversion_rates, 3, str(tmp_path))
+        assert "<!-- Generated on: 2025-03-27 09:30:00 -->" in all_page.read_text(encoding="utf-8")
+
+
+@patch("src.generators.main.get_current_timestamp")
+@patch("src.utils.common.get_current_timestamp")
+def test_force_refresh_rewrites_timestamp_only_changes(mock_ts, mock_main_ts, tmp_path, monkeypatch, mock_bounty_data, mock_conversion_rates):
+    language_page = tmp_path / "by_language" / "rust.md"
+    mock_ts.return_value = mock_main_ts.return_value = "2025-03-26 14:00:00"
+    generate_language_files(mock_bounty_data, mock_conversion_rates, 3, str(tmp_path))
+
+    mock_ts.return_value = mock_main_ts.return_value = "2025-03-27 09:30:00"
+    generate_language_files(mock_bounty_data, mock_conversion_rates, 3, str(tmp_path))
+    assert "*Report generated: 2025-03-26 14:00:00 UTC*" in language_page.read_text(encoding="utf-8")
+
+    # Pages of languages that no longer have bounties are removed
+    generate_language_files(mock_bounty_data[:1], mock_conversion_rates, 1, str(tmp_path))
+    assert not language_page.exists()
+
+    monkeypatch.setenv("FORCE_REFRESH", "true")
+    generate_language_files(mock_bounty_data, mock_conversion_rates, 3, str(tmp_path))
+    mock_ts.return_value = mock_main_ts.return_value = "2025-03-28 08:00:00"
+    generate_language_files(mock_bounty_data, mock_conversion_rates, 3, str(tmp_path))
+    content = language_page.read_text(encoding="utf-8")
+    assert "*Report generated: 2025-03-28 08:00:00 UTC*" in content
+    assert "<!-- Generated on: 2025-03-28 08:00:00 -->" in content
@@ -0,0 +1,52 @@
+import subprocess
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+
+from src.generators.payment_status_generator import generate_markdown_table
+from src.utils.rate_history import RateHistory, format_erg_value_at
+
+ROOT = Path(__file__).resolve().parents[3]
+
+
+def test_paid_table_values_submissions_at_their_payment_date_rates(tmp_path):
+    history = RateHistory(tmp_path / "rate_history.csv")
+    history.append({"SigUSD": 2.0}, now=datetime(2025, 4, 20, tzinfo=timezone.utc).timestamp())
+    history.append({"SigUSD": 4.0}, now=datetime(2025, 5, 20, tzinfo=timezone.utc).timestamp())
+    submissions = [
+        {"contributor": "alice", "work_title": "A", "bounty_value": 100, "payment_currency": "SigUSD", "payment_date": "2025-04-25"},
+        {"contributor": "bob", "work_title": "B", "bounty_value": 30, "payment_currency": "ERG", "payment_date": "2025-01-01"},
+        {"contributor": "carol", "work_title": "C", "bounty_value": 10, "payment_currency": "SigUSD", "payment_date": "2025-01-01"},
+    ]
+
+    table = generate_markdown_table(submissions, rate_history=history)
+    rows = {line.split(" | ")[0].lstrip("| "): line for line in table.splitlines()[2:]}
+
+    assert "| Value | ERG at Payment |" in table.splitlines()[0]
+    assert "| 50.00 ERG |" in rows["alice"]
+    assert "| 30.00 ERG |" in rows["bob"]
+    assert "| N/A |" in rows["carol"]  # no rate recorded yet on that date
+
+
+def test_table_without_rate_history_is_unchanged():
+    table = generate_markdown_table([{"contributor": "alice", "bounty_value": 1, "payment_currency": "ERG"}])
+
+    assert "ERG at Payment" not in table
+
+
+def test_erg_value_at_is_not_available_without_a_usable_date_or_value(tmp_path):
+    history = RateHistory(tmp_path / "rate_history.csv")
+    history.append({"SigUSD": 2.0}, now=datetime(2025, 4, 20, tzinfo=timezone.utc).timestamp())
+
+    assert format_erg_value_at(100, "SigUSD", "2025-04-25", history) == "50.00 ERG"
+    assert format_erg_value_at(100, "SigUSD", "N/A", history) == "N/A"
+    assert format_erg_value_at("Unknown", "SigUSD", "2025-04-25", history) == "N/A"
+
+
+def test_generator_needs_only_the_standard_library():
+    # The payment status workflows run the generator without installing requirements.txt
+    code = (
+        "import runpy, sys; sys.modules.update(requests=None, dotenv=None); "
+        "runpy.run_path('src/generators/payment_status_generator.py')"
+    )
+    subprocess.run([sys.executable, "-c", code], cwd=ROOT, check=True)
@@ -0,0 +1,78 @@
+import json
+import subprocess
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+
+from src.utils.rate_history import RateHistory, configured_history_path, convert_to_erg
+
+ROOT = Path(__file__).resolve().parents[3]
+
+
+def _epoch(text):
+    return datetime.fromisoformat(text).replace(tzinfo=timezone.utc).timestamp()
+
+
+def test_appended_rates_survive_reload_and_support_range_queries(tmp_path):
+    path = tmp_path / "rate_history.csv"
+    history = RateHistory(path)
+    history.append({"SigUSD": 2.0, "RSN": 8.0}, now=_epoch("2025-04-24T10:00:00"))
+    history.append({"SigUSD": 2.5}, now=_epoch("2025-04-25T10:00:00"))
+    history.append({"SigUSD": 3.0}, now=_epoch("2025-04-26T10:00:00"))
+
+    reloaded = RateHistory(path)
+
+    assert path.read_text(encoding="utf-8").splitlines()[:2] == [
+        "fetched_at,currency,rate",
+        "2025-04-24T10:00:00Z,RSN,8.0",
+    ]
+    assert reloaded.currencies() == ["RSN", "SigUSD"]
+    assert [rate for _, rate in reloaded.series("SigUSD", start="2025-04-25")] == [2.5, 3.0]
+    assert [rate for _, rate in reloaded.series("SigUSD", end="2025-04-25")] == [2.0, 2.5]
+    assert reloaded.series("GORT") == []
+
+
+def test_rates_at_uses_latest_rate_fetched_by_the_end_of_the_day(tmp_path):
+    history = RateHistory(tmp_path / "rate_history.csv")
+    history.append({"SigUSD": 2.0, "RSN": 8.0}, now=_epoch("2025-04-24T10:00:00"))
+    history.append({"SigUSD": 2.5}, now=_epoch("2025-04-25T23:00:00"))
+
+    assert history.rates_at("2025-04-23") == {}
+    assert history.rates_at("2025-04-24") == {"SigUSD": 2.0, "RSN": 8.0}
+    assert history.rates_at("2025-04-25") == {"SigUSD": 2.5, "RSN": 8.0}
+    assert history.rates_at("2025-04-25T12:00:00Z") == {"SigUSD": 2.0, "RSN": 8.0}
+
+
+def test_malformed_rows_are_skipped(tmp_path):
+    path = tmp_path / "rate_history.csv"
+    path.write_text(
+        "fetched_at,currency,rate\n"
+        "2025-04-24T10:00:00Z,SigUSD,2.0\n"
+        "not-a-date,SigUSD,3.0\n"
+        "2025-04-25T10:00:00Z,SigUSD,oops\n",
+        encoding="utf-8",
+    )
+
+    assert RateHistory(path).series("SigUSD") == [(_epoch("2025-04-24T10:00:00"), 2.0)]
+
+
+def test_history_path_comes_from_the_scan_settings(tmp_path):
+    constants = tmp_path / "constants.json"
+
+    constants.write_text(json.dumps({"scan": {"rate_history_path": "out/rates.csv"}}))
+    assert configured_history_path(constants) == Path("out/rates.csv")
+
+    constants.write_text(json.dumps({"scan": {"rate_history_path": ""}}))
+    assert configured_history_path(constants) is None
+
+    assert configured_history_path(tmp_path / "missing.json") == Path("data/rate_history.csv")
+
+
+def test_conversion_needs_only_the_standard_library():
+    # The payment status workflows run without installing requirements.txt
+    code = "import sys; sys.modules.update(requests=None, dotenv=None); import src.utils.rate_history"
+    subprocess.run([sys.executable, "-c", code], cwd=ROOT, check=True)
+
+    assert convert_to_erg("10", "SigUSD", {"SigUSD": 2.0}) == 5.0
+    assert convert_to_erg("3", "g GOLD", {"gGOLD": 10.0}) == 30.0
+    assert convert_to_erg("10", "UNKNOWN", {}) == 0.0
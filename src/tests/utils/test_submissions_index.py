@@ -0,0 +1,65 @@
+import json
+import os
+from pathlib import Path
+
+from src.utils.submissions_index import SubmissionsIndex, configured_index_path
+
+
+def _write(path, data, mtime_ns):
+    path.write_text(json.dumps(data), encoding="utf-8")
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_index_only_reparses_changed_files(tmp_path):
+    directory = tmp_path / "submissions"
+    directory.mkdir()
+    index_path = tmp_path / ".cache" / "submissions_index.json"
+    _write(directory / "a.json", {"bounty_id": "o/r#1", "status": "paid"}, 1_700_000_000_000_000_000)
+    _write(directory / "b.json", {"bounty_id": "o/r#2", "status": "in-progress"}, 1_700_000_000_000_000_000)
+
+    first = SubmissionsIndex(directory, index_path)
+    assert [s["bounty_id"] for s in first.submissions()] == ["o/r#1", "o/r#2"]
+    first.save()
+    assert first.stats() == {"parsed": 2, "reused": 0}
+
+    _write(directory / "b.json", {"bounty_id": "o/r#2", "status": "reviewed"}, 1_700_000_100_000_000_000)
+    second = SubmissionsIndex(directory, index_path)
+    submissions = second.submissions()
+
+    assert second.stats() == {"parsed": 1, "reused": 1}
+    assert submissions[1]["status"] == "reviewed"
+    assert submissions[1]["_filename"] == "b.json"
+    assert submissions[1]["_mtime"] == 1_700_000_100.0
+
+
+def test_index_forgets_deleted_files_and_skips_non_objects(tmp_path):
+    directory = tmp_path / "submissions"
+    directory.mkdir()
+    index_path = tmp_path / "submissions_index.json"
+    _write(directory / "a.json", {"bounty_id": "o/r#1"}, 1_700_000_000_000_000_000)
+    _write(directory / "list.json", [1, 2], 1_700_000_000_000_000_000)
+    (directory / "broken.json").write_text("{", encoding="utf-8")
+
+    index = SubmissionsIndex(directory, index_path)
+    assert [s["_filename"] for s in index.submissions()] == ["a.json"]
+    index.save()
+
+    (directory / "a.json").unlink()
+    index = SubmissionsIndex(directory, index_path)
+    assert index.submissions() == []
+    assert index.stats() == {"parsed": 0, "reused": 2}
+    index.save()
+
+    assert sorted(json.loads(index_path.read_text())["files"]) == ["broken.json", "list.json"]
+
+
+def test_index_path_comes_from_the_scan_settings(tmp_path):
+    constants = tmp_path / "constants.json"
+
+    constants.write_text(json.dumps({"scan": {"submissions_index_path": "out/index.json"}}))
+    assert configured_index_path(constants) == Path("out/index.json")
+
+    constants.write_text(json.dumps({"scan": {"submissions_index_path": ""}}))
+    assert configured_index_path(constants) is None
+
+    assert configured_index_path(tmp_path / "missing.json") == Path(".cache/submissions_index.json")
@@ -9,6 +9,9 @@ This package contains utility functions used throughout the application:
 
 from .common import (
     ensure_directory,
+    write_text_if_changed,
+    load_json_file,
+    save_json_file,
     create_claim_url,
     get_current_timestamp,
     format_navigation_badges,
@@ -15,6 +15,7 @@ common tasks across the application.
 import os
 import json
 import logging
+import tempfile
 import urllib.parse
 from datetime import datetime, timezone
 from pathlib import Path
@@ -89,6 +90,120 @@ def ensure_directory(directory: Union[str, Path]) -> None:
         logger.error(f"Error creating directory {directory}: {e}")
         raise
 
+def write_text_if_changed(path: Union[str, Path], content: str) -> bool:
+    """
+    Write a text file atomically, skipping the write when the content is unchanged.
+
+    The content goes to a temporary file in the same directory that is then renamed
+    over the target, so an interrupted run never leaves a half-written file.
+
+    Args:
+        path: File to write
+        content: New file content
+
+    Returns:
+        True if the file was written, False if it already had exactly this content
+    """
+    path = Path(path)
+    data = content.encode('utf-8')
+    try:
+        if path.read_bytes() == data:
+            logger.debug(f"Unchanged, not rewriting: {path}")
+            return False
+        mode = path.stat().st_mode & 0o777
+    except FileNotFoundError:
+        mode = 0o644
+
+    ensure_directory(path.parent)
+    fd, tmp_path = tempfile.mkstemp(dir=str(path.parent), prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+    return True
+
+def load_json_file(
+    path: Union[str, Path], description: str, version: Optional[int] = None
+) -> Optional[Dict[str, Any]]:
+    """
+    Load a JSON object persisted by a previous run (caches and stores).
+
+    Args:
+        path: JSON file to load
+        description: What the file holds (for log messages), e.g. "rate cache"
+        version: Required value of the file's "version" key (None skips the check)
+
+    Returns:
+        The JSON object, or None if the file is missing, unreadable, not an object
+        or written in another version
+    """
+    path = Path(path)
+    if not path.exists():
+        return None
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, UnicodeDecodeError, json.JSONDecodeError) as e:
+        logger.warning(f"Ignoring unreadable {description} {path}: {e}")
+        return None
+
+    if not isinstance(data, dict) or (version is not None and data.get("version") != version):
+        logger.warning(f"Ignoring {description} {path} with unsupported format")
+        return None
+    return data
+
+def save_json_file(
+    path: Union[str, Path], payload: Dict[str, Any], description: str, indent: Optional[int] = None
+) -> bool:
+    """
+    Persist a JSON object atomically with write_text_if_changed.
+
+    Args:
+        path: JSON file to write
+        payload: JSON object to persist
+        description: What the file holds (for log messages), e.g. "rate cache"
+        indent: Indentation for human-readable files (None writes compact JSON)
+
+    Returns:
+        True if the file holds the payload afterwards, False if it could not be written
+    """
+    separators = None if indent is not None else (",", ":")
+    try:
+        write_text_if_changed(path, json.dumps(payload, indent=indent, separators=separators))
+    except OSError as e:
+        logger.error(f"Error saving {description} to {path}: {e}")
+        return False
+    return True
+
+def configured_scan_path(
+    key: str, default: str, constants_path: Union[str, Path] = CONSTANTS_PATH
+) -> Optional[Path]:
+    """
+    Get a file path configured in the ``scan`` section of constants.json.
+
+    For standalone scripts that cannot load BountyConfig (which needs python-dotenv).
+
+    Args:
+        key: Setting name, e.g. "rate_history_path"
+        default: Path used when the setting or constants.json is missing
+        constants_path: constants.json to read
+
+    Returns:
+        The configured path, or None when the setting is an empty string (disabled)
+    """
+    constants = load_json_file(constants_path, "constants")
+    if constants is None:
+        logger.warning(f"Using the default {key}, could not read {constants_path}")
+        return Path(default)
+    scan = constants.get("scan")
+    path = scan.get(key, default) if isinstance(scan, dict) else default
+    return Path(path) if path else None
+
 def create_claim_url(
     owner: str,
     repo_name: str,
@@ -13,7 +13,7 @@ These utilities ensure consistent formatting across all generated markdown files
 
 import re
 import logging
-from typing import Dict, List, Any, Optional
+from typing import TYPE_CHECKING, Dict, List, Any, Optional
 from datetime import datetime, timezone
 from urllib.parse import urlparse
 
@@ -32,6 +32,9 @@ from .common import (
     escape_markdown_link_text,
 )
 
+if TYPE_CHECKING:
+    from ..api.currency_client import ErgValuation
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
@@ -134,6 +137,7 @@ def generate_standard_bounty_table(
     show_language: bool = True,
     sort_by: str = "value",
     link_prefix: str = "",
+    valuation: Optional["ErgValuation"] = None,
 ) -> str:
     """
     Generate a standard bounty table for markdown files with configurable columns.
@@ -143,11 +147,13 @@ def generate_standard_bounty_table(
         conversion_rates: Dictionary of conversion rates
         show_org: Whether to include the Organisation column.
         show_language: Whether to include the Primary Language column.
+        valuation: Optional precomputed ERG values shared across generators.
 
     Returns:
         Formatted bounty table as markdown
     """
-    from ..api.currency_client import CurrencyClient
+    from ..api.currency_client import ErgValuation
+    from ..core.bounty import age_in_days, created_time, updated_in_days, updated_time
 
     # Dynamically build header and separator
     header_parts = []
@@ -166,33 +172,27 @@ def generate_standard_bounty_table(
     content = "|" + "|".join(header_parts) + "|\n"
     content += "|" + "|".join(separator_parts) + "|\n"
 
-    # Set up currency client for conversions
-    currency_client = CurrencyClient()
-    currency_client.rates = conversion_rates
-
-    def parse_github_date(value: str):
-        if not value:
-            return None
-        try:
-            return datetime.fromisoformat(value.replace("Z", "+00:00"))
-        except ValueError:
-            return None
-
-    def format_age(value: str) -> str:
-        parsed = parse_github_date(value)
-        if not parsed:
+    # Convert each bounty once for sorting and display
+    if valuation is None:
+        valuation = ErgValuation(bounties, conversion_rates)
+
+    # Bounty records carry parsed timestamps and day counts; dictionaries are
+    # measured against one reference time for the whole table
+    now = datetime.now(timezone.utc)
+
+    def format_age(days: Optional[int]) -> str:
+        if days is None:
             return "-"
-        days = max((datetime.now(timezone.utc) - parsed).days, 0)
         return "today" if days == 0 else f"{days}d"
 
     def sort_key(bounty: Dict[str, Any]):
         if sort_by == "new":
-            return parse_github_date(bounty.get("created_at", "")) or datetime.min.replace(tzinfo=timezone.utc)
+            return created_time(bounty) or datetime.min.replace(tzinfo=timezone.utc)
         if sort_by == "updated":
-            return parse_github_date(bounty.get("updated_at", "")) or datetime.min.replace(tzinfo=timezone.utc)
+            return updated_time(bounty) or datetime.min.replace(tzinfo=timezone.utc)
         if sort_by == "old":
-            return parse_github_date(bounty.get("created_at", "")) or datetime.max.replace(tzinfo=timezone.utc)
-        return currency_client.calculate_erg_value(bounty["amount"], bounty["currency"])
+            return created_time(bounty) or datetime.max.replace(tzinfo=timezone.utc)
+        return valuation.value(bounty)
 
     sorted_bounties = sorted(bounties, key=sort_key, reverse=(sort_by != "old"))
 
@@ -208,7 +208,7 @@ def generate_standard_bounty_table(
         issue_number = bounty["issue_number"]
         creator = bounty["creator"] # Keep creator for claim URL
 
-        erg_value = currency_client.calculate_erg_value(amount, currency)
+        erg_value = valuation.value(bounty)
         if amount in {"Not specified", "Ongoing"} or erg_value <= 0.0:
             value_display = str(amount)
         elif currency == "ERG":
@@ -246,8 +246,8 @@ def generate_standard_bounty_table(
             # Green reserve badge/button
             reserve_button = f"[![Reserve](https://img.shields.io/badge/-Reserve-brightgreen?style=flat-square)]({claim_url})"
 
-        age_display = format_age(bounty.get("created_at", ""))
-        updated_display = format_age(bounty.get("updated_at", ""))
+        age_display = format_age(age_in_days(bounty, now))
+        updated_display = format_age(updated_in_days(bounty, now))
         comments = bounty.get("comments", 0)
 
         # Build row dynamically
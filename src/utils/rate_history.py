@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+"""
+Rate History Module
+
+This module keeps an append-only time series of every conversion rate fetched live,
+as a CSV file with one ``fetched_at,currency,rate`` row per rate:
+
+    fetched_at,currency,rate
+    2025-04-25T00:03:12Z,SigUSD,0.819389
+
+The series is loaded into per-currency sorted lists, so range queries and
+"rate at a given date" lookups are binary searches. Paid bounties are valued at
+the rate of their payment date without asking the external APIs again.
+
+The module only uses the standard library, so the payment status generator can
+value paid bounties without installing the API client dependencies.
+"""
+
+import bisect
+import csv
+import logging
+import threading
+import time
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+from .common import CONSTANTS_PATH, configured_scan_path
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+DEFAULT_RATE_HISTORY_PATH = "data/rate_history.csv"
+
+FIELDNAMES = ("fetched_at", "currency", "rate")
+TIMESTAMP_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+
+When = Union[str, date, datetime, float, int]
+
+# Conversion logic per currency: rate key and operation (divide or multiply).
+# Other currencies with a rate (configured Spectrum tokens) are divided by it.
+CONVERSION_MAP = {
+    "SigUSD": ("SigUSD", "divide"),
+    "GORT": ("GORT", "divide"),
+    "RSN": ("RSN", "divide"),
+    "BENE": ("BENE", "divide"),
+    "g GOLD": ("gGOLD", "multiply"),
+    "gGOLD": ("gGOLD", "multiply"),
+}
+
+
+def _to_epoch(when: When, end_of_day: bool = False) -> float:
+    """
+    Convert a point in time to epoch seconds.
+
+    Args:
+        when: Epoch seconds, a datetime (naive values are UTC), a date, or an ISO
+            date ("2025-04-25") or date-time ("2025-04-25T10:00:00Z") string
+        end_of_day: Resolve dates to the end of the day instead of its start
+
+    Returns:
+        Epoch seconds
+    """
+    if isinstance(when, (int, float)):
+        return float(when)
+    if isinstance(when, str):
+        text = when.strip()
+        when = date.fromisoformat(text) if len(text) == 10 else datetime.fromisoformat(text.replace("Z", "+00:00"))
+    if not isinstance(when, datetime):
+        start = datetime(when.year, when.month, when.day, tzinfo=timezone.utc)
+        return (start + timedelta(days=1)).timestamp() - 1 if end_of_day else start.timestamp()
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return when.timestamp()
+
+
+def configured_history_path(constants_path: Union[str, Path] = CONSTANTS_PATH) -> Optional[Path]:
+    """
+    Get the rate history file configured as ``scan.rate_history_path`` in constants.json.
+
+    Args:
+        constants_path: constants.json to read
+
+    Returns:
+        The configured path (the default when constants.json cannot be read), or
+        None when the rate history is disabled with an empty path
+    """
+    return configured_scan_path("rate_history_path", DEFAULT_RATE_HISTORY_PATH, constants_path)
+
+
+class RateHistory:
+    """
+    Append-only CSV time series of fetched conversion rates.
+    Safe to share between threads.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        """
+        Initialize the history and load the rates recorded by previous runs.
+
+        Args:
+            path: CSV file holding the time series
+        """
+        self.path = Path(path)
+        self._times: Dict[str, List[float]] = {}
+        self._rates: Dict[str, List[float]] = {}
+        self._lock = threading.Lock()
+        self._load()
+
+    def _insert(self, currency: str, fetched_at: float, rate: float) -> None:
+        times = self._times.setdefault(currency, [])
+        rates = self._rates.setdefault(currency, [])
+        # Rows are appended in time order, so this is an append in practice
+        index = bisect.bisect_right(times, fetched_at)
+        times.insert(index, fetched_at)
+        rates.insert(index, rate)
+
+    def _load(self) -> None:
+        """Load the time series, skipping malformed rows."""
+        if not self.path.exists():
+            return
+        rows = 0
+        try:
+            with open(self.path, 'r', encoding='utf-8', newline='') as f:
+                for row in csv.DictReader(f):
+                    try:
+                        fetched_at = _to_epoch(row["fetched_at"])
+                        rate = float(row["rate"])
+                    except (KeyError, TypeError, ValueError):
+                        continue
+                    self._insert(row["currency"], fetched_at, rate)
+                    rows += 1
+        except OSError as e:
+            logger.warning(f"Ignoring unreadable rate history {self.path}: {e}")
+            return
+        logger.info(f"Loaded {rows} historical rates from {self.path}")
+
+    def append(self, rates: Dict[str, float], now: Optional[float] = None) -> None:
+        """
+        Record a set of freshly fetched rates.
+
+        Args:
+            rates: Live rates by currency
+            now: Epoch time the rates were fetched
+        """
+        if not rates:
+            return
+        fetched_at = int(now or time.time())
+        stamp = datetime.fromtimestamp(fetched_at, timezone.utc).strftime(TIMESTAMP_FORMAT)
+        with self._lock:
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                write_header = not self.path.exists() or self.path.stat().st_size == 0
+                with open(self.path, 'a', encoding='utf-8', newline='') as f:
+                    writer = csv.writer(f)
+                    if write_header:
+                        writer.writerow(FIELDNAMES)
+                    for currency, rate in sorted(rates.items()):
+                        writer.writerow((stamp, currency, repr(float(rate))))
+            except OSError as e:
+                logger.error(f"Error appending to rate history {self.path}: {e}")
+                return
+            for currency, rate in rates.items():
+                self._insert(currency, float(fetched_at), float(rate))
+
+    def currencies(self) -> List[str]:
+        """Get the currencies with recorded rates."""
+        with self._lock:
+            return sorted(self._times)
+
+    def series(
+        self, currency: str, start: Optional[When] = None, end: Optional[When] = None
+    ) -> List[Tuple[float, float]]:
+        """
+        Get the recorded rates of a currency within a time range.
+
+        Args:
+            currency: Currency code
+            start: Earliest fetch time (inclusive; a date means its start)
+            end: Latest fetch time (inclusive; a date means its end)
+
+        Returns:
+            List of (epoch time, rate) in time order
+        """
+        with self._lock:
+            times = self._times.get(currency, [])
+            low = 0 if start is None else bisect.bisect_left(times, _to_epoch(start))
+            high = len(times) if end is None else bisect.bisect_right(times, _to_epoch(end, end_of_day=True))
+            return list(zip(times[low:high], self._rates[currency][low:high], strict=True)) if times else []
+
+    def rates_at(self, when: When) -> Dict[str, float]:
+        """
+        Get the rates in effect at a point in time.
+
+        Args:
+            when: Point in time (a date means its end, so a rate fetched on the day counts)
+
+        Returns:
+            Dictionary mapping currencies to their latest rate fetched at or before
+            the given time; currencies first recorded later are missing
+        """
+        moment = _to_epoch(when, end_of_day=True)
+        with self._lock:
+            rates = {}
+            for currency, times in self._times.items():
+                index = bisect.bisect_right(times, moment)
+                if index:
+                    rates[currency] = self._rates[currency][index - 1]
+            return rates
+
+
+def convert_to_erg(amount: str, currency: str, rates: Dict[str, float]) -> float:
+    """
+    Convert an amount in a specific currency to ERG.
+
+    Args:
+        amount: Amount to convert as a string
+        currency: Currency code
+        rates: Dictionary of conversion rates
+
+    Returns:
+        ERG equivalent amount as a float, or 0 if conversion not possible
+    """
+    try:
+        amount_float = float(amount)
+        if currency == "ERG":
+            return amount_float
+
+        if currency in CONVERSION_MAP or currency in rates:
+            rate_key, operation = CONVERSION_MAP.get(currency, (currency, "divide"))
+            if rate_key in rates:
+                rate = rates[rate_key]
+                if operation == "divide":
+                    return amount_float / rate if rate != 0 else 0.0
+                elif operation == "multiply":
+                    return amount_float * rate
+            else:
+                logger.warning(f"Missing conversion rate for {rate_key} used by {currency}")
+                return 0.0
+        else:
+            logger.warning(f"Unknown currency: {currency}")
+            return 0.0
+    except (ValueError, TypeError) as e:
+        logger.error(f"Error converting {amount} {currency} to ERG: {e}")
+        return 0.0
+
+
+def format_erg_value_at(value, currency: str, when: Optional[When], rate_history: RateHistory) -> str:
+    """
+    Format the ERG value of a bounty at the conversion rates in effect at a date.
+
+    Args:
+        value: Bounty amount
+        currency: Currency code
+        when: Payment or close date
+        rate_history: Recorded conversion rates
+
+    Returns:
+        The value such as "50.00 ERG", or "N/A" for a missing or unparsable date,
+        an unknown value, or a date before any recorded rate
+    """
+    if not when:
+        return "N/A"
+    try:
+        rates = rate_history.rates_at(when)
+    except ValueError:
+        return "N/A"
+    erg_value = convert_to_erg(str(value), currency, rates)
+    return f"{erg_value:.2f} ERG" if erg_value else "N/A"
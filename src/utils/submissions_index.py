@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Submissions Index Module
+
+This module loads the bounty submission files (``submissions/*.json``) for both
+the bounty processor (reserved bounties) and the payment status generator.
+
+Parsed submissions are kept in a sidecar index file keyed by file name together
+with the file's modification time and size. A later run only parses files that
+were added or changed since, so startup does not grow with the number of
+submissions ever made.
+
+The module only uses the standard library, like the payment status generator.
+"""
+
+import json
+import logging
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+from .common import CONSTANTS_PATH, configured_scan_path, load_json_file, save_json_file
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+INDEX_VERSION = 1
+DEFAULT_SUBMISSIONS_DIR = "submissions"
+DEFAULT_INDEX_PATH = ".cache/submissions_index.json"
+
+
+def configured_index_path(constants_path: Union[str, Path] = CONSTANTS_PATH) -> Optional[Path]:
+    """
+    Get the index file configured as ``scan.submissions_index_path`` in constants.json.
+
+    Args:
+        constants_path: constants.json to read
+
+    Returns:
+        The configured path (the default when constants.json cannot be read), or
+        None when the index is kept in memory with an empty path
+    """
+    return configured_scan_path("submissions_index_path", DEFAULT_INDEX_PATH, constants_path)
+
+
+class SubmissionsIndex:
+    """
+    Submission files of a directory, parsed once and cached by (name, mtime, size).
+    Safe to share between threads.
+    """
+
+    def __init__(
+        self,
+        directory: Union[str, Path] = DEFAULT_SUBMISSIONS_DIR,
+        index_path: Optional[Union[str, Path]] = None,
+    ):
+        """
+        Initialize the index and load the entries persisted by a previous run.
+
+        Args:
+            directory: Directory holding the submission JSON files
+            index_path: Sidecar JSON file caching parsed submissions (None keeps the
+                cache in memory only)
+        """
+        self.directory = Path(directory)
+        self.index_path = Path(index_path) if index_path else None
+        self.parsed = 0
+        self.reused = 0
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._dirty = False
+        self._lock = threading.Lock()
+        self._load()
+
+    def _load(self) -> None:
+        """Load the sidecar index, ignoring a missing, unreadable or outdated file."""
+        if self.index_path is None:
+            return
+        data = load_json_file(self.index_path, "submissions index", INDEX_VERSION)
+        if data is not None:
+            self._entries = data.get("files", {})
+
+    def save(self) -> None:
+        """Persist the index atomically if it changed."""
+        if self.index_path is None:
+            return
+        with self._lock:
+            if self._dirty and save_json_file(
+                self.index_path, {"version": INDEX_VERSION, "files": self._entries}, "submissions index"
+            ):
+                self._dirty = False
+
+    def submissions(self) -> List[Dict[str, Any]]:
+        """
+        Get every readable submission in the directory.
+
+        Returns:
+            List of submission dictionaries (copies), each with ``_filename`` and
+            ``_mtime`` (epoch seconds of the file's last modification), sorted by
+            file name. Files that are not valid JSON objects are skipped.
+        """
+        if not self.directory.is_dir():
+            logger.warning(f"Submissions directory not found: {self.directory}")
+            return []
+
+        submissions = []
+        with self._lock:
+            seen = set()
+            for path in sorted(self.directory.glob("*.json")):
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue
+                seen.add(path.name)
+                entry = self._entries.get(path.name)
+                if entry is None or entry.get("mtime_ns") != stat.st_mtime_ns or entry.get("size") != stat.st_size:
+                    entry = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "data": self._parse(path)}
+                    self._entries[path.name] = entry
+                    self._dirty = True
+                    self.parsed += 1
+                else:
+                    self.reused += 1
+
+                if isinstance(entry["data"], dict):
+                    submission = dict(entry["data"])
+                    submission["_filename"] = path.name
+                    submission["_mtime"] = stat.st_mtime_ns / 1e9
+                    submissions.append(submission)
+
+            # Forget deleted files
+            for name in set(self._entries) - seen:
+                del self._entries[name]
+                self._dirty = True
+        return submissions
+
+    @staticmethod
+    def _parse(path: Path) -> Optional[Dict[str, Any]]:
+        """Parse a submission file, returning None when it is not a JSON object."""
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, UnicodeDecodeError, json.JSONDecodeError) as e:
+            logger.warning(f"Could not read submission {path}: {e}")
+            return None
+        return data if isinstance(data, dict) else None
+
+    def stats(self) -> Dict[str, int]:
+        """Get how many files were parsed and how many were served from the index."""
+        return {"parsed": self.parsed, "reused": self.reused}